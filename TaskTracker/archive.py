@@ -0,0 +1,541 @@
+"""
+Archive Module
+================
+
+This module contains the `ArchiveStore` class, which packs a closed year
+directory into one compressed file and reads it back without unpacking it:
+
+    TaskData/2024/<task>/<Month>.csv, ...  ->  TaskData/2024.zip
+
+- The archive is a ZIP file: every file is compressed on its own and the
+  central directory at its end indexes the members, so one month is
+  decompressed without touching the others.
+- `.archive.json` in the archive keeps the row count of every month file:
+  row counts and page totals need no decompression.
+- Month files are compacted before packing (tombstone logs applied); row
+  indexes, snapshots, locks and other hidden files are left out.
+- Paths below an archived year keep working for reading: `Executor` opens
+  the member of the archive when a file is not on disk (trackers, reports,
+  month pages, analytics, queries).
+- An archived year is read-only: writes raise `PermissionError` until the
+  year is restored. Deleting the whole year deletes its archive.
+"""
+
+import io
+import json
+import locale
+import os
+import shutil
+import zipfile
+from locking import TEMP_PREFIX
+from manager import REPORT_FILES, REPORT_LOG_SUFFIX, TOMBSTONE_SUFFIX
+from rowindex import INDEX_SUFFIX
+
+
+# Suffix of the archive of a directory (next to the directory it replaces)
+ARCHIVE_SUFFIX = ".zip"
+
+# Member holding the row counts of the month files
+ARCHIVE_INDEX = ".archive.json"
+
+# Format of the archive index
+ARCHIVE_VERSION = 1
+
+
+class ArchiveStore():
+    """
+    Packs year directories into archives and reads their files on demand."""
+
+    def __init__(self, executor):
+
+        # Compacts and counts the months while packing, locks and tracks the paths
+        self.executor = executor
+
+        # Open archives: {archive path: {"stamp": (mtime, size), "zip": ZipFile, "tree": node}}
+        self.cache = {}
+
+
+    # Archive of a directory
+    def archive_path(self, dir_path):
+        """
+        ### Returns the path of the archive replacing a directory.
+        """
+
+        return os.path.abspath(dir_path) + ARCHIVE_SUFFIX
+
+
+    # Check if a name is an archive
+    def is_archive(self, name:str):
+        """
+        ### Returns True if a file name is the archive of a directory.
+        """
+
+        return name.endswith(ARCHIVE_SUFFIX)
+
+
+    # Check if a name is packed
+    def is_packed(self, name:str):
+        """
+        ### Returns True if a file or directory name belongs in an archive.
+
+        - Hidden files (locks, snapshots, temporary files), tombstone logs,
+          row indexes and report logs are left out.
+        """
+
+        return not name.startswith(".") and not name.endswith((TOMBSTONE_SUFFIX, INDEX_SUFFIX, REPORT_LOG_SUFFIX))
+
+
+    # Find the archive holding a path
+    def locate(self, path):
+        """
+        ### Finds the archive a path belongs to.
+
+        - Only a path missing on disk can be archived: its highest missing
+          directory is the one replaced by an archive.
+
+        :param path (str): A file or directory of the tree.
+
+        Returns:
+            tuple: (archive path, member name: "" for the archived directory itself,
+            "gym/Jan.csv" for a file), or None if the path is not archived.
+        """
+
+        path = os.path.abspath(path)
+
+        if os.path.exists(path):
+            return None
+
+        top = path
+
+        # Go up to the highest missing directory
+        while True:
+
+            parent = os.path.dirname(top)
+
+            if parent == top:
+                return None
+
+            if os.path.exists(parent):
+                break
+
+            top = parent
+
+        archive_path = top + ARCHIVE_SUFFIX
+
+        if not os.path.isfile(archive_path):
+            return None
+
+        name = os.path.relpath(path, top).replace(os.sep, "/")
+
+        return archive_path, "" if name == os.curdir else name
+
+
+    # Open an archive
+    def load(self, archive_path):
+        """
+        ### Returns the cache entry of an archive, opening it again only if it changed.
+
+        Returns:
+            dict: {"stamp", "zip": open ZipFile, "tree": root node}, or None if the archive is gone.
+        """
+
+        try:
+            stat = os.stat(archive_path)
+
+        except FileNotFoundError:
+
+            self.forget(archive_path)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.cache.get(archive_path)
+
+        if cached and cached["stamp"] == stamp:
+            return cached
+
+        self.forget(archive_path)
+
+        archive = zipfile.ZipFile(archive_path)
+
+        try:
+            rows = json.loads(archive.read(ARCHIVE_INDEX)).get("rows", {})
+
+        except (KeyError, ValueError):
+            rows = {}
+
+        # Same nodes as the manifest: {"dirs": {name: node}, "files": {name: entry}}
+        tree = {"dirs": {}, "files": {}}
+
+        for info in archive.infolist():
+
+            if info.filename == ARCHIVE_INDEX:
+                continue
+
+            parts = info.filename.rstrip("/").split("/")
+            node = tree
+
+            for name in parts[:-1]:
+                node = node["dirs"].setdefault(name, {"dirs": {}, "files": {}})
+
+            if info.is_dir():
+                node["dirs"].setdefault(parts[-1], {"dirs": {}, "files": {}})
+
+            else:
+
+                entry = {"size": info.file_size, "member": info.filename}
+
+                if info.filename in rows:
+                    entry["rows"] = rows[info.filename]
+
+                node["files"][parts[-1]] = entry
+
+        cached = {"stamp": stamp, "zip": archive, "tree": tree}
+        self.cache[archive_path] = cached
+
+        return cached
+
+
+    # Close an archive
+    def forget(self, archive_path):
+        """
+        ### Closes a cached archive (changed, removed or restored).
+        """
+
+        cached = self.cache.pop(archive_path, None)
+
+        if cached:
+            cached["zip"].close()
+
+
+    # Entry of an archived path
+    def entry(self, path):
+        """
+        ### Returns the node of an archived directory or the entry of an archived file.
+
+        :param path (str): A file or directory of the tree.
+
+        Returns:
+            tuple: (cache entry of the archive, node or file entry), or None if the path is not archived.
+        """
+
+        located = self.locate(path)
+
+        if located is None:
+            return None
+
+        archive_path, name = located
+        cached = self.load(archive_path)
+
+        if cached is None:
+            return None
+
+        node = cached["tree"]
+
+        if not name:
+            return cached, node
+
+        parts = name.split("/")
+
+        for part in parts[:-1]:
+
+            node = node["dirs"].get(part)
+
+            if node is None:
+                return None
+
+        found = node["dirs"].get(parts[-1]) or node["files"].get(parts[-1])
+
+        return (cached, found) if found is not None else None
+
+
+    # Check an archived path
+    def contains(self, path):
+        """
+        ### Returns True if a path is a file or directory of an archive.
+        """
+
+        return self.entry(path) is not None
+
+
+    # Listing of an archived directory
+    def node(self, dir_path):
+        """
+        ### Returns the node of an archived directory: {"dirs": {name: node}, "files": {name: entry}}.
+
+        Returns:
+            dict: The node, or None if the directory is not archived.
+        """
+
+        found = self.entry(dir_path)
+
+        if found is None or "dirs" not in found[1]:
+            return None
+
+        return found[1]
+
+
+    # Count the archived directories of a directory
+    def count(self, names):
+        """
+        ### Returns how many of the file names of a directory are archives of directories.
+
+        :param names: File names of the directory.
+        """
+
+        return len([name for name in names if self.is_archive(name)])
+
+
+    # Row count of an archived month
+    def rows(self, file_path):
+        """
+        ### Returns the recorded row count of an archived month file.
+
+        Returns:
+            int: The rows, or None if the file is not an archived month.
+        """
+
+        found = self.entry(file_path)
+
+        if found is None:
+            return None
+
+        return found[1].get("rows")
+
+
+    # Version of an archived file
+    def stamp(self, path):
+        """
+        ### Returns the (mtime, size) of the archive holding a path, used to revalidate caches.
+
+        Returns:
+            tuple: The stamp of the archive, or None if the path is not archived.
+        """
+
+        found = self.entry(path)
+
+        return found[0]["stamp"] if found else None
+
+
+    # Read an archived file
+    def open(self, file_path):
+        """
+        ### Opens an archived file as text (newline="" for the csv module).
+
+        - Only this member is decompressed, while it is read.
+
+        Returns:
+            io.TextIOWrapper: The stream, or None if the file is not archived.
+        """
+
+        found = self.entry(file_path)
+
+        if found is None or "member" not in found[1]:
+            return None
+
+        cached, entry = found
+
+        # Decoded like the text mode writers of the tree
+        return io.TextIOWrapper(
+            cached["zip"].open(entry["member"]), encoding= locale.getpreferredencoding(False), newline= ""
+        )
+
+
+    # Refuse writes into an archive
+    def check_writable(self, path):
+        """
+        ### Raises `PermissionError` if a path belongs to an archived directory.
+
+        :param path (str): A file or directory about to be created or changed.
+        """
+
+        located = self.locate(path)
+
+        if located is not None:
+
+            year = os.path.basename(located[0])[:-len(ARCHIVE_SUFFIX)]
+
+            raise PermissionError(f"Year [ {year} ] is archived (read-only). Restore it first")
+
+
+    # Pack a directory
+    def pack(self, dir_path):
+        """
+        ### Packs a year directory into its archive and removes the directory.
+
+        - Month files are compacted first, the archive holds their live rows.
+          The report logs are folded into their reports, reports of an older
+          tree (not maintained) are rebuilt.
+        - The archive replaces the directory only if no packed file changed
+          while it was written: the year should be closed (not written anymore).
+
+        :param dir_path (str): Path of the year directory.
+
+        Returns:
+            dict: {"path": archive path, "files": number of files, "size": bytes of the files,
+            "archive_size": bytes of the archive}
+        """
+
+        dir_path = os.path.abspath(dir_path)
+        archive_path = self.archive_path(dir_path)
+
+        if os.path.exists(archive_path):
+            raise FileExistsError(f"{archive_path} already exists")
+
+        if not os.path.isdir(dir_path):
+            raise FileNotFoundError(f"{dir_path} is not a directory")
+
+        # The archived reports are read as they are (see Reporter.is_current())
+        self.executor.reports().refresh_year(dir_path)
+
+        # Members in the order of the tree: (path on disk, member name)
+        members = []
+        rows = {}
+
+        for root, dirs, files in os.walk(dir_path):
+
+            dirs[:] = sorted(name for name in dirs if self.is_packed(name))
+
+            prefix = os.path.relpath(root, dir_path).replace(os.sep, "/")
+            prefix = "" if prefix == os.curdir else prefix + "/"
+
+            # Directory entries keep the empty tasks
+            if prefix:
+                members.append((root, prefix))
+
+            for name in sorted(files):
+
+                if not self.is_packed(name):
+                    continue
+
+                path = os.path.join(root, name)
+
+                if self.executor.is_month_file(path):
+
+                    # Deleted rows are applied, the archive has no tombstone log
+                    self.executor.compact_month(path)
+                    rows[prefix + name] = self.executor.count_rows(path)
+
+                # Changes of the running totals are written into the report
+                elif name in REPORT_FILES:
+                    self.executor.reports().fold(path)
+
+                members.append((path, prefix + name))
+
+        stamps = {}
+
+        # The directory holding the year is locked (the years tracker, the archive)
+        with self.executor.locks.lock(dir_path):
+
+            with self.executor.locks.atomic_write(archive_path, mode= "wb") as f:
+
+                with zipfile.ZipFile(f, "w", compression= zipfile.ZIP_DEFLATED) as archive:
+
+                    for path, name in members:
+
+                        if not name.endswith("/"):
+                            stamps[path] = self.executor.file_stamp(path)
+
+                        archive.write(path, name)
+
+                    archive.writestr(ARCHIVE_INDEX, json.dumps({"version": ARCHIVE_VERSION, "rows": rows}))
+
+                # A file written meanwhile would be lost with the directory
+                changed = [path for path, stamp in stamps.items() if self.executor.file_stamp(path) != stamp]
+
+                if changed:
+                    raise RuntimeError(f"{changed[0]} changed while packing, try again once the year is closed")
+
+            shutil.rmtree(dir_path)
+
+        self.executor.forget_registry(dir_path)
+        self.executor.track(dir_path)
+        self.executor.track(archive_path)
+
+        return {
+            "path": archive_path, "files": len(stamps),
+            "size": sum(stamp[1] for stamp in stamps.values()), "archive_size": os.path.getsize(archive_path)
+        }
+
+
+    # Unpack a directory
+    def restore(self, dir_path):
+        """
+        ### Unpacks the archive of a year directory and removes the archive.
+
+        - Extracted into a temporary directory first, the year appears whole.
+
+        :param dir_path (str): Path of the archived year directory.
+
+        Returns:
+            str: The path of the restored directory.
+        """
+
+        dir_path = os.path.abspath(dir_path)
+        archive_path = self.archive_path(dir_path)
+
+        if not os.path.isfile(archive_path):
+            raise FileNotFoundError(f"{archive_path} is not found")
+
+        if os.path.exists(dir_path):
+            raise FileExistsError(f"{dir_path} already exists")
+
+        self.forget(archive_path)
+
+        with self.executor.locks.lock(dir_path):
+
+            # Hidden while it is extracted, left over by an interrupted restore otherwise
+            temp_dir = os.path.join(os.path.dirname(dir_path), TEMP_PREFIX + os.path.basename(dir_path))
+
+            shutil.rmtree(temp_dir, ignore_errors= True)
+            os.makedirs(temp_dir)
+
+            try:
+                with zipfile.ZipFile(archive_path) as archive:
+
+                    for name in archive.namelist():
+
+                        if name != ARCHIVE_INDEX:
+                            archive.extract(name, temp_dir)
+
+                os.rename(temp_dir, dir_path)
+
+            except BaseException:
+
+                shutil.rmtree(temp_dir, ignore_errors= True)
+                raise
+
+            os.remove(archive_path)
+
+        self.executor.forget_registry(dir_path)
+        self.executor.track(archive_path)
+        self.executor.track(dir_path)
+
+        return dir_path
+
+
+    # Delete an archived year
+    def remove(self, path):
+        """
+        ### Deletes the archive of an archived directory.
+
+        - The files of an archive can not be deleted one by one.
+
+        :param path (str): Path of the archived year directory.
+        """
+
+        located = self.locate(path)
+
+        if located is None:
+            return None
+
+        archive_path, name = located
+
+        if name:
+            self.check_writable(path)
+
+        self.forget(archive_path)
+
+        with self.executor.locks.lock(archive_path):
+            os.remove(archive_path)
+
+        self.executor.track(archive_path)
@@ -0,0 +1,426 @@
+"""
+Benchmark Module
+================
+
+This module contains the `Benchmark` class, which measures how `Executor`
+behaves on large trees:
+
+1. A synthetic `TaskData` tree is generated in a temporary folder:
+   years x tasks x 12 months x rows, every month with a date column,
+   duration columns and text columns. It is made with the same helpers as
+   the menu (trackers, reports, schema, manifest).
+2. Every operation runs `repeat` times on it and its wall times are kept:
+   reading, tracker lookups, appends, row/month/task deletes, printing,
+   directory counts and the reports.
+3. The results are saved as JSON. Passing an older result file with
+   `--compare` prints the ratio of every operation and fails (exit status 1)
+   if one got slower than the tolerance.
+
+Usage:
+    python benchmark.py [--years 1] [--tasks 3] [--rows 1000] [--durations 1] [--strings 2]
+                        [--repeat 5] [--backend csv|sqlite] [--dir DIR] [--keep]
+                        [--output results.json] [--compare old.json] [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+
+# Month names of the generated trees
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Words of the generated text columns
+WORDS = ["legs", "arms", "run", "swim", "bike", "yoga", "read", "code", "rest", "walk"]
+
+
+class Benchmark():
+    """
+    Generates a synthetic tree and times the operations of the executor on it."""
+
+    def __init__(self, base_dir:str, years:int = 1, tasks:int = 3, rows:int = 1000,
+                 durations:int = 1, strings:int = 2, repeat:int = 5, seed:int = 0):
+
+        # Root of the generated tree
+        self.base_dir = base_dir
+
+        # Shape of the tree
+        self.years = years
+        self.tasks = tasks
+        self.rows = rows
+        self.durations = durations
+        self.strings = strings
+
+        # Runs of every operation
+        self.repeat = repeat
+
+        # Same data for the same parameters
+        self.random = random.Random(seed)
+
+        # Wall times of the operations: {name: [seconds, ...]}
+        self.timings = {}
+
+        # Made by generate()
+        self.executor = None
+        self.generator = None
+
+
+    # Column names and types of the generated months
+    def header(self):
+        """
+        ### Returns the header and the schema types of the generated month files.
+
+        - Header names can not contain digits, the columns are lettered.
+        """
+
+        letters = string.ascii_lowercase
+
+        header = ["date"] + [f"duration_{letters[num]}" for num in range(self.durations)]
+        header += [f"note_{letters[num]}" for num in range(self.strings)]
+
+        types = ["date"] + ["duration"] * self.durations + ["string"] * self.strings
+
+        return header, types
+
+
+    # Rows of one generated month
+    def month_rows(self, year:int, month:int, count:int):
+        """
+        ### Returns `count` random rows of a month, in the stored (normalized) form.
+        """
+
+        rows = []
+
+        for num in range(count):
+
+            row = [f"{year}-{month:02d}-{num % 28 + 1:02d}"]
+            row += [f"{self.random.randint(0, 3)}:{self.random.randint(0, 59):02d}" for _ in range(self.durations)]
+            row += [self.random.choice(WORDS) for _ in range(self.strings)]
+
+            rows.append(row)
+
+        return rows
+
+
+    # Build the tree
+    def generate(self):
+        """
+        ### Generates the synthetic tree with the helpers of the menu.
+
+        Returns:
+            float: Seconds spent generating.
+        """
+
+        # Imported here: the backend is chosen by the environment when main is imported
+        from main import make_backend, create_year, create_task, create_month
+
+        started = time.perf_counter()
+
+        header, types = self.header()
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+
+            self.executor, self.generator = make_backend(self.base_dir)
+
+            for year_num in range(self.years):
+
+                year = str(2026 + year_num)
+                year_dir = os.path.join(self.base_dir, year)
+
+                create_year(self.executor, self.generator, self.base_dir, year)
+
+                for task_num in range(self.tasks):
+
+                    task = f"task{task_num}"
+                    task_dir = os.path.join(year_dir, task)
+
+                    create_task(self.executor, self.generator, year_dir, task)
+
+                    for month_num, month in enumerate(MONTHS, start= 1):
+
+                        create_month(self.executor, self.generator, task_dir, month, header, types)
+
+                        self.executor.append_rows(
+                            os.path.join(task_dir, f"{month}.csv"), self.month_rows(int(year), month_num, self.rows)
+                        )
+
+        return time.perf_counter() - started
+
+
+    # Time one operation
+    def measure(self, name:str, operation, setup= None):
+        """
+        ### Runs an operation `repeat` times and keeps its wall times.
+
+        - The output of the operation is discarded.
+
+        :param name (str): Name of the operation in the results.
+        :param operation: Callable taking the value returned by `setup`.
+        :param setup: Callable preparing every run (not timed), or None.
+        """
+
+        timings = self.timings.setdefault(name, [])
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+
+            for run in range(self.repeat):
+
+                prepared = setup(run) if setup else None
+
+                started = time.perf_counter()
+                operation(prepared)
+                timings.append(time.perf_counter() - started)
+
+
+    # Make a task that a delete can remove
+    def spare_task(self, year_dir:str, name:str):
+        """
+        ### Creates a small task with one filled month and returns its path (setup of the deletes).
+        """
+
+        from main import create_task, create_month
+
+        header, types = self.header()
+
+        task_dir = os.path.join(year_dir, name)
+
+        create_task(self.executor, self.generator, year_dir, name)
+        create_month(self.executor, self.generator, task_dir, "Jan", header, types)
+
+        self.executor.append_rows(os.path.join(task_dir, "Jan.csv"), self.month_rows(2026, 1, self.rows))
+
+        return task_dir
+
+
+    # Time every operation
+    def run(self):
+        """
+        ### Times the operations of the executor on the generated tree.
+
+        Returns:
+            dict: The results (see results()).
+        """
+
+        setup_seconds = self.generate()
+
+        executor = self.executor
+        base_dir = self.base_dir
+
+        year_dir = os.path.join(base_dir, "2026")
+        tasks_csv = os.path.join(year_dir, "tasks.csv")
+        task_dir = os.path.join(year_dir, "task0")
+        months_csv = os.path.join(task_dir, "months.csv")
+        month_path = os.path.join(task_dir, "Jun.csv")
+
+        row = self.month_rows(2026, 6, 1)[0]
+
+        # Warm up: the first read imports pandas
+        executor.read_csv(month_path)
+
+        # Reading
+        self.measure("read_csv", lambda _: executor.read_csv(month_path))
+        self.measure("read_month", lambda _: executor.read_month(month_path))
+        self.measure("read_page", lambda _: executor.read_page(month_path, self.rows // 2, 20))
+        self.measure("count_rows", lambda _: executor.count_rows(month_path))
+
+        # Trackers
+        self.measure("is_exist", lambda _: executor.is_exist(tasks_csv, f"task{self.tasks - 1}"))
+        self.measure("get_latst_active_name", lambda _: executor.get_latst_active_name(months_csv))
+        self.measure("count_dirs", lambda _: executor.count_dirs(base_dir))
+        self.measure("count_files", lambda _: executor.count_files(task_dir))
+
+        # Printing
+        self.measure("print_formatted_csv_table", lambda _: executor.print_formatted_csv_table(tasks_csv))
+        self.measure("print_month", lambda _: executor.page_month(month_path, page_size= self.rows * 2))
+
+        # Writing
+        self.measure("store_data", lambda _: executor.store_data(month_path, row))
+
+        # Deletes of remove_data(): a row, a month, a task
+        self.measure("delete_row", lambda _: executor.delete_row(month_path, 1))
+
+        def delete_path(tracker, name, path):
+
+            executor.delete_registry_name(tracker, name)
+            executor.remove_path(path)
+
+        self.measure(
+            "delete_month",
+            lambda path: delete_path(os.path.join(os.path.dirname(path), "months.csv"), "Jan", path),
+            setup= lambda run: os.path.join(self.spare_task(year_dir, f"spare_month{run}"), "Jan.csv")
+        )
+
+        self.measure(
+            "delete_task",
+            lambda path: delete_path(tasks_csv, os.path.basename(path), path),
+            setup= lambda run: self.spare_task(year_dir, f"spare{run}")
+        )
+
+        # Reports
+        reporter = executor.reports()
+
+        self.measure("year_report", lambda _: reporter.print_year_report(year_dir))
+        self.measure("year_report_rebuild", lambda _: reporter.print_year_report(year_dir, rebuild= True))
+
+        return self.results(setup_seconds)
+
+
+    # Summary of the timings
+    def results(self, setup_seconds:float):
+        """
+        ### Returns the parameters, the environment and the statistics of every operation.
+
+        Returns:
+            dict: {"created", "parameters", "environment", "setup_seconds",
+            "operations": {name: {"runs", "min_ms", "median_ms", "mean_ms", "max_ms"}}}
+        """
+
+        operations = {}
+
+        for name, timings in self.timings.items():
+
+            milliseconds = [seconds * 1000 for seconds in timings]
+
+            operations[name] = {
+                "runs": len(milliseconds),
+                "min_ms": round(min(milliseconds), 3),
+                "median_ms": round(statistics.median(milliseconds), 3),
+                "mean_ms": round(statistics.fmean(milliseconds), 3),
+                "max_ms": round(max(milliseconds), 3)
+            }
+
+        return {
+            "created": datetime.datetime.now().isoformat(timespec= "seconds"),
+            "parameters": {
+                "years": self.years, "tasks": self.tasks, "months": len(MONTHS), "rows": self.rows,
+                "durations": self.durations, "strings": self.strings, "repeat": self.repeat
+            },
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "backend": os.environ.get("TASK_TRACKER_BACKEND", "csv"),
+                "snapshots": os.environ.get("TASK_TRACKER_SNAPSHOTS", "1")
+            },
+            "setup_seconds": round(setup_seconds, 3),
+            "operations": operations
+        }
+
+
+# Find the slower operations
+def compare(results:dict, baseline:dict, tolerance:float):
+    """
+    ### Compares the median times of two result files.
+
+    :param results (dict): The new results.
+    :param baseline (dict): Older results of the same parameters.
+    :param tolerance (float): Allowed slow down, e.g. 0.25 for 25%.
+
+    Returns:
+        list: (operation, old median, new median, ratio) of every operation slower than the tolerance.
+    """
+
+    regressions = []
+
+    if results["parameters"] != baseline.get("parameters"):
+        print("\nThe parameters of the baseline differ, the ratios are not comparable❗")
+
+    print(f"\n{'operation':<28}{'baseline ms':>14}{'now ms':>12}{'ratio':>9}")
+
+    for name, stats in results["operations"].items():
+
+        old = baseline.get("operations", {}).get(name)
+
+        if not old:
+            continue
+
+        ratio = stats["median_ms"] / old["median_ms"] if old["median_ms"] else 1.0
+        flag = "  ❗" if ratio > 1 + tolerance else ""
+
+        print(f"{name:<28}{old['median_ms']:>14.3f}{stats['median_ms']:>12.3f}{ratio:>9.2f}{flag}")
+
+        if flag:
+            regressions.append((name, old["median_ms"], stats["median_ms"], ratio))
+
+    return regressions
+
+
+# Print the statistics
+def print_results(results:dict):
+    """
+    ### Prints the statistics of every operation as a table.
+    """
+
+    print(f"\nTree: {results['parameters']}  (generated in {results['setup_seconds']} s)\n")
+    print(f"{'operation':<28}{'min ms':>12}{'median ms':>12}{'mean ms':>12}{'max ms':>12}")
+
+    for name, stats in results["operations"].items():
+        print(f"{name:<28}{stats['min_ms']:>12.3f}{stats['median_ms']:>12.3f}{stats['mean_ms']:>12.3f}{stats['max_ms']:>12.3f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description= "Benchmark of the Task Data Tracker on a synthetic tree.")
+    parser.add_argument("--years", type= int, default= 1, help= "Number of years.")
+    parser.add_argument("--tasks", type= int, default= 3, help= "Number of tasks per year.")
+    parser.add_argument("--rows", type= int, default= 1000, help= "Number of rows per month.")
+    parser.add_argument("--durations", type= int, default= 1, help= "Number of duration columns.")
+    parser.add_argument("--strings", type= int, default= 2, help= "Number of text columns.")
+    parser.add_argument("--repeat", type= int, default= 5, help= "Runs of every operation.")
+    parser.add_argument("--seed", type= int, default= 0, help= "Seed of the generated data.")
+    parser.add_argument("--backend", choices= ("csv", "sqlite"), help= "Storage backend (default: TASK_TRACKER_BACKEND).")
+    parser.add_argument("--dir", help= "Folder of the temporary tree (default: the system temp folder).")
+    parser.add_argument("--keep", action= "store_true", help= "Keep the generated tree.")
+    parser.add_argument("--output", help= "Save the results to this JSON file.")
+    parser.add_argument("--compare", help= "JSON results of an older run to compare with.")
+    parser.add_argument("--tolerance", type= float, default= 0.25, help= "Allowed slow down before a regression (0.25 = 25%%).")
+
+    args = parser.parse_args()
+
+    # Read by main.make_backend()
+    if args.backend:
+        os.environ["TASK_TRACKER_BACKEND"] = args.backend
+
+    base_dir = os.path.join(tempfile.mkdtemp(prefix= "taskdata-bench-", dir= args.dir), "TaskData")
+
+    try:
+        results = Benchmark(
+            base_dir, years= args.years, tasks= args.tasks, rows= args.rows, durations= args.durations,
+            strings= args.strings, repeat= args.repeat, seed= args.seed
+        ).run()
+
+    finally:
+
+        if args.keep:
+            print(f"\nTree kept in: {base_dir}")
+
+        else:
+            shutil.rmtree(os.path.dirname(base_dir), ignore_errors= True)
+
+    print_results(results)
+
+    if args.output:
+
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent= 2)
+
+        print(f"\nResults saved in: {args.output}")
+
+    if args.compare:
+
+        with open(args.compare, "r") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+        if regressions:
+
+            print(f"\n{len(regressions)} operation(s) slower than the baseline❗")
+            sys.exit(1)
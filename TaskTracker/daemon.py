@@ -0,0 +1,429 @@
+"""
+Daemon Module
+================
+
+This module contains the `IngestServer` class, a local asyncio daemon that
+lets many scripts log entries at a high rate without the menu.
+
+Protocol (Unix socket, one JSON object per line in both directions):
+
+    -> {"task": "gym", "values": ["2026-01-05", "1:30"]}
+    -> {"year": "2026", "task": "gym", "month": "Jan", "values": ["2026-01-06", "45"]}
+    <- {"ok": true}
+    <- {"ok": false, "error": "Invalid duration: [ x ]..."}
+
+- "year" and "month" default to the last active year / month.
+- Entries are validated against the header (and schema) of the month file
+  when they arrive, like `Executor.build_row()` does for one row.
+- Valid entries are queued per month file and written by group commit: every
+  `flush_interval` seconds (or when `max_batch` entries wait) each file gets
+  one locked append (`Executor.append_rows()`) and one fsync.
+- A client is acknowledged only after the batch holding its entry was
+  flushed. Answers come in the order of the requests, so a client can send
+  many lines without waiting.
+- The answer is the result of the append and the fsync. The bookkeeping
+  (row index, manifest, reports) runs before the answers are sent, with one
+  manifest write per commit. A failure there does not turn stored rows into
+  `ok: false` (a retry would store them twice). It is printed and the
+  reports of the month are marked as not maintained, they are rebuilt on
+  their next use (see Reporter.is_current()). The row index and the
+  manifest notice the changed size of the month file on their own.
+
+Started with `python main.py serve`.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+
+
+# Name of the socket file in the base folder
+SOCKET_NAME = "ingest.sock"
+
+# Seconds between two group commits
+FLUSH_INTERVAL = 0.01
+
+# Number of waiting entries that triggers a commit right away
+MAX_BATCH = 1000
+
+
+class IngestServer():
+    """
+    Accepts entries over a Unix socket and appends them in batches."""
+
+    def __init__(self, executor, base_dir:str, socket_path:str = None,
+                 flush_interval:float = FLUSH_INTERVAL, max_batch:int = MAX_BATCH, fsync:bool = True):
+
+        # Validates and stores the entries
+        self.executor = executor
+        self.base_dir = base_dir
+
+        # Listening socket file
+        self.socket_path = socket_path or os.path.join(base_dir, SOCKET_NAME)
+
+        # Group commit settings
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.fsync = fsync
+
+        # Waiting entries: {month path: [(row, future), ...]}
+        self.pending = {}
+        self.pending_count = 0
+
+        # Timer of the next commit
+        self.flush_handle = None
+
+
+    # Month file of an entry
+    def entry_path(self, request:dict):
+        """
+        ### Returns the month file of a request, checked against the trackers.
+
+        :param request (dict): The decoded request.
+
+        Returns:
+            tuple: (month file path, None) or (None, error message)
+        """
+
+        executor = self.executor
+
+        years_csv = os.path.join(self.base_dir, "years.csv")
+
+        # The last active year by default
+        year = str(request.get("year") or executor.get_latst_active_name(years_csv) or "")
+
+        if not year or not executor.is_exist(years_csv, year):
+            return None, f"Year [ {year} ] is not found"
+
+        task = str(request.get("task") or "").strip().lower()
+        year_dir = os.path.join(self.base_dir, year)
+
+        if not task or not executor.is_exist(os.path.join(year_dir, "tasks.csv"), task):
+            return None, f"Task [ {task} ] is not found"
+
+        # The last active month by default
+        months_csv = os.path.join(year_dir, task, "months.csv")
+        month = str(request.get("month") or executor.get_latst_active_name(months_csv) or "").capitalize()
+
+        if not month or not executor.is_exist(months_csv, month):
+            return None, f"Month [ {month} ] is not found"
+
+        return os.path.join(year_dir, task, f"{month}.csv"), None
+
+
+    # Validate a request and queue its entry
+    def submit(self, line:bytes):
+        """
+        ### Validates one request line and queues its row for the next commit.
+
+        :param line (bytes): One JSON request.
+
+        Returns:
+            asyncio.Future: Resolved with the answer once the row is flushed
+            (right away for an invalid request).
+        """
+
+        future = asyncio.get_running_loop().create_future()
+
+        try:
+            request = json.loads(line)
+            values = request["values"]
+
+            if not isinstance(values, list):
+                raise TypeError
+
+        except (ValueError, KeyError, TypeError):
+
+            future.set_result({"ok": False, "error": "Invalid request, expected {\"task\": ..., \"values\": [...]}"})
+            return future
+
+        file_path, error = self.entry_path(request)
+
+        if error is None:
+
+            # The messages of the validation are the error of the answer
+            output = io.StringIO()
+
+            with contextlib.redirect_stdout(output):
+                row = self.executor.build_row(file_path, [str(value) for value in values])
+
+            if row is None:
+                error = " ".join(output.getvalue().split()) or "Invalid entry"
+
+        if error is not None:
+
+            future.set_result({"ok": False, "error": error})
+            return future
+
+        self.pending.setdefault(file_path, []).append((row, future))
+        self.pending_count += 1
+
+        # Commit now if the batch is full, otherwise after the interval
+        if self.pending_count >= self.max_batch:
+            self.flush()
+
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(self.flush_interval, self.flush)
+
+        return future
+
+
+    # Write the waiting entries
+    def flush(self):
+        """
+        ### Group commit: one append and one fsync per month file, the bookkeeping, then the answers.
+
+        - The answer of a file is the result of its append, the bookkeeping
+          does not change it (see record()).
+        """
+
+        if self.flush_handle is not None:
+
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        pending, self.pending = self.pending, {}
+        self.pending_count = 0
+
+        # Rows on disk: [(month path, rows)]
+        written = []
+
+        # Answer of every batch: [(entries, answer)]
+        answers = []
+
+        for file_path, entries in pending.items():
+
+            rows = [row for row, _ in entries]
+
+            try:
+                self.executor.append_rows(file_path, rows, record= False)
+
+                if self.fsync:
+                    self.sync(file_path)
+
+                answer = {"ok": True}
+                written.append((file_path, rows))
+
+            except Exception as error:
+                answer = {"ok": False, "error": f"Write failed: {error}"}
+
+            answers.append((entries, answer))
+
+        # An acknowledged row is in the index, the manifest and the reports
+        if written:
+            self.record(written)
+
+        for entries, answer in answers:
+
+            for _, future in entries:
+
+                if not future.done():
+                    future.set_result(answer)
+
+
+    # Bookkeeping of a commit
+    def record(self, written:list):
+        """
+        ### Updates the row indexes, the manifest (one write) and the reports of the flushed rows.
+
+        - Failures are printed, the rows are stored and are acknowledged.
+          The reports of a month that failed are rebuilt on their next use.
+
+        :param written (list): (month path, rows) of every flushed file.
+        """
+
+        try:
+            with self.executor.track_batch():
+
+                for file_path, rows in written:
+
+                    try:
+                        self.executor.record_rows(file_path, rows)
+
+                    except Exception as error:
+
+                        print(f"\nBookkeeping of [ {file_path} ] failed: {error}❗ (rows are stored)", file= sys.stderr)
+                        self.invalidate(file_path)
+
+        except Exception as error:
+            print(f"\nManifest update failed: {error}❗ (rows are stored)", file= sys.stderr)
+
+
+    # Give up the running totals of a month
+    def invalidate(self, file_path):
+        """
+        ### Marks the reports above a month file as not maintained, they are rebuilt on their next use.
+
+        :param file_path (str): Path of the month file.
+        """
+
+        try:
+            self.executor.reports().invalidate(file_path)
+
+        except Exception as error:
+            print(f"\nReports of [ {file_path} ] could not be marked: {error}❗ (run python reporting.py rebuild)", file= sys.stderr)
+
+
+    # Flush a file to the disk
+    def sync(self, file_path):
+        """
+        ### Forces the appended rows of a file to the disk.
+
+        :param file_path (str): Path of the month file.
+        """
+
+        # Other backends keep no file at this path
+        if not os.path.isfile(file_path):
+            return None
+
+        fd = os.open(file_path, os.O_RDONLY)
+
+        try:
+            os.fsync(fd)
+
+        finally:
+            os.close(fd)
+
+
+    # Serve one client
+    async def handle_client(self, reader, writer):
+        """
+        ### Reads the requests of a client and answers them in order.
+        """
+
+        answers = asyncio.Queue()
+
+        # Answers are written in request order while new requests are read
+        async def send_answers():
+
+            while True:
+
+                future = await answers.get()
+
+                if future is None:
+                    break
+
+                writer.write((json.dumps(await future) + "\n").encode())
+                await writer.drain()
+
+        sender = asyncio.create_task(send_answers())
+
+        try:
+            while True:
+
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                if line.strip():
+                    answers.put_nowait(self.submit(line))
+
+        finally:
+
+            answers.put_nowait(None)
+
+            with contextlib.suppress(ConnectionError):
+                await sender
+
+            writer.close()
+
+
+    # Remove the socket of a stopped daemon
+    def clear_stale_socket(self):
+        """
+        ### Removes a socket file left by a daemon that is not running anymore.
+
+        Returns:
+            bool: False if another daemon is listening on the socket.
+        """
+
+        if not os.path.exists(self.socket_path):
+            return True
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            probe.connect(self.socket_path)
+            return False
+
+        except OSError:
+
+            os.remove(self.socket_path)
+            return True
+
+        finally:
+            probe.close()
+
+
+    # Run until stopped
+    async def serve(self):
+        """
+        ### Listens on the socket until SIGINT/SIGTERM, then commits the waiting entries.
+        """
+
+        if not self.clear_stale_socket():
+
+            print(f"\n\nA daemon is already listening on [ {self.socket_path} ]❗\n")
+            return None
+
+        server = await asyncio.start_unix_server(self.handle_client, path= self.socket_path)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+
+        print(f"\nListening on [ {self.socket_path} ] (Ctrl+C to stop)\n")
+
+        try:
+            async with server:
+                await stop.wait()
+
+        finally:
+
+            self.flush()
+
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+    # Start the event loop
+    def run(self):
+        """
+        ### Runs the daemon in the current thread until it is stopped.
+        """
+
+        if not hasattr(socket, "AF_UNIX"):
+
+            print("\n\nUnix sockets are not available on this system❗\n")
+            return None
+
+        asyncio.run(self.serve())
+
+
+# Send entries to a running daemon
+def send_entries(socket_path:str, requests:list):
+    """
+    ### Sends requests to the daemon and waits for their answers (for scripts).
+
+    :param socket_path (str): Path of the daemon socket.
+    :param requests (list): Request dictionaries, e.g. {"task": "gym", "values": [...]}.
+
+    Returns:
+        list: One answer dictionary per request.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+
+        client.connect(socket_path)
+        client.sendall("".join(json.dumps(request) + "\n" for request in requests).encode())
+
+        with client.makefile("r") as answers:
+            return [json.loads(answers.readline()) for _ in requests]
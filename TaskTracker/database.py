@@ -0,0 +1,772 @@
+"""
+Database Module
+================
+
+This module contains an optional SQLite storage backend for the tracker.
+
+The whole Year/Task/Month hierarchy is stored in one database file instead of
+directories and CSV trackers. The classes keep the path based interface of
+`Executor` and `Generator`, so the menu in `main.py` works unchanged:
+
+1. Database: Opens the SQLite file (WAL mode) and maps tracker paths to rows.
+2. SQLiteExecutor: `Executor` operations backed by SQL queries.
+3. SQLiteGenerator: `Generator` operations backed by SQL inserts.
+4. migrate_tree(): Imports an existing `TaskData` directory tree.
+
+Usage:
+    python database.py migrate [--base-dir DIR] [--db FILE]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from manager import Executor, REGISTRY_FILES
+from generating import Generator
+
+
+# Name of the database file inside the base directory
+DB_FILE_NAME = "taskdata.db"
+
+# Tables, one row per tracker name or month entry
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS years (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    year TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (year, name)
+);
+
+CREATE TABLE IF NOT EXISTS months (
+    id INTEGER PRIMARY KEY,
+    year TEXT NOT NULL,
+    task TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (year, task, name)
+);
+
+CREATE TABLE IF NOT EXISTS month_files (
+    year TEXT NOT NULL,
+    task TEXT NOT NULL,
+    month TEXT NOT NULL,
+    header TEXT NOT NULL,
+    PRIMARY KEY (year, task, month)
+);
+
+CREATE TABLE IF NOT EXISTS schemas (
+    year TEXT NOT NULL,
+    task TEXT NOT NULL,
+    columns TEXT NOT NULL,
+    PRIMARY KEY (year, task)
+);
+
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    year TEXT NOT NULL,
+    task TEXT NOT NULL,
+    month TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_tasks_year ON tasks (year);
+CREATE INDEX IF NOT EXISTS idx_months_task ON months (year, task);
+CREATE INDEX IF NOT EXISTS idx_entries_month ON entries (year, task, month, id);
+"""
+
+
+class Database():
+    """
+    A SQLite file holding the years, tasks, months and their entries."""
+
+    def __init__(self, base_dir, db_path= None):
+        """
+        ### Opens (or creates) the database of a data tree.
+
+        :param base_dir: The base directory the tracker paths are relative to.
+        :param db_path: Path of the database file, defaults to `base_dir/taskdata.db`.
+        """
+
+        self.base_dir = os.path.abspath(base_dir)
+        self.db_path = db_path or os.path.join(self.base_dir, DB_FILE_NAME)
+
+        # The folder of the database file must exist
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok= True)
+
+        self.connection = sqlite3.connect(self.db_path)
+
+        # Write ahead log: readers do not block the writer
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        self.connection.executescript(SCHEMA)
+
+
+    def locate(self, path):
+        """
+        ### Maps a path of the directory layout to the entity it stands for.
+
+        :param path: Full path of a tracker, month file or directory.
+
+        Returns:
+        -------
+            tuple: (kind, year, task, month) where kind is one of
+            "base", "years", "year", "tasks", "task", "months", "month" or "report".
+        """
+
+        relative = os.path.relpath(os.path.abspath(path), self.base_dir)
+
+        # Split the path into its year/task/file parts
+        parts = [] if relative == "." else relative.split(os.sep)
+
+        if not parts:
+            return ("base", None, None, None)
+
+        name = parts[-1]
+
+        # Files of the reports are not stored in the database
+        if name in ("tasks_report.csv", "task_report.csv"):
+            return ("report", parts[0], parts[1] if len(parts) > 2 else None, None)
+
+        if len(parts) == 1:
+            return ("years", None, None, None) if name == "years.csv" else ("year", name, None, None)
+
+        if len(parts) == 2:
+            return ("tasks", parts[0], None, None) if name == "tasks.csv" else ("task", parts[0], name, None)
+
+        if name == "months.csv":
+            return ("months", parts[0], parts[1], None)
+
+        # <Month>.csv
+        return ("month", parts[0], parts[1], name[:-4])
+
+
+    def execute(self, query, params= ()):
+        """
+        ### Runs a query in its own transaction.
+
+        :param query: SQL statement.
+        :param params: Values of the statement placeholders.
+
+        Returns:
+            sqlite3.Cursor: The cursor of the executed statement.
+        """
+
+        with self.connection:
+            return self.connection.execute(query, params)
+
+
+class SQLiteExecutor(Executor):
+    """
+    Executor whose trackers and month files live in a SQLite database."""
+
+    def __init__(self, database: Database):
+
+        super().__init__()
+
+        self.database = database
+
+
+    def read_csv(self, file_path):
+        """
+        ### Returns the entries of a month as a pandas DataFrame of strings.
+
+        :param file_path: Path of the month file.
+        """
+
+        # Imported lazily, only month files need a DataFrame
+        import pandas
+
+        _, year, task, month = self.database.locate(file_path)
+
+        rows = self.database.execute(
+            "SELECT data FROM entries WHERE year = ? AND task = ? AND month = ? ORDER BY id",
+            (year, task, month)
+        ).fetchall()
+
+        return pandas.DataFrame(
+            [json.loads(data) for (data,) in rows],
+            columns= self.read_header(file_path),
+            dtype= str
+        )
+
+
+    def read_month(self, file_path, use_snapshot:bool = True):
+        """
+        ### Returns the entries of a month (deleted rows are gone from the table).
+
+        :param file_path: Path of the month file.
+        :param use_snapshot: Unused, the database keeps no snapshots.
+        """
+
+        return self.read_csv(file_path)
+
+
+    def read_month_chunks(self, file_path, chunk_size:int = 10000, usecols:list = None):
+        """
+        ### Yields the entries of a month in one DataFrame.
+
+        :param file_path: Path of the month file.
+        :param chunk_size: Unused, the query result is already bounded per month.
+        :param usecols: Only keep these columns (all columns if None).
+        """
+
+        data = self.read_csv(file_path)
+
+        yield data if usecols is None else data[list(usecols)]
+
+
+    def read_page(self, file_path, start:int, count:int):
+        """
+        ### Reads a slice of the entries of a month with LIMIT / OFFSET.
+
+        :param file_path: Path of the month file.
+        :param start: 0-based number of the first entry.
+        :param count: Maximum number of entries.
+        """
+
+        _, year, task, month = self.database.locate(file_path)
+
+        header = self.read_header(file_path)
+
+        rows = self.database.execute(
+            "SELECT data FROM entries WHERE year = ? AND task = ? AND month = ? ORDER BY id LIMIT ? OFFSET ?",
+            (year, task, month, count, start)
+        ).fetchall()
+
+        # Short rows are padded like pandas does
+        rows = [json.loads(data) for (data,) in rows]
+        rows = [[value if value is not None else "" for value in row] + [""] * (len(header) - len(row)) for row in rows]
+
+        return header, rows, self.count_rows(file_path)
+
+
+    def snapshot_totals(self, file_path):
+        """
+        ### Entries are read from the database, there are no snapshots.
+
+        :param file_path: Path of the month file.
+        """
+
+        return None
+
+
+    def write_table(self, file_path, header:list, rows:list):
+        """
+        ### Report files are not stored in the database, nothing to write.
+
+        :param file_path: Path of the report file.
+        :param header: The header row of the file.
+        :param rows: List of rows.
+        """
+
+        pass
+
+
+    def load_registry(self, file_path):
+        """
+        ### Returns the names of a tracker in the cache entry format.
+
+        :param file_path: Path of years.csv, tasks.csv or months.csv.
+        """
+
+        kind, year, task, _ = self.database.locate(file_path)
+
+        if kind == "years":
+            rows = self.database.execute("SELECT name FROM years ORDER BY id")
+
+        elif kind == "tasks":
+            rows = self.database.execute("SELECT name FROM tasks WHERE year = ? ORDER BY id", (year,))
+
+        else:
+            rows = self.database.execute(
+                "SELECT name FROM months WHERE year = ? AND task = ? ORDER BY id", (year, task)
+            )
+
+        names = [name for (name,) in rows]
+
+        return {"stamp": None, "names": names, "index": set(names)}
+
+
+    def read_header(self, file_path):
+        """
+        ### Returns the header of a tracker or a month file.
+
+        :param file_path: Path of the CSV file.
+        """
+
+        kind, year, task, month = self.database.locate(file_path)
+
+        # Trackers have a fixed one-column header
+        if kind in ("years", "tasks", "months"):
+            return [kind]
+
+        row = self.database.execute(
+            "SELECT header FROM month_files WHERE year = ? AND task = ? AND month = ?",
+            (year, task, month)
+        ).fetchone()
+
+        return json.loads(row[0]) if row else []
+
+
+    def read_last_record(self, file_path, block_size:int = 4096):
+        """
+        ### Returns the last row of a tracker or month file, or None if empty.
+
+        :param file_path: Path of the CSV file.
+        :param block_size: Unused, kept for the `Executor` signature.
+        """
+
+        if os.path.basename(file_path) in REGISTRY_FILES:
+
+            names = self.read_registry(file_path)
+
+            return [names[-1]] if names else None
+
+        _, year, task, month = self.database.locate(file_path)
+
+        row = self.database.execute(
+            "SELECT data FROM entries WHERE year = ? AND task = ? AND month = ? ORDER BY id DESC LIMIT 1",
+            (year, task, month)
+        ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+
+    def read_schema(self, path):
+        """
+        ### Returns the typed schema of a task, or None if it has no schema.
+
+        :param path: Path of the task directory or of one of its month files.
+        """
+
+        _, year, task, _ = self.database.locate(path)
+
+        row = self.database.execute(
+            "SELECT columns FROM schemas WHERE year = ? AND task = ?", (year, task)
+        ).fetchone()
+
+        return dict(json.loads(row[0])) if row else None
+
+
+    def write_schema(self, task_dir, columns:list, types:list):
+        """
+        ### Stores the typed schema of a task.
+
+        :param task_dir: Path of the task directory.
+        :param columns: Column names of the month header.
+        :param types: One type per column.
+        """
+
+        _, year, task, _ = self.database.locate(task_dir)
+
+        self.database.execute(
+            "INSERT OR REPLACE INTO schemas (year, task, columns) VALUES (?, ?, ?)",
+            (year, task, json.dumps(list(zip(columns, types))))
+        )
+
+
+    def is_exist(self, file_path: str, name:str):
+        """
+        ### Checks if a name exists in a tracker using the table indexes.
+
+        :param file_path: Path of years.csv, tasks.csv or months.csv.
+        :param name: The name to search for.
+        """
+
+        kind, year, task, _ = self.database.locate(file_path)
+
+        if kind == "years":
+            row = self.database.execute("SELECT 1 FROM years WHERE name = ?", (name,))
+
+        elif kind == "tasks":
+            row = self.database.execute("SELECT 1 FROM tasks WHERE year = ? AND name = ?", (year, name))
+
+        else:
+            row = self.database.execute(
+                "SELECT 1 FROM months WHERE year = ? AND task = ? AND name = ?", (year, task, name)
+            )
+
+        return row.fetchone() is not None
+
+
+    def store_data(self, file_path, data_list):
+        """
+        ### Inserts a tracker name or a month entry.
+
+        :param file_path: Target CSV path.
+        :param data_list: Data to append.
+        """
+
+        kind, year, task, month = self.database.locate(file_path)
+
+        if kind == "years":
+            self.database.execute("INSERT OR IGNORE INTO years (name) VALUES (?)", (data_list[0],))
+
+        elif kind == "tasks":
+            self.database.execute(
+                "INSERT OR IGNORE INTO tasks (year, name) VALUES (?, ?)", (year, data_list[0])
+            )
+
+        elif kind == "months":
+            self.database.execute(
+                "INSERT OR IGNORE INTO months (year, task, name) VALUES (?, ?, ?)",
+                (year, task, data_list[0])
+            )
+
+        elif kind == "month":
+            self.database.execute(
+                "INSERT INTO entries (year, task, month, data) VALUES (?, ?, ?, ?)",
+                (year, task, month, json.dumps([str(value) for value in data_list]))
+            )
+
+        # View details of the storged data
+        print(f"\nEntry(s): {data_list} successfully stored into:\n")
+        print(f"- File: {file_path}\n")
+
+
+    def append_rows(self, file_path, rows:list, record:bool = True):
+        """
+        ### Inserts many entries of a month in one transaction.
+
+        :param file_path: Path of the month file.
+        :param rows: List of rows, every row is a list of values.
+        :param record: Unused, the database keeps no index, manifest or report files.
+        """
+
+        _, year, task, month = self.database.locate(file_path)
+
+        with self.database.connection as connection:
+
+            connection.executemany(
+                "INSERT INTO entries (year, task, month, data) VALUES (?, ?, ?, ?)",
+                [(year, task, month, json.dumps([str(value) for value in row])) for row in rows]
+            )
+
+
+    def record_rows(self, file_path, rows:list):
+        """
+        ### Nothing to record, the inserted entries are all there is.
+        """
+
+        return None
+
+
+    def delete_registry_name(self, file_path, name:str):
+        """
+        ### Removes a name from a tracker table.
+
+        :param file_path: Path of years.csv, tasks.csv or months.csv.
+        :param name: The name to delete.
+        """
+
+        kind, year, task, _ = self.database.locate(file_path)
+
+        if kind == "years":
+            self.database.execute("DELETE FROM years WHERE name = ?", (name,))
+
+        elif kind == "tasks":
+            self.database.execute("DELETE FROM tasks WHERE year = ? AND name = ?", (year, name))
+
+        else:
+            self.database.execute(
+                "DELETE FROM months WHERE year = ? AND task = ? AND name = ?", (year, task, name)
+            )
+
+
+    def path_exists(self, path):
+        """
+        ### Checks if the entity of a path is stored in the database.
+
+        :param path: Full path of a tracker, month file or directory.
+        """
+
+        kind, year, task, month = self.database.locate(path)
+
+        if kind == "month":
+
+            row = self.database.execute(
+                "SELECT 1 FROM month_files WHERE year = ? AND task = ? AND month = ?",
+                (year, task, month)
+            )
+
+            return row.fetchone() is not None
+
+        if kind in ("year", "tasks"):
+            return self.is_exist(os.path.join(self.database.base_dir, "years.csv"), year)
+
+        if kind in ("task", "months"):
+            return self.is_exist(os.path.join(self.database.base_dir, year, "tasks.csv"), task)
+
+        return True
+
+
+    def remove_path(self, path):
+        """
+        ### Deletes a year, task or month and all rows below it.
+
+        :param path: Full path of the directory or month file.
+        """
+
+        kind, year, task, month = self.database.locate(path)
+
+        # Conditions of the rows below the removed entity
+        if kind == "year":
+            where, params = "year = ?", (year,)
+
+        elif kind == "task":
+            where, params = "year = ? AND task = ?", (year, task)
+
+        else:
+            where, params = "year = ? AND task = ? AND month = ?", (year, task, month)
+
+        with self.database.connection as connection:
+
+            connection.execute(f"DELETE FROM entries WHERE {where}", params)
+            connection.execute(f"DELETE FROM month_files WHERE {where}", params)
+
+            if kind in ("year", "task"):
+                connection.execute(f"DELETE FROM months WHERE {where}", params)
+                connection.execute(f"DELETE FROM schemas WHERE {where}", params)
+
+            if kind == "year":
+                connection.execute("DELETE FROM tasks WHERE year = ?", params)
+
+
+    def count_rows(self, file_path):
+        """
+        ### Returns the number of entries of a month.
+
+        :param file_path: Path of the month file.
+        """
+
+        _, year, task, month = self.database.locate(file_path)
+
+        row = self.database.execute(
+            "SELECT COUNT(*) FROM entries WHERE year = ? AND task = ? AND month = ?",
+            (year, task, month)
+        ).fetchone()
+
+        return row[0]
+
+
+    def delete_row(self, file_path, row_index:int):
+        """
+        ### Deletes the entry shown with a 1-based number.
+
+        :param file_path: Path of the month file.
+        :param row_index: 1-based number of the row.
+        """
+
+        _, year, task, month = self.database.locate(file_path)
+
+        row = self.database.execute(
+            "SELECT id, data FROM entries WHERE year = ? AND task = ? AND month = ? "
+            "ORDER BY id LIMIT 1 OFFSET ?",
+            (year, task, month, max(row_index - 1, 0))
+        ).fetchone()
+
+        # Same error as the CSV backend for a missing row or month
+        if row is None or row_index < 1:
+            raise IndexError(f"Row {row_index} is out of range (1 to {self.count_rows(file_path)})")
+
+        row_id, data = row
+
+        self.database.execute("DELETE FROM entries WHERE id = ?", (row_id,))
+
+        return json.loads(data)
+
+
+    def count_dirs(self, dir_path):
+        """
+        ### Counts the years (base directory) or the tasks (year directory).
+
+        :param dir_path: Full path of the directory.
+        """
+
+        kind, year, _, _ = self.database.locate(dir_path)
+
+        if kind == "base":
+            return len(self.read_registry(os.path.join(dir_path, "years.csv")))
+
+        return len(self.read_registry(os.path.join(dir_path, "tasks.csv")))
+
+
+    def count_files(self, dir_path):
+        """
+        ### Counts the files a task directory would hold.
+
+        - Two default files (months.csv, task_report.csv) plus one per month.
+
+        :param dir_path: Full path of the task directory.
+        """
+
+        _, year, task, _ = self.database.locate(dir_path)
+
+        row = self.database.execute(
+            "SELECT COUNT(*) FROM month_files WHERE year = ? AND task = ?", (year, task)
+        ).fetchone()
+
+        return 2 + row[0]
+
+
+class SQLiteGenerator(Generator):
+    """
+    Generator that registers month files in the SQLite database."""
+
+    def __init__(self, database: Database):
+
+        super().__init__()
+
+        self.database = database
+
+
+    def make_directory(self, path):
+        """
+        ### Directories are implicit in the database, nothing to create.
+
+        :param path: Path of the directory.
+        """
+
+        pass
+
+
+    def make_file(self, path, header:list):
+        """
+        ### Stores the header of a new month file.
+
+        - Tracker and report files are implicit in the database.
+
+        :param path: Full path location of the new file
+        :param header: The header row of the file.
+        """
+
+        kind, year, task, month = self.database.locate(path)
+
+        if kind == "month":
+
+            self.database.execute(
+                "INSERT OR IGNORE INTO month_files (year, task, month, header) VALUES (?, ?, ?, ?)",
+                (year, task, month, json.dumps(header))
+            )
+
+
+def migrate_tree(base_dir, database: Database):
+    """
+    ### Imports an existing `TaskData` directory tree into the database.
+
+    - Walks years.csv -> tasks.csv -> months.csv -> <Month>.csv.
+    - Names already in the database are skipped.
+    - The entries of every migrated month replace the ones in the database,
+      so running it again gives the same database (nothing is doubled).
+    - The source tree is only read: the months are parsed without their
+      snapshots and nothing is locked, no file is written into it.
+
+    :param base_dir: Base directory of the CSV tree.
+    :param database: The target database.
+
+    Returns:
+        dict: Counts of the imported years, tasks, months and entries.
+    """
+
+    # Plain CSV executor to read the source tree
+    reader = Executor()
+
+    counts = {"years": 0, "tasks": 0, "months": 0, "entries": 0}
+
+    years_csv = os.path.join(base_dir, "years.csv")
+
+    if not os.path.exists(years_csv):
+        return counts
+
+    with database.connection as connection:
+
+        for year in reader.read_registry(years_csv):
+
+            tasks_csv = os.path.join(base_dir, year, "tasks.csv")
+
+            connection.execute("INSERT OR IGNORE INTO years (name) VALUES (?)", (year,))
+            counts["years"] += 1
+
+            if not os.path.exists(tasks_csv):
+                continue
+
+            for task in reader.read_registry(tasks_csv):
+
+                months_csv = os.path.join(base_dir, year, task, "months.csv")
+
+                connection.execute("INSERT OR IGNORE INTO tasks (year, name) VALUES (?, ?)", (year, task))
+                counts["tasks"] += 1
+
+                if not os.path.exists(months_csv):
+                    continue
+
+                schema = reader.read_schema(os.path.join(base_dir, year, task))
+
+                if schema:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO schemas (year, task, columns) VALUES (?, ?, ?)",
+                        (year, task, json.dumps(list(schema.items())))
+                    )
+
+                for month in reader.read_registry(months_csv):
+
+                    month_csv = os.path.join(base_dir, year, task, f"{month}.csv")
+
+                    connection.execute(
+                        "INSERT OR IGNORE INTO months (year, task, name) VALUES (?, ?, ?)",
+                        (year, task, month)
+                    )
+                    counts["months"] += 1
+
+                    if not os.path.exists(month_csv):
+                        continue
+
+                    connection.execute(
+                        "INSERT OR REPLACE INTO month_files (year, task, month, header) VALUES (?, ?, ?, ?)",
+                        (year, task, month, json.dumps(reader.read_header(month_csv)))
+                    )
+
+                    # Entries as JSON lists, in file order (no snapshot is written into the source tree)
+                    rows = reader.read_month(month_csv, use_snapshot= False).fillna("").values.tolist()
+
+                    # Replaced in the same transaction as the insert
+                    connection.execute(
+                        "DELETE FROM entries WHERE year = ? AND task = ? AND month = ?",
+                        (year, task, month)
+                    )
+
+                    connection.executemany(
+                        "INSERT INTO entries (year, task, month, data) VALUES (?, ?, ?, ?)",
+                        [(year, task, month, json.dumps(row)) for row in rows]
+                    )
+                    counts["entries"] += len(rows)
+
+    return counts
+
+
+if __name__ == "__main__":
+
+    # Default base directory of the tracker
+    default_base = os.path.join(os.path.expanduser("~"), "Documents", "TaskData")
+
+    parser = argparse.ArgumentParser(description= "SQLite backend of the Task Data Tracker.")
+    commands = parser.add_subparsers(dest= "command", required= True)
+
+    migrate = commands.add_parser("migrate", help= "Import an existing TaskData tree into the database.")
+    migrate.add_argument("--base-dir", default= default_base, help= "Base directory of the CSV tree.")
+    migrate.add_argument("--db", default= None, help= "Database file (default: <base-dir>/taskdata.db).")
+
+    args = parser.parse_args()
+
+    database = Database(args.base_dir, args.db)
+    counts = migrate_tree(args.base_dir, database)
+
+    print(f"\nImported into {database.db_path}:\n")
+
+    for name, count in counts.items():
+        print(f"- {name}: {count}")
@@ -0,0 +1,250 @@
+"""
+Export Module
+================
+
+This module contains the `Exporter` class, which streams every row of the
+tree into one file for other tools:
+
+    year,task,month,date,time,pages
+    2026,gym,Jan,2026-01-05,1:30,
+    2026,read,Jan,2026-01-06,,12
+
+- The trackers are walked year -> task -> month. Years and tasks outside the
+  asked ranges are skipped before their trackers are read, their directories
+  are not touched.
+- Month files are read in chunks of `CHUNK_SIZE` rows and written right away:
+  memory does not grow with the size of the tree.
+- CSV output has one header: the tags, then every column of the exported
+  months in order of appearance (a first pass reads only the headers).
+  Cells of columns a month does not have are empty. JSON lines hold the
+  columns of their own month.
+- The tags win over month columns named year, task or month.
+- Output is UTF-8, optionally gzip compressed. A file is written to a
+  temporary file first and replaces the target when the export is complete.
+
+Used by `python main.py export ...`.
+"""
+
+import contextlib
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from manager import CHUNK_SIZE
+
+
+# Columns tagging every exported row
+TAG_COLUMNS = ["year", "task", "month"]
+
+
+class Exporter():
+    """
+    Streams the rows of the Year/Task/Month hierarchy into one CSV or JSONL file."""
+
+    def __init__(self, executor, base_dir:str):
+
+        # Reads the trackers and the month files (CSV or SQLite backend, archived years)
+        self.executor = executor
+        self.base_dir = base_dir
+
+
+    # Parse a range option
+    def parse_range(self, text:str):
+        """
+        ### Parses a range of names: "2026", "2026:2027", "2026:" or ":2027" (both ends included).
+
+        :param text (str): The range, or None for everything.
+
+        Returns:
+            tuple: (first, last), None for an open end. (None, None) for everything.
+        """
+
+        if not text:
+            return (None, None)
+
+        first, separator, last = text.partition(":")
+
+        first = first.strip() or None
+        last = (last.strip() or None) if separator else first
+
+        return (first, last)
+
+
+    # Order of names
+    def sort_key(self, name:str):
+        """
+        ### Returns the key ordering names: numbers by value (years), before texts (tasks).
+        """
+
+        return (0, int(name), "") if name.isdigit() else (1, 0, name)
+
+
+    # Check a name against a range
+    def in_range(self, name:str, bounds:tuple):
+        """
+        ### Returns True if a name is inside a (first, last) range.
+        """
+
+        first, last = bounds
+        key = self.sort_key(name)
+
+        if first is not None and key < self.sort_key(first):
+            return False
+
+        if last is not None and key > self.sort_key(last):
+            return False
+
+        return True
+
+
+    # Walk the trackers
+    def months(self, years:tuple = (None, None), tasks:tuple = (None, None)):
+        """
+        ### Yields the month files of the tree in tracker order.
+
+        - The tasks of a year outside the range, and the months of a task
+          outside the range, are never read.
+
+        :param years (tuple): (first, last) year, see parse_range().
+        :param tasks (tuple): (first, last) task name.
+
+        Yields
+        ------
+        tuple
+            (year, task, month, path of the month file)
+        """
+
+        executor = self.executor
+
+        for year in executor.read_registry(os.path.join(self.base_dir, "years.csv")):
+
+            if not self.in_range(year, years):
+                continue
+
+            year_dir = os.path.join(self.base_dir, year)
+
+            for task in executor.read_registry(os.path.join(year_dir, "tasks.csv")):
+
+                if not self.in_range(task, tasks):
+                    continue
+
+                task_dir = os.path.join(year_dir, task)
+
+                for month in executor.read_registry(os.path.join(task_dir, "months.csv")):
+
+                    path = os.path.join(task_dir, f"{month}.csv")
+
+                    # A month registered but not created (yet) has no rows
+                    if executor.path_exists(path):
+                        yield year, task, month, path
+
+
+    # Columns of the CSV output
+    def columns(self, years:tuple = (None, None), tasks:tuple = (None, None)):
+        """
+        ### Returns the columns of every exported month, in order of appearance (headers only).
+        """
+
+        columns = {}
+
+        for _, _, _, path in self.months(years, tasks):
+
+            for name in self.executor.read_header(path):
+
+                if name not in TAG_COLUMNS:
+                    columns.setdefault(name, None)
+
+        return list(columns)
+
+
+    # Open the target
+    @contextlib.contextmanager
+    def open_output(self, output:str, compress:bool = False):
+        """
+        ### Yields a UTF-8 text stream writing to a file or to the standard output.
+
+        - A file is replaced only when the block ends without error (see locking.py).
+
+        :param output (str): Path of the file, "-" for the standard output.
+        :param compress (bool): Compress the stream with gzip.
+        """
+
+        if output == "-":
+
+            sys.stdout.flush()
+            target = contextlib.nullcontext(sys.stdout.buffer)
+
+        else:
+            target = self.executor.locks.atomic_write(output, mode= "wb")
+
+        with target as raw:
+
+            stream = gzip.GzipFile(fileobj= raw, mode= "wb") if compress else raw
+            text = io.TextIOWrapper(stream, encoding= "utf-8", newline= "")
+
+            yield text
+
+            # The target itself is closed by its owner
+            text.flush()
+            text.detach()
+
+            if compress:
+                stream.close()
+
+
+    # Export the tree
+    def export(self, output:str, file_format:str = "csv", compress:bool = False,
+               years:tuple = (None, None), tasks:tuple = (None, None), chunk_size:int = CHUNK_SIZE):
+        """
+        ### Writes the live rows of every month in the ranges, tagged with their year, task and month.
+
+        :param output (str): Path of the file, "-" for the standard output.
+        :param file_format (str): "csv" or "jsonl".
+        :param compress (bool): Compress the output with gzip.
+        :param years (tuple): (first, last) year, see parse_range().
+        :param tasks (tuple): (first, last) task name.
+        :param chunk_size (int): Rows read from a month file at once.
+
+        Returns:
+            dict: {"months": number of month files, "rows": number of rows}
+        """
+
+        columns = self.columns(years, tasks) if file_format == "csv" else None
+
+        months = 0
+        count = 0
+
+        with self.open_output(output, compress) as f:
+
+            writer = csv.writer(f, lineterminator= "\n")
+
+            if columns is not None:
+                writer.writerow(TAG_COLUMNS + columns)
+
+            for year, task, month, path in self.months(years, tasks):
+
+                months += 1
+                header = [name for name in self.executor.read_header(path) if name not in TAG_COLUMNS]
+
+                for chunk in self.executor.read_month_chunks(path, chunk_size):
+
+                    # Missing columns (short rows) are empty, the CSV columns in output order
+                    chunk = chunk.reindex(columns= columns if columns is not None else header).fillna("")
+
+                    count += len(chunk)
+
+                    for values in chunk.itertuples(index= False, name= None):
+
+                        if columns is not None:
+
+                            writer.writerow([year, task, month, *values])
+                            continue
+
+                        row = {"year": year, "task": task, "month": month}
+                        row.update(zip(header, values))
+
+                        f.write(json.dumps(row, ensure_ascii= False) + "\n")
+
+        return {"months": months, "rows": count}
@@ -18,7 +18,12 @@ class Generator():
     A generator of files/directories"""
 
     def __init__(self):
-        pass
+
+        # Index of the tree (manifest.py), set up by main.make_backend()
+        self.manifest = None
+
+        # Archived years (archive.py), set up by main.make_backend()
+        self.archive_store = None
         
 
     def make_directory(self, path):
@@ -29,9 +34,17 @@ class Generator():
         :param path: Path of the Main Directory
         """
 
+        # Nothing is created inside an archived year
+        if self.archive_store is not None:
+            self.archive_store.check_writable(path)
+
         # Create directory
         os.makedirs(path, exist_ok= True)
 
+        # Record the directory in the manifest
+        if self.manifest is not None:
+            self.manifest.update(path)
+
                
     def make_file(self, path, header:list):
         """
@@ -43,12 +56,23 @@ class Generator():
         :param path: Full path location of the new file
         :type header: list
         """
+
+        # Nothing is created inside an archived year
+        if self.archive_store is not None:
+            self.archive_store.check_writable(path)
         
-        # Check if file is exist then make it
+        # Check if file is exist then make it ("x" fails if another process made it meanwhile)
         if not os.path.exists(path= path):
 
-            with open(path, "a", newline= "") as f:
+            try:
+                with open(path, "x", newline= "") as f:
+
+                    writer(f).writerow(header)
+
+            except FileExistsError:
+                pass
 
-                f.seek(0, 2)
-                writer(f).writerow(header)
+        # Record the file in the manifest
+        if self.manifest is not None:
+            self.manifest.update(path)
 
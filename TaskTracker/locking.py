@@ -0,0 +1,243 @@
+"""
+Locking Module
+================
+
+This module contains the `LockManager` class, which lets several processes
+(an import job, an interactive session, scheduled commands) write to the same
+`TaskData` tree safely:
+
+- Advisory locks: every directory gets a `.lock` file, locked with `fcntl`
+  (POSIX) or `msvcrt` (Windows) around every read-modify-write of a file in
+  that directory. The lock is re-entrant inside one thread.
+- Atomic rewrites: a file is written to a temporary file next to it and moved
+  over the original with `os.replace()`, readers see the old or the new file,
+  never a half written one. They are meant for whole rewrites (compaction,
+  rebuild, restore), a replace costs a directory update.
+- Locked appends: small updates (report deltas, manifest changes) are one
+  `O_APPEND` write under the directory lock, folded into their file when it
+  is rewritten.
+
+A writer only locks the directory of the file it changes and never holds
+the locks of two directories at once, so writers can not deadlock. The only
+exception is the manifest (manifest.py) in the base folder: its lock may be
+taken while another one is held, but nothing else is locked while it is held.
+"""
+
+import contextlib
+import os
+import tempfile
+import threading
+
+# Only available on POSIX systems
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Only available on Windows
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+# Lock file of a directory
+LOCK_FILE_NAME = ".lock"
+
+# Prefix of the temporary files of the atomic rewrites
+TEMP_PREFIX = ".tmp-"
+
+
+class LockManager():
+    """
+    Advisory directory locks and atomic file rewrites shared by a process."""
+
+    def __init__(self):
+
+        # Held locks: {lock path: {"thread": RLock, "fd": file descriptor, "count": depth}}
+        self.held = {}
+
+        # Protects the dictionary of the held locks
+        self.guard = threading.Lock()
+
+
+    # Lock file guarding a path
+    def lock_path(self, path):
+        """
+        ### Returns the lock file of the directory holding a file or a directory.
+
+        :param path (str): Path of the file (or directory) about to change.
+        """
+
+        return os.path.join(os.path.dirname(os.path.abspath(path)), LOCK_FILE_NAME)
+
+
+    # Take the lock of the operating system
+    def acquire(self, fd:int):
+        """
+        ### Blocks until the exclusive lock of an open lock file is taken.
+
+        :param fd (int): File descriptor of the lock file.
+        """
+
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+        elif msvcrt is not None:
+
+            # LK_LOCK gives up after 10 attempts, try again until it is taken
+            while True:
+
+                try:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    return None
+
+                except OSError:
+                    continue
+
+
+    # Release the lock of the operating system
+    def release(self, fd:int):
+        """
+        ### Releases the lock of an open lock file.
+
+        :param fd (int): File descriptor of the lock file.
+        """
+
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+        elif msvcrt is not None:
+
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+    # Lock the directory of a path
+    @contextlib.contextmanager
+    def lock(self, path):
+        """
+        ### Holds the exclusive lock of the directory of a path.
+
+        - Re-entrant: a thread holding the lock can take it again.
+        - A directory that does not exist (anymore) is not locked.
+
+        :param path (str): Path of the file (or directory) about to change.
+        """
+
+        lock_path = self.lock_path(path)
+
+        with self.guard:
+            entry = self.held.setdefault(lock_path, {"thread": threading.RLock(), "fd": None, "count": 0})
+
+        # One thread of this process at a time
+        with entry["thread"]:
+
+            if entry["count"] == 0:
+
+                try:
+                    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+
+                except FileNotFoundError:
+                    fd = None
+
+                if fd is not None:
+                    self.acquire(fd)
+
+                entry["fd"] = fd
+
+            entry["count"] += 1
+
+            try:
+                yield
+
+            finally:
+
+                entry["count"] -= 1
+
+                if entry["count"] == 0 and entry["fd"] is not None:
+
+                    self.release(entry["fd"])
+                    os.close(entry["fd"])
+
+                    entry["fd"] = None
+
+
+    # Rewrite a file atomically
+    @contextlib.contextmanager
+    def atomic_write(self, file_path, newline:str = "", mode:str = "w"):
+        """
+        ### Yields a file that replaces `file_path` when the block ends without error.
+
+        - The temporary file is created in the same directory (same file system)
+          and keeps the permissions of the replaced file.
+        - On error the temporary file is removed and the original is unchanged.
+
+        :param file_path (str): Path of the file to rewrite.
+        :param newline (str): Newline mode of the text file ("" for the csv module).
+        :param mode (str): "w" for a text file, "wb" for a binary file.
+        """
+
+        directory = os.path.dirname(os.path.abspath(file_path))
+
+        # Same extension as the target (".csv", ".idx", ".json", ".zip", ...)
+        suffix = os.path.splitext(file_path)[1]
+
+        fd, temp_path = tempfile.mkstemp(dir= directory, prefix= TEMP_PREFIX, suffix= suffix)
+
+        try:
+            with (os.fdopen(fd, mode) if "b" in mode else os.fdopen(fd, mode, newline= newline)) as f:
+                yield f
+
+            # Keep the permissions of the original file
+            if os.path.exists(file_path):
+                os.chmod(temp_path, os.stat(file_path).st_mode & 0o777)
+
+            else:
+                os.chmod(temp_path, 0o644)
+
+            os.replace(temp_path, file_path)
+
+        except BaseException:
+
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+            raise
+
+
+    # Append to a file under its lock
+    def append(self, file_path, data):
+        """
+        ### Appends text or bytes to a file with one write under the lock of its directory.
+
+        - The file is created if it is missing. Nothing is replaced, so this
+          costs one write instead of a rewrite.
+
+        :param file_path (str): Path of the file.
+        :param data (str or bytes): The data to append (text is UTF-8 encoded).
+
+        Returns:
+            int: Size of the file after the append.
+        """
+
+        data = data.encode("utf-8") if isinstance(data, str) else data
+
+        with self.lock(file_path):
+
+            fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+            try:
+                # A write may be partial, the rest follows
+                while data:
+                    data = data[os.write(fd, data):]
+
+                return os.fstat(fd).st_size
+
+            finally:
+                os.close(fd)
+
+
+# One lock table per process, shared by every executor
+LOCKS = LockManager()
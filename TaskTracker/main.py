@@ -2,23 +2,46 @@
 Task Data Tracker - Main Execution Entry Point.
 
 This script initializes the Command Line Interface (CLI) for the tracking program.
-It handles the main application loop, user input validation, and orchestrates 
-file system operations (Year/Task/Month creation) by invoking the Executor 
+It handles the main application loop, user input validation, and orchestrates
+file system operations (Year/Task/Month creation) by invoking the Executor
 and Generator classes.
+
+Without arguments the interactive menu starts. With arguments one command
+runs without prompts, for scripts and scheduled jobs:
+
+    python main.py year add 2026
+    python main.py year archive 2024
+    python main.py task add gym
+    python main.py month add Jan --task gym --header date,time --types date,duration
+    python main.py entry add 2026-01-05 1:30 --task gym
+    python main.py entry import entries.csv --task gym --month Jan
+    python main.py show --task gym --month Jan --from 10 --limit 20
+    python main.py delete --year 2026 --task gym --month Jan --row 3
+    python main.py report --year 2026
+    python main.py query "year=2026 task=gym month>=Mar where hours>1 select date,hours"
+    python main.py export all.csv.gz --years 2026:2027
+    python main.py serve
+    python main.py --profile report --year 2026
 """
 
+import argparse
+import contextlib
+import csv
+import json
 import os
+import sys
 import time
-import msvcrt
-import pandas as pd
-from manager import Executor
+from manager import Executor, SCHEMA_TYPES
 from generating import Generator
+from manifest import Manifest
+from profiling import PROFILER, PROFILE_ENABLED
+from terminal import Terminal
 
 
 # Short month names list for validation and creation
 MONTH_NAMES_LIST = [
-    'Jan', 'Feb', 'Mar', 'Apr', 
-    'May', 'Jun', 'Jul', 'Aug', 
+    'Jan', 'Feb', 'Mar', 'Apr',
+    'May', 'Jun', 'Jul', 'Aug',
     'Sep', 'Oct', 'Nov', 'Dec']
 
 
@@ -31,23 +54,17 @@ BASE_DIR = os.path.join ( USER_DIR,"Documents","TaskData")
 # Path of the existing years  tracker file
 YEARS_CSV = os.path.join(BASE_DIR, "years.csv")
 
-# Initialize helper calsses:
-
-# Folder/File generator
-generator = Generator()
-# Handling Executor
-executor = Executor()
+# Storage backend: "csv" (directories and CSV files) or "sqlite" (one database file)
+BACKEND = os.environ.get("TASK_TRACKER_BACKEND", "csv").strip().lower()
 
-# Generate a Base Directory
-generator.make_directory( BASE_DIR )
-# Create File Of Existing years
-generator.make_file( path= YEARS_CSV, header= ["years"] )
+# Screen of the menu (escape codes and native keypresses)
+TERMINAL = Terminal()
 
-# Clear screen terminal 
+# Clear screen terminal
 def clear_terminal():
     """
-    Clear the terminal screen based of the operating system."""
-    os.system("clear" if os.name == "posix" else "cls")
+    Clear the terminal screen (escape codes, no shell command)."""
+    TERMINAL.clear()
 
 
 # To pause the executions
@@ -83,14 +100,14 @@ def show_options():
     num = 0
     # Iterate through option groups
     for group in options:
-        
+
         # Iterate through specific options within the group.
         for option in group:
-            
+
             # Incresse 1 every itrate to num
             num += 1
-            
-            # View such option in the group 
+
+            # View such option in the group
             print(option)
 
         print("-----------------------------")
@@ -99,287 +116,986 @@ def show_options():
 
     return num # Return count of options
 
-# --- Main Execution Loop ---
 
-program_on = True
+# --- Storage Setup ---
 
-while program_on:
-    
-    # Reset screen for fresh menu view
-    clear_terminal()
+def make_backend(base_dir:str):
+    """
+    ### Creates the executor and the generator of the storage backend.
 
-    # Display menu and get total option count
-    options = show_options()
+    - Makes the base directory and the years tracker file if they are missing.
 
-    # Capture user input
-    get_choice = input(f"\n\nEnter your choice ( 1 - {options} ): ").strip()
+    :param base_dir (str): Path of the base folder.
 
-    clear_terminal()
+    Returns:
+    -------
+    tuple
+        (executor, generator)
+    """
 
-    # Ensure it si a digit and within range
-    if not get_choice.isdigit() or int(get_choice) > options or get_choice == "0":
+    if BACKEND == "sqlite":
 
-        print(f"\n\nInvalid entry: [ {get_choice} ]❗ Pelase enter ( 1 to {options} ).")
+        from database import Database, SQLiteExecutor, SQLiteGenerator
 
-    # Ensure base directroy exists ( unless creating year or existing)
-    elif not executor.count_dirs( BASE_DIR ) and int(get_choice) != 1 and int(get_choice) != 8:
+        # Single database file in the base folder
+        database = Database(base_dir)
 
-        print("\n\nEnter first the start year❗\n")
+        # Folder/File generator
+        generator = SQLiteGenerator(database)
+        # Handling Executor
+        executor = SQLiteExecutor(database)
 
     else:
 
-        # Conver valid choice to (int)
-        choice = int(get_choice)
+        # Folder/File generator
+        generator = Generator()
+        # Handling Executor
+        executor = Executor()
 
-        # Retrieve the most recently active year and setup paths
-        last_year = executor.get_latst_active_name(filepath= YEARS_CSV)
-        current_year = str(last_year)
+        # Index of the tree shared by both (directory counts, row counts)
+        executor.manifest = generator.manifest = Manifest(executor, base_dir)
 
-        # Path of the current year dir
-        year_dir = os.path.join(BASE_DIR,current_year)
+        # Archived years are read-only for both (see archive.py)
+        generator.archive_store = executor.archives()
 
-        # Path of the exist tasks file
-        tasks_csv = os.path.join(year_dir,"tasks.csv")
+    # Time the methods of both (see profiling.py)
+    if PROFILER.enabled:
 
-        # [ 1 ]
-        if choice == 1: # Create New Year Directory
+        PROFILER.instrument(executor)
+        PROFILER.instrument(generator)
 
-            # Get year to start 
-            year = executor.get_year(years_path= YEARS_CSV) 
+    # Generate a Base Directory
+    generator.make_directory( base_dir )
+    # Create File Of Existing years
+    generator.make_file( path= os.path.join(base_dir, "years.csv"), header= ["years"] )
 
-            # Check if year has string value
-            if isinstance(year, str):
+    return executor, generator
 
-                new_year = os.path.join(BASE_DIR, year)
-                tasks_report_csv = os.path.join(new_year, "tasks_report.csv")
-                tasks_csv = os.path.join(new_year, "tasks.csv")
 
-                # Create physical directories and tracker files
-                generator.make_directory(path= new_year)
-                generator.make_file(path= tasks_csv, header= ["tasks"])
-                generator.make_file(path= tasks_report_csv, header= ["task","months","days","hours","minutes"])
+# --- Creation Helpers (shared by the menu and the commands) ---
 
-                # Register the new year in the years tracker
-                executor.store_data(file_path= YEARS_CSV, data_list= [year])
+def create_year(executor, generator, base_dir:str, year:str):
+    """
+    ### Creates a year directory with its tracker files and registers it.
 
-                print("-" * 30)
-                print(f"\nYear directroy [ {year} ] is successful created into:\n")
-                print(f"- Directory: {BASE_DIR}")
+    :param base_dir (str): Path of the base folder.
+    :param year (str): A validated year name (see Executor.is_new_year()).
+    """
 
+    new_year = os.path.join(base_dir, year)
+    tasks_report_csv = os.path.join(new_year, "tasks_report.csv")
+    tasks_csv = os.path.join(new_year, "tasks.csv")
 
-        # [ 2 ]
-        elif choice == 2: # Create a Task Folder
+    # One manifest write for the whole year
+    with executor.track_batch():
 
-            # Prompt user and create task folder
-            folder_name = executor.get_folder_name( folder_names_csv= tasks_csv ) 
- 
-            # Check if the task name is returned
-            if isinstance(folder_name, str):
+        # Create physical directories and tracker files
+        generator.make_directory(path= new_year)
+        generator.make_file(path= tasks_csv, header= ["tasks"])
+        generator.make_file(path= tasks_report_csv, header= ["task","months","days","hours","minutes"])
+        executor.reports().mark(tasks_report_csv)
 
-                # Create directory paths safely
-                target_path = os.path.join(year_dir, folder_name)    
-                months_csv = os.path.join(year_dir, folder_name, "months.csv")
-                task_report = os.path.join(year_dir, folder_name, "task_report.csv")
+        # Register the new year in the years tracker
+        executor.store_data(file_path= os.path.join(base_dir, "years.csv"), data_list= [year])
 
-                # Execute creation and storage
-                generator.make_directory(path=target_path)
-                executor.store_data(file_path=tasks_csv, data_list=[folder_name])
-                
-                # Initialize month tracker and task report files
-                generator.make_file(path= months_csv, header= ["months"])
-                generator.make_file(path= task_report, header= ["month","days","hours","minutes"])
 
-                print(f"Success: Folder '{folder_name}' created.")
-                
+def create_task(executor, generator, year_dir:str, folder_name:str):
+    """
+    ### Creates a task directory with its tracker files and registers it.
 
-# BEFOR MAKING A NEW MONTH ANALIZE THE DATA OF THE CURRENT ONE AND ADD IT TO THE task_report.csv FILE
+    :param year_dir (str): Path of the year directory.
+    :param folder_name (str): A validated task name (see Executor.is_new_task()).
+    """
 
+    # Create directory paths safely
+    target_path = os.path.join(year_dir, folder_name)
+    months_csv = os.path.join(year_dir, folder_name, "months.csv")
+    task_report = os.path.join(year_dir, folder_name, "task_report.csv")
 
-        # [ 3 ]
-        elif choice == 3: # Create Month File
+    # One manifest write for the whole task
+    with executor.track_batch():
 
-            # Enuser tasks exist before adding months
-            if executor.read_csv(file_path= tasks_csv).empty:
+        # Execute creation and storage
+        generator.make_directory(path=target_path)
+        executor.store_data(file_path= os.path.join(year_dir, "tasks.csv"), data_list=[folder_name])
 
-                print(f"\n\nCreate First A Task❗ \n")
-                
-            # Show message to get choice of the view content
-            print("\n\nWhich Task Needs A New Month❓ ")
+        # Initialize month tracker and task report files
+        generator.make_file(path= months_csv, header= ["months"])
+        generator.make_file(path= task_report, header= ["month","days","hours","minutes"])
+        executor.reports().mark(task_report)
 
-            # Display Tasks Folder Names
-            print("=" * 30)
-            executor.print_formatted_csv_table(file_path= tasks_csv)
-            print("=" *30 )
 
-            # Get Task Name
-            folder_name = input("\nEnter task name from the top list:  ").strip().lower()
+def parse_header(entry:str):
+    """
+    ### Splits the comma separated header names of a fresh task.
 
-            clear_terminal()
+    :param entry (str): Header names separated by commas.
 
-            # Validate task existence
-            if not executor.is_exist(file_path= tasks_csv, name= folder_name):
+    Returns:
+    -------
+    list
+        The lower case names, or None if the entry is invalid.
+    """
 
-                print(f"\n\nTask [ {folder_name} ] is not found in the list❗\n")
+    # Check if is there a digit contains in the entry
+    if [num for num in entry if num.isdigit()]:
 
-                print("=" * 30)
-                executor.print_formatted_csv_table(file_path= tasks_csv)
-                print("=" *30 )
+        print("\n\nThe header can not contain digits.\n")
+        return None
+
+    # Split input by comma to sotre in the file
+    csv_headers = [name.strip().lower() for name in entry.split(',')]
+
+    # Check if the entry is empty
+    if not entry.strip() or not all(csv_headers):
+
+        print("\n\nThe header list can't be empty.\n")
+        return None
+
+    return csv_headers
+
+
+def create_month(executor, generator, task_dir:str, month:str, header:list = None, column_types:list = None):
+    """
+    ### Creates a month file in a task and registers it.
+
+    - The first month of a task uses the given header (and column types),
+      the next months copy the header of the last active month.
+
+    :param task_dir (str): Path of the task directory.
+    :param month (str): A validated month name (see Executor.is_new_month()).
+    :param header (list): Header names for the first month of the task.
+    :param column_types (list): Schema types of the header columns, or None.
+
+    Returns:
+    -------
+    list
+        The header of the new month file, or None if it was not created.
+    """
+
+    months_csv = os.path.join( task_dir, "months.csv" )
+
+    # Setup path of the new month
+    new_month = os.path.join( task_dir, f"{month}.csv" )
+
+    # Months exist -> Copy header from the previous month
+    if executor.read_registry(months_csv):
+
+        # Get an existing month name
+        last_month = executor.get_latst_active_name( months_csv )
+
+        # Reads only the header row
+        header = executor.read_header( os.path.join( task_dir, f"{last_month}.csv" ) )
+        column_types = None
 
-            else:
+    elif not header:
 
-                # Setup paths for the specific task
-                task_dir = os.path.join( BASE_DIR, current_year, folder_name )
-                months_csv =  os.path.join( task_dir, "months.csv" )
-                
-                # List To Store The Header Of The existing Month
-                csv_headers = []
+        print("\n\nThe header list can't be empty.\n")
+        return None
 
-                # Get user input for month name
-                month = executor.get_month_name(months_list= MONTH_NAMES_LIST, months_path= months_csv)
+    # One manifest write for the whole month
+    with executor.track_batch():
 
+        # Create the file and register it
+        generator.make_file(path= new_month, header= header)
+        executor.store_data(file_path= months_csv, data_list= [month])
 
-                if isinstance( month, str):
+        # Store the typed schema of the task next to months.csv
+        if column_types:
+            executor.write_schema(task_dir, header, column_types)
 
-                    # Setup path of the new month
-                    new_month = os.path.join( task_dir, f"{month}.csv" )
+    return header
 
-                    # CASE A: No months exist yet (Fresh Task) -> Ask for custom headers
-                    if executor.read_csv(months_csv).empty:     
 
-                        # Get Header For The New File
-                        print("\n\nWhich details should be included in the file (header)?")
+# --- Interactive Menu ---
 
-                        get_header = input("\n\nEnter header names separated by commas: ").strip()
+def run_menu(executor, generator, base_dir:str):
+    """
+    ### Runs the menu loop until the user exits.
+
+    :param base_dir (str): Path of the base folder.
+    """
+
+    # Path of the existing years tracker file
+    years_csv = os.path.join(base_dir, "years.csv")
+
+    program_on = True
+
+    while program_on:
+
+        # Reset screen for fresh menu view
+        clear_terminal()
+
+        # Display menu and get total option count
+        options = show_options()
+
+        # Capture user input
+        get_choice = input(f"\n\nEnter your choice ( 1 - {options} ): ").strip()
 
+        clear_terminal()
 
-                        # Check if is there a digit contains in the entry
-                        if [num for num in get_header if num.isdigit()]:
+        # Ensure it si a digit and within range
+        if not get_choice.isdigit() or int(get_choice) > options or get_choice == "0":
 
-                            print("\n\nThe header can not contain digits.\n")
-                                
-                        # Check if the entry is empty
-                        elif not get_header:
-                            print("\n\nThe header list can't be empty.\n")
+            print(f"\n\nInvalid entry: [ {get_choice} ]❗ Pelase enter ( 1 to {options} ).")
 
-                        # Split input by comma to sotre in the file
-                        csv_headers = [
-                            name.strip()
-                            for name in get_header.split(',') 
-                        ]
+        # Ensure base directroy exists ( unless creating year or existing)
+        elif not executor.count_dirs( base_dir ) and int(get_choice) != 1 and int(get_choice) != 8:
 
-                    # CASE B: Months exist -> Copy header from the previous month
-                    else:
+            print("\n\nEnter first the start year❗\n")
 
-                        # Get an existing month name
-                        last_month = executor.get_latst_active_name( months_csv )
+        else:
 
-                        exist_month = os.path.join( task_dir, f"{last_month}.csv" )
+            # Conver valid choice to (int)
+            choice = int(get_choice)
 
-                        # Read only header (neows=0)
-                        df = pd.read_csv( exist_month, nrows= 0) 
+            # Retrieve the most recently active year and setup paths
+            last_year = executor.get_latst_active_name(filepath= years_csv)
+            current_year = str(last_year)
 
-                        # Extend The Header to The List 
-                        csv_headers.extend( df.columns.to_list() )
-                        
+            # Path of the current year dir
+            year_dir = os.path.join(base_dir,current_year)
 
-                    # Create the file and register it
-                    header_clean = [name.lower() for name in csv_headers]
-                    generator.make_file(path= new_month, header= header_clean)
-                    executor.store_data(file_path= months_csv, data_list= [month])
+            # Path of the exist tasks file
+            tasks_csv = os.path.join(year_dir,"tasks.csv")
+
+            # Nothing can be added to an archived year (see archive.py)
+            if choice in (2, 3, 4) and executor.archives().locate(year_dir) is not None:
+
+                print(f"\n\nYear [ {current_year} ] is archived (read-only). Restore it first:\n")
+                print(f"- python main.py year restore {current_year}\n")
+
+            # [ 1 ]
+            elif choice == 1: # Create New Year Directory
+
+                # Get year to start
+                year = executor.get_year(years_path= years_csv)
+
+                # Check if year has string value
+                if isinstance(year, str):
+
+                    create_year(executor, generator, base_dir, year)
 
-                    print(f"With CSV Header Row: {csv_headers}")
                     print("-" * 30)
+                    print(f"\nYear directroy [ {year} ] is successful created into:\n")
+                    print(f"- Directory: {base_dir}")
+
+
+            # [ 2 ]
+            elif choice == 2: # Create a Task Folder
+
+                # Prompt user and create task folder
+                folder_name = executor.get_folder_name( folder_names_csv= tasks_csv )
 
-                    print(f"\nNew month file: [ {month} ] is successfuly created into:\n")
-                    print(f"- Directory: {task_dir}")
+                # Check if the task name is returned
+                if isinstance(folder_name, str):
 
+                    create_task(executor, generator, year_dir, folder_name)
 
-        # [ 4 ] 
-        elif choice == 4: # Add data
+                    print(f"Success: Folder '{folder_name}' created.")
 
-            # Ensuer the existin of tasks
-            if executor.read_csv(tasks_csv).empty:
-                
-                print("\n\nThere is no active tasks to add data.\n")
 
-            else:
- 
-                # Display Tasks
-                print("=" *30 )   
-                executor.print_formatted_csv_table(tasks_csv)
+    # BEFOR MAKING A NEW MONTH ANALIZE THE DATA OF THE CURRENT ONE AND ADD IT TO THE task_report.csv FILE
+
+
+            # [ 3 ]
+            elif choice == 3: # Create Month File
+
+                # Enuser tasks exist before adding months
+                if not executor.read_registry(file_path= tasks_csv):
+
+                    print(f"\n\nCreate First A Task❗ \n")
+
+                # Show message to get choice of the view content
+                print("\n\nWhich Task Needs A New Month❓ ")
+
+                # Display Tasks Folder Names
                 print("=" * 30)
-            
-                # Get number of task
-                task_idx = input("\nEnter Task Number:  ").strip()
+                executor.print_formatted_csv_table(file_path= tasks_csv)
+                print("=" *30 )
+
+                # Get Task Name
+                folder_name = input("\nEnter task name from the top list:  ").strip().lower()
 
                 clear_terminal()
 
-                # Validate entry if it is numeric
-                if executor.validate_inputs(entry= task_idx, entry_type= "int"):
-                    
-                    # Check Range validity
-                    if int(task_idx) > len(executor.read_csv(tasks_csv)) or int(task_idx) < 1:
-
-                        print(f"\n\nEntry: [ {task_idx} ] is out of range\n")
-
-                    else:
-                        
-                        # get the task name dir
-                        task_record = executor.read_csv(tasks_csv).iloc[ int(task_idx) -1 ]
-                        task_dir_name = task_record.iloc[0]
-
-                        # Setup Paths of the choiced task
-                        task_path = os.path.join( BASE_DIR, current_year, task_dir_name )
-                        months_csv = os.path.join( task_path, "months.csv")
-
-                        # validate if the months exist to add data into
-                        if not executor.read_csv(months_csv).empty:
-                            
-                            # breng the last active month file name
-                            month_name = executor.get_latst_active_name( months_csv )
-                            
-                            month_file_path = os.path.join( task_path, f"{month_name}.csv")
-                            
-                            # Trigger data entry workflow
-                            executor.get_data( file_path= month_file_path )
+                # Validate task existence
+                if not executor.is_exist(file_path= tasks_csv, name= folder_name):
+
+                    print(f"\n\nTask [ {folder_name} ] is not found in the list❗\n")
+
+                    print("=" * 30)
+                    executor.print_formatted_csv_table(file_path= tasks_csv)
+                    print("=" *30 )
+
+                else:
+
+                    # Setup paths for the specific task
+                    task_dir = os.path.join( base_dir, current_year, folder_name )
+                    months_csv =  os.path.join( task_dir, "months.csv" )
+
+                    # Header of a fresh task (next months copy the last one)
+                    csv_headers = None
+
+                    # Types of the header columns (only asked for a fresh task)
+                    column_types = None
+
+                    # Get user input for month name
+                    month = executor.get_month_name(months_list= MONTH_NAMES_LIST, months_path= months_csv)
+
+
+                    if isinstance( month, str):
+
+                        # CASE A: No months exist yet (Fresh Task) -> Ask for custom headers
+                        if not executor.read_registry(months_csv):
+
+                            # Get Header For The New File
+                            print("\n\nWhich details should be included in the file (header)?")
+
+                            get_header = input("\n\nEnter header names separated by commas: ").strip()
+
+                            csv_headers = parse_header(get_header)
+
+                            if csv_headers:
+
+                                # Get the type of every column for the task schema
+                                print(f"\n\nColumn types: {', '.join(SCHEMA_TYPES)} (durations as H:MM, dates as YYYY-MM-DD)")
+
+                                get_types = input("\n\nEnter a type for every column separated by commas (empty = detect from entries): ").strip()
+
+                                if get_types:
+                                    column_types = executor.parse_schema_types(get_types, csv_headers)
+
+                        # CASE B: Months exist -> create_month() copies the header of the previous month
+                        header_clean = create_month(executor, generator, task_dir, month, csv_headers, column_types)
+
+                        if header_clean:
+
+                            print(f"With CSV Header Row: {header_clean}")
+                            print("-" * 30)
+
+                            print(f"\nNew month file: [ {month} ] is successfuly created into:\n")
+                            print(f"- Directory: {task_dir}")
+
+
+            # [ 4 ]
+            elif choice == 4: # Add data
+
+                # List of the task names
+                tasks_list = executor.read_registry(tasks_csv)
+
+                # Ensuer the existin of tasks
+                if not tasks_list:
+
+                    print("\n\nThere is no active tasks to add data.\n")
+
+                else:
+
+                    # Display Tasks
+                    print("=" *30 )
+                    executor.print_formatted_csv_table(tasks_csv)
+                    print("=" * 30)
+
+                    # Get number of task
+                    task_idx = input("\nEnter Task Number:  ").strip()
+
+                    clear_terminal()
+
+                    # Validate entry if it is numeric
+                    if executor.validate_inputs(entry= task_idx, entry_type= "int"):
+
+                        # Check Range validity
+                        if int(task_idx) > len(tasks_list) or int(task_idx) < 1:
+
+                            print(f"\n\nEntry: [ {task_idx} ] is out of range\n")
 
                         else:
-                            print("\n\nNo Active Months To Add Data❗Please Add First A Month\n")
-          
 
-        # [ 5 ]
-        elif choice == 5: # Display Content
-            
-            # Trigger data displaying workflow
-            executor.navigate_and_display_data(BASE_DIR)
+                            # get the task name dir
+                            task_dir_name = tasks_list[ int(task_idx) -1 ]
+
+                            # Setup Paths of the choiced task
+                            task_path = os.path.join( base_dir, current_year, task_dir_name )
+                            months_csv = os.path.join( task_path, "months.csv")
+
+                            # validate if the months exist to add data into
+                            if executor.read_registry(months_csv):
+
+                                # breng the last active month file name
+                                month_name = executor.get_latst_active_name( months_csv )
+
+                                month_file_path = os.path.join( task_path, f"{month_name}.csv")
+
+                                # Single entry or import of many entries
+                                print(f"\n\nAdd data to [ {task_dir_name} / {month_name} ]:\n")
+                                print("1. Enter a single entry")
+                                print("2. Import entries from a CSV/JSONL file")
+                                print("-" * 30)
+
+                                add_choice = input("\n\nEnter a choice number: ").strip()
+
+                                clear_terminal()
+
+                                if add_choice == "2":
+
+                                    source = input("\nEnter the path of the file to import:  ").strip().strip('"')
+
+                                    # Trigger bulk import workflow
+                                    if os.path.isfile(source):
+                                        executor.import_entries( file_path= month_file_path, source= source )
+
+                                    else:
+                                        print(f"\n\nFile [ {source} ] is not found❗\n")
+
+                                else:
+
+                                    # Trigger data entry workflow
+                                    executor.get_data( file_path= month_file_path )
+
+                            else:
+                                print("\n\nNo Active Months To Add Data❗Please Add First A Month\n")
+
+
+            # [ 5 ]
+            elif choice == 5: # Display Content
+
+                # Trigger data displaying workflow
+                executor.navigate_and_display_data(base_dir)
+
+
+            # [ 6 ]
+            elif choice == 6: # Delete content
+
+                # Trigger Deletion Data Workflow
+                executor.remove_data(main_dir= base_dir)
+
+
+            # [ 7 ]
+            elif choice == 7: # Analyze data
+
+                # Aggregate the active year and write its report files
+                executor.reports().print_year_report(year_dir)
+
+            # [ 8 ]
+            elif choice == 8: # Exit !!
+
+                program_on = False
+
+
+        # Pause until any key is pressed
+        if get_choice != "8":
+
+            print("\n" + "="*40)
+            print("  👉 Press ANY KEY to return to menu...❗")
+            print("="*40)
+
+            # Wait for a single keypress
+            TERMINAL.getch()
+
+
+# --- Commands (no prompts) ---
+
+def build_parser():
+    """
+    ### Builds the parser of the non-interactive commands.
+
+    Returns:
+    -------
+    argparse.ArgumentParser
+    """
+
+    parser = argparse.ArgumentParser(description= "Task Data Tracker commands (no prompts).")
+    parser.add_argument("--base-dir", default= BASE_DIR, help= "Base directory of the data tree.")
+    parser.add_argument("--profile", action= "store_true", help= "Profile the operations, summary at exit (see profiling.py).")
+
+    commands = parser.add_subparsers(dest= "command", required= True)
+
+    # Options selecting a place in the tree
+    def add_place(command, task:bool = False, month:bool = False):
+
+        command.add_argument("--year", help= "Year name (default: the last active year).")
+
+        if task:
+            command.add_argument("--task", required= True, help= "Task name.")
+
+        if month:
+            command.add_argument("--month", help= "Month name (default: the last active month).")
+
+    # year add
+    year = commands.add_parser("year", help= "Manage years.").add_subparsers(dest= "action", required= True)
+    year_add = year.add_parser("add", help= "Create a year.")
+    year_add.add_argument("name", help= "The year, e.g. 2026.")
+
+    year_archive = year.add_parser("archive", help= "Pack a closed year into one compressed file, read-only (see archive.py).")
+    year_archive.add_argument("name", help= "The year, e.g. 2024.")
+
+    year_restore = year.add_parser("restore", help= "Unpack an archived year to make it writable again.")
+    year_restore.add_argument("name", help= "The year, e.g. 2024.")
+
+    # task add
+    task = commands.add_parser("task", help= "Manage tasks.").add_subparsers(dest= "action", required= True)
+    task_add = task.add_parser("add", help= "Create a task in a year.")
+    task_add.add_argument("name", help= "The task name.")
+    add_place(task_add)
+
+    # month add
+    month = commands.add_parser("month", help= "Manage months.").add_subparsers(dest= "action", required= True)
+    month_add = month.add_parser("add", help= "Create a month file in a task.")
+    month_add.add_argument("name", help= "The month name, e.g. Jan.")
+    month_add.add_argument("--header", help= "Column names separated by commas (first month of a task only).")
+    month_add.add_argument("--types", help= f"Column types separated by commas: {', '.join(SCHEMA_TYPES)}.")
+    add_place(month_add, task= True)
+
+    # entry add / entry import
+    entry = commands.add_parser("entry", help= "Add entries to a month.").add_subparsers(dest= "action", required= True)
+    entry_add = entry.add_parser("add", help= "Add one row, one value per column.")
+    entry_add.add_argument("values", nargs= "+", help= "The values of the row.")
+    add_place(entry_add, task= True, month= True)
+
+    entry_import = entry.add_parser("import", help= "Import rows from a CSV/JSONL file ('-' for stdin).")
+    entry_import.add_argument("source", help= "Path of the file to import.")
+    add_place(entry_import, task= True, month= True)
+
+    # show
+    show = commands.add_parser("show", help= "Print years, tasks, months or the rows of a month.")
+    show.add_argument("--year", help= "Year name.")
+    show.add_argument("--task", help= "Task name.")
+    show.add_argument("--month", help= "Month name.")
+    show.add_argument("--from", dest= "start", type= int, default= 1, help= "First row number of a month (1-based).")
+    show.add_argument("--limit", type= int, help= "Number of rows of a month (default: all).")
+
+    # delete
+    delete = commands.add_parser("delete", help= "Delete a year, a task, a month or one row (the deepest given).")
+    delete.add_argument("--year", required= True, help= "Year name.")
+    delete.add_argument("--task", help= "Task name.")
+    delete.add_argument("--month", help= "Month name.")
+    delete.add_argument("--row", type= int, help= "1-based row number in the month.")
+
+    # report
+    report = commands.add_parser("report", help= "Print the report of a year.")
+    report.add_argument("--year", help= "Year name (default: the last active year).")
+    report.add_argument("--rebuild", action= "store_true", help= "Recompute the report from the month files.")
+
+    # query
+    query = commands.add_parser("query", help= "Search the rows of many months (see query.py).")
+    query.add_argument("text", help= "e.g. \"year=2026 task=gym month>=Mar where hours>1 select date,hours\"")
+    query.add_argument("--format", choices= ("csv", "jsonl"), default= "csv", help= "Output format of the rows.")
+    query.add_argument("--explain", action= "store_true", help= "Only print the month files and columns to read.")
+
+    # export
+    export = commands.add_parser("export", help= "Stream every row of the tree into one CSV/JSONL file (see export.py).")
+    export.add_argument("output", help= "Path of the file, '-' for the standard output.")
+    export.add_argument("--format", choices= ("csv", "jsonl"), help= "Output format (default: jsonl for .jsonl[.gz] names, otherwise csv).")
+    export.add_argument("--gzip", action= "store_true", help= "Compress the output (default for .gz names).")
+    export.add_argument("--years", help= "Range of years, both ends included: 2026, 2026:2027, 2026: or :2027.")
+    export.add_argument("--tasks", help= "Range of task names, e.g. a:m or gym.")
+
+    # serve
+    serve = commands.add_parser("serve", help= "Run the ingest daemon on a Unix socket (see daemon.py).")
+    serve.add_argument("--socket", help= "Path of the socket (default: <base-dir>/ingest.sock).")
+    serve.add_argument("--interval", type= float, default= 10, help= "Milliseconds between two group commits.")
+    serve.add_argument("--batch", type= int, default= 1000, help= "Waiting entries that trigger a commit right away.")
+    serve.add_argument("--no-fsync", action= "store_true", help= "Do not force the batches to the disk.")
+
+    return parser
+
+
+def resolve_path(executor, base_dir:str, year:str = None, task:str = None, month:str = None):
+    """
+    ### Checks that the given year, task and month are registered and returns their path.
+
+    - A missing year defaults to the last active year.
+
+    :param base_dir (str): Path of the base folder.
+
+    Returns:
+    -------
+    str
+        The path of the deepest given level, or None if a name is not registered.
+    """
+
+    years_csv = os.path.join(base_dir, "years.csv")
+
+    # The last active year by default
+    year = year or executor.get_latst_active_name(years_csv)
+
+    if not year or not executor.is_exist(years_csv, year):
+
+        print(f"\n\nYear [ {year} ] is not found❗\n", file= sys.stderr)
+        return None
+
+    path = os.path.join(base_dir, year)
+
+    if task is None:
+        return path
+
+    if not executor.is_exist(os.path.join(path, "tasks.csv"), task.lower()):
+
+        print(f"\n\nTask [ {task} ] is not found❗\n", file= sys.stderr)
+        return None
+
+    path = os.path.join(path, task.lower())
+
+    if month is None:
+        return path
+
+    return active_month(executor, path, month)
+
+
+def active_month(executor, task_dir:str, month:str = None):
+    """
+    ### Returns the path of a month file of a task, the last active month by default.
+
+    :param task_dir (str): Path of the task directory.
+    :param month (str): Month name, or None.
+
+    Returns:
+    -------
+    str
+        The path of the month file, or None if the month is not registered.
+    """
+
+    months_csv = os.path.join(task_dir, "months.csv")
+
+    month = (month or executor.get_latst_active_name(months_csv) or "").capitalize()
+
+    if not month or not executor.is_exist(months_csv, month):
+
+        print(f"\n\nMonth [ {month} ] is not found❗ Please add first a month.\n", file= sys.stderr)
+        return None
+
+    return os.path.join(task_dir, f"{month}.csv")
+
+
+def run_command(executor, generator, args):
+    """
+    ### Runs one parsed command.
+
+    Returns:
+    -------
+    int
+        The exit status: 0 on success, 1 otherwise.
+    """
+
+    base_dir = args.base_dir
+    years_csv = os.path.join(base_dir, "years.csv")
+
+    if args.command == "year" and args.action in ("archive", "restore"):
+
+        if BACKEND == "sqlite":
+
+            print("\n\nArchives are only available for the CSV backend❗\n", file= sys.stderr)
+            return 1
+
+        year_dir = resolve_path(executor, base_dir, args.name)
+
+        if year_dir is None:
+            return 1
+
+        try:
+            if args.action == "restore":
+
+                print(f"Restored: {executor.archives().restore(year_dir)}")
+                return 0
+
+            packed = executor.archives().pack(year_dir)
+
+        except (OSError, RuntimeError) as error:
+
+            print(f"\n\n{error}❗\n", file= sys.stderr)
+            return 1
+
+        print(
+            f"Archived: {packed['path']} ({packed['files']} file(s), "
+            f"{packed['size'] / 1024:.1f} KB -> {packed['archive_size'] / 1024:.1f} KB)"
+        )
+
+        return 0
+
+    if args.command == "year":
+
+        if not executor.is_new_year(args.name, years_csv):
+            return 1
+
+        create_year(executor, generator, base_dir, args.name)
+        return 0
+
+    if args.command == "task":
+
+        year_dir = resolve_path(executor, base_dir, args.year)
+        name = args.name.strip().lower()
+
+        if year_dir is None or not executor.is_new_task(name, os.path.join(year_dir, "tasks.csv")):
+            return 1
+
+        create_task(executor, generator, year_dir, name)
+        return 0
+
+    if args.command == "month":
+
+        task_dir = resolve_path(executor, base_dir, args.year, args.task)
+        name = args.name.strip().capitalize()
+
+        if task_dir is None or not executor.is_new_month(name, MONTH_NAMES_LIST, os.path.join(task_dir, "months.csv")):
+            return 1
+
+        header = None
+        column_types = None
+
+        # Header and types only matter for the first month of a task
+        if args.header and not executor.read_registry(os.path.join(task_dir, "months.csv")):
+
+            header = parse_header(args.header)
+
+            if header is None:
+                return 1
+
+            if args.types:
+
+                column_types = executor.parse_schema_types(args.types, header)
+
+                if column_types is None:
+                    return 1
+
+        return 0 if create_month(executor, generator, task_dir, name, header, column_types) else 1
+
+    if args.command == "entry":
+
+        task_dir = resolve_path(executor, base_dir, args.year, args.task)
+        month_path = active_month(executor, task_dir, args.month) if task_dir else None
+
+        if month_path is None:
+            return 1
+
+        if args.action == "import":
+
+            if args.source != "-" and not os.path.isfile(args.source):
+
+                print(f"\n\nFile [ {args.source} ] is not found❗\n", file= sys.stderr)
+                return 1
+
+            executor.import_entries(file_path= month_path, source= args.source)
+            return 0
+
+        row = executor.build_row(month_path, args.values)
+
+        if row is None:
+            return 1
+
+        executor.store_data(file_path= month_path, data_list= row)
+        return 0
+
+    if args.command == "show":
+
+        # Years tracker without any name
+        if not args.year and not args.task:
+
+            executor.print_registry_table(years_csv)
+            return 0
+
+        path = resolve_path(executor, base_dir, args.year, args.task, args.month)
+
+        if path is None:
+            return 1
+
+        # Tracker of the deepest given level
+        if not args.month:
+
+            tracker = "months.csv" if args.task else "tasks.csv"
+            executor.print_registry_table(os.path.join(path, tracker))
+            return 0
+
+        # Rows of a month, only the asked slice is read
+        start = max(args.start, 1) - 1
+        count = args.limit if args.limit is not None else executor.count_rows(path)
+
+        header, rows, total = executor.read_page(path, start, count)
+
+        print(",".join(header) + ":")
+
+        if rows:
+            print("\n".join(executor.format_rows(rows, start= start + 1)))
+
+        return 0
+
+    if args.command == "delete":
+
+        path = resolve_path(executor, base_dir, args.year, args.task, args.month)
+
+        if path is None:
+            return 1
+
+        # One row of a month
+        if args.row is not None:
+
+            if not args.month:
+
+                print("\n\nA row needs a --month❗\n", file= sys.stderr)
+                return 1
+
+            file_len = executor.count_rows(path)
+
+            # Validate Range Validity
+            if args.row > file_len or args.row < 1:
+
+                print(f"\n\nEntry [ {args.row} ] is out of range. Valid range is 1 to {file_len}.\n", file= sys.stderr)
+                return 1
+
+            print(f"Data: {executor.delete_row(path, args.row)}")
+            return 0
+
+        # Delete the name from the tracker of its level, then its path
+        if args.month:
+            tracker, name = os.path.join(os.path.dirname(path), "months.csv"), args.month.capitalize()
+
+        elif args.task:
+            tracker, name = os.path.join(os.path.dirname(path), "tasks.csv"), args.task.lower()
+
+        else:
+            tracker, name = years_csv, args.year
+
+        executor.delete_registry_name(tracker, name)
+        executor.remove_path(path)
+
+        print(f"Deleted: {path}")
+        return 0
+
+    if args.command == "report":
+
+        year_dir = resolve_path(executor, base_dir, args.year)
+
+        if year_dir is None:
+            return 1
+
+        executor.reports().print_year_report(year_dir, rebuild= args.rebuild)
+        return 0
+
+    if args.command == "query":
+
+        from query import QueryEngine
+
+        engine = QueryEngine(executor, base_dir, MONTH_NAMES_LIST)
+        query = engine.parse(args.text)
+
+        steps = engine.plan(query) if query is not None else None
+
+        if steps is None:
+            return 1
+
+        # The plan only, nothing is read
+        if args.explain:
+
+            for step in steps:
+                print(f"{step['path']}: {','.join(step['columns'])}")
+
+            return 0
+
+        writer = csv.writer(sys.stdout, lineterminator= "\n")
+        columns = None
+
+        for row in engine.run(query, steps):
+
+            if args.format == "jsonl":
+
+                print(json.dumps(row))
+                continue
+
+            # A header line whenever the columns change (tasks differ without select)
+            if list(row) != columns:
+
+                columns = list(row)
+                writer.writerow(columns)
+
+            writer.writerow(row.values())
+
+        return 0
+
+    if args.command == "export":
+
+        from export import Exporter
+
+        exporter = Exporter(executor, base_dir)
+        name = args.output.lower()
+
+        # Format and compression follow the file name unless given
+        compress = args.gzip or name.endswith(".gz")
+        file_format = args.format or ("jsonl" if name.removesuffix(".gz").endswith(".jsonl") else "csv")
+
+        exported = exporter.export(
+            args.output, file_format, compress,
+            years= exporter.parse_range(args.years), tasks= exporter.parse_range(args.tasks)
+        )
+
+        print(f"Exported: {exported['rows']} row(s) of {exported['months']} month(s) to {args.output}", file= sys.stderr)
+        return 0
+
+    if args.command == "serve":
+
+        from daemon import IngestServer
+
+        IngestServer(
+            executor, base_dir, socket_path= args.socket, flush_interval= args.interval / 1000,
+            max_batch= args.batch, fsync= not args.no_fsync
+        ).run()
+
+        return 0
+
+    return 1
+
+
+# --- Main Execution ---
+
+def main(argv:list = None):
+    """
+    ### Runs one command if arguments are given, otherwise the interactive menu.
+
+    - Guarded by `__name__ == "__main__"`, so worker processes (reporting) that
+      import this module do not start the menu.
+
+    :param argv (list): Command line arguments (default: sys.argv[1:]).
+
+    Returns:
+    -------
+    int
+        The exit status.
+    """
+
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Profiling also works for the menu (python main.py --profile)
+    if PROFILE_ENABLED or "--profile" in argv:
+
+        PROFILER.enable()
+        argv = [arg for arg in argv if arg != "--profile"]
 
+    # Interactive menu without arguments
+    if not argv:
 
-        # [ 6 ]
-        elif choice == 6: # Delete content      
+        executor, generator = make_backend(BASE_DIR)
+        run_menu(executor, generator, BASE_DIR)
+        return 0
 
-            # Trigger Deletion Data Workflow
-            executor.remove_data(main_dir= BASE_DIR)
+    args = build_parser().parse_args(argv)
 
+    executor, generator = make_backend(args.base_dir)
 
-        # [ 8 ] 
-        elif choice == 7: # Analyze data
+    # One manifest write per command (the daemon writes one per group commit)
+    batch = executor.track_batch() if args.command != "serve" else contextlib.nullcontext()
 
-            pass
-            
-        # [ 9 ]
-        elif choice == 8: # Exit !!
+    # Writes into an archived year are refused (see archive.py)
+    try:
+        with batch:
+            return run_command(executor, generator, args)
 
-            program_on = False
+    except PermissionError as error:
 
+        print(f"\n\n{error}❗\n", file= sys.stderr)
+        return 1
 
-    # Pause until any key is pressed
-    if get_choice != "8":
 
-        print("\n" + "="*40)
-        print("  👉 Press ANY KEY to return to menu...❗")
-        print("="*40)
+if __name__ == "__main__":
 
-        msvcrt.getch()  # Wait for a single keypress
+    sys.exit(main())
 
 
 # ==========================================
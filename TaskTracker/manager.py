@@ -9,11 +9,81 @@ This module contains the `Executor` class, which handles the core logic for:
 4. Data deletion and display workflows.
 """
 
+import contextlib
 import csv
+import io
+import json
+import locale
 import os
+import re
 import shutil
-import pandas
+import sys
 from pathlib import Path
+from locking import LOCKS
+from rowindex import RowIndex, INDEX_SUFFIX
+from terminal import Terminal
+
+
+# One-column tracker files, read with the (csv) module instead of pandas
+REGISTRY_FILES = ("years.csv", "tasks.csv", "months.csv")
+
+# Report files kept next to the trackers (see reporting.py)
+REPORT_FILES = ("tasks_report.csv", "task_report.csv")
+
+# Sidecar log of the running total changes of a report file (<report>.csv.log)
+REPORT_LOG_SUFFIX = ".log"
+
+# Typed schema of a task, next to months.csv (column -> type)
+SCHEMA_FILE = "schema.csv"
+
+# Sidecar log of the deleted rows of a month file (<Month>.csv.tomb)
+TOMBSTONE_SUFFIX = ".tomb"
+
+# Number of deleted rows that triggers the rewrite of a month file
+COMPACT_THRESHOLD = 100
+
+# Month files are read from their columnar snapshot (see snapshot.py)
+USE_SNAPSHOTS = os.environ.get("TASK_TRACKER_SNAPSHOTS", "1") != "0"
+
+# Number of rows read at once when a month file is processed in chunks
+CHUNK_SIZE = 10000
+
+# Number of rows shown on one page of a month file
+PAGE_SIZE = int(os.environ.get("TASK_TRACKER_PAGE_SIZE", "20"))
+
+# Durations: "H:MM" or "MM"
+DURATION_PATTERN = re.compile(r"(?:(\d+):)?(\d+)")
+
+# Dates: "YYYY-MM-DD" or "D/M/YYYY" (also with "." or "-")
+DATE_PATTERN = re.compile(r"\d{4}-\d{1,2}-\d{1,2}|\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}")
+
+# Accepted characters of every entry type (see validate_inputs)
+ENTRY_PATTERNS = {
+    "int": re.compile(r"[\d. -]+"),
+    "time": re.compile(r"[\d:]+"),
+    "str": re.compile(r"[\w @.]+"),
+    "duration": DURATION_PATTERN,
+    "date": DATE_PATTERN
+}
+
+# Error messages of the invalid entries of every type
+ENTRY_ERRORS = {
+    "int": "Invalid Entry [ {char} ]. Only digits are accepted",
+    "time": "Invalid duration: [ {entry} ]❗ Use format H:MM or MM",
+    "str": "Invalid entry: [ {entry} ]❗ Only characters accepted.",
+    "duration": "Invalid duration: [ {entry} ]❗ Use format H:MM or MM",
+    "date": "Invalid date: [ {entry} ]❗ Use format YYYY-MM-DD"
+}
+
+
+# Column types of a task schema and the entry type validating them
+SCHEMA_TYPES = {
+    "int": "int",
+    "duration": "duration",
+    "string": "str",
+    "date": "date"
+}
+
 
 class Executor():
     """
@@ -25,12 +95,36 @@ class Executor():
         # Default starting year for suggestions
         self.default_year = 2026
 
+        # Parsed tracker files: {path: {"stamp": (mtime, size), "names": list, "index": set}}
+        self.registry_cache = {}
+
+        # Keeps the report files up to date (created on first use)
+        self.reporter = None
+
+        # Columnar snapshots of the month files (created on first use)
+        self.snapshot_store = None
+
+        # Screen drawing and keypresses
+        self.terminal = Terminal()
+
+        # Directory locks and atomic rewrites (shared by the whole process)
+        self.locks = LOCKS
+
+        # Sidecar row offsets of the month files (created on first use)
+        self.index_store = None
+
+        # Archived years read on demand (created on first use)
+        self.archive_store = None
+
+        # Index of the tree (manifest.py), set up by main.make_backend()
+        self.manifest = None
+
     # Clear screen terminal 
     def clear_terminal(self):
         """
-        Clears the terminal screen based on the operating system."""
+        Clears the terminal screen (escape codes, no shell command)."""
 
-        os.system("clear" if os.name == "posix" else "cls")
+        self.terminal.clear()
 
 
     # Read CSV files
@@ -47,10 +141,538 @@ class Executor():
             A DataFrame containing all rows and columns from the CSV file.
             All values are read as strings (dtype=str) to prevent unwanted
             type conversion, and no rows are skipped (skiprows=0).
+            Rows deleted in the tombstone log are left out.
+        """
+
+        return self.read_month(file_path).reset_index(drop= True)
+
+
+    # Read a month file with the positions of its rows in the file
+    def read_month(self, file_path, use_snapshot:bool = True):
+        """
+        ### Reads a month file without its deleted rows.
+
+        - Served from the columnar snapshot of the file when possible.
+
+        :param file_path (str): The full path to the month CSV file.
+        :param use_snapshot (bool): Allow reading (and rebuilding) the snapshot.
+
+        Retruns
+        ------
+        pandas.DataFrame
+            The live rows, indexed by their 0-based position in the file.
+        """
+
+        # A month of an archived year has no snapshot
+        if use_snapshot and USE_SNAPSHOTS and os.path.exists(file_path):
+
+            data = self.snapshots().read_frame(file_path)
+
+            if data is not None:
+                return data
+
+        # Imported lazily, only month files need a DataFrame
+        import pandas
+
+        with self.open_text(file_path) as f:
+            data = pandas.read_csv(f, dtype= str, skiprows= 0)
+
+        # Honour the deleted rows of the tombstone log
+        tombstones = self.read_tombstones(file_path)
+
+        if tombstones:
+            data = data.drop(index= [num for num in tombstones if num in data.index])
+
+        return data
+
+
+    # Read a month file in parts
+    def read_month_chunks(self, file_path, chunk_size:int = CHUNK_SIZE, usecols:list = None):
+        """
+        ### Yields the live rows of a month file in chunks of DataFrames.
+
+        :param file_path (str): The full path to the month CSV file.
+        :param chunk_size (int): Number of rows of every chunk.
+        :param usecols (list): Only parse these columns (all columns if None).
+
+        Yields
+        ------
+        pandas.DataFrame
+            Rows of the file (all values as strings), indexed by their position in the file.
+        """
+
+        import pandas
+
+        tombstones = self.read_tombstones(file_path)
+
+        with self.open_text(file_path) as f:
+
+            for chunk in pandas.read_csv(f, dtype= str, chunksize= chunk_size, usecols= usecols):
+
+                # Honour the deleted rows of the tombstone log
+                if tombstones:
+                    chunk = chunk.drop(index= [num for num in chunk.index if num in tombstones])
+
+                yield chunk
+
+
+    # Open a file of the tree for reading
+    def open_text(self, file_path):
+        """
+        ### Opens a CSV file for reading as text (newline="" for the csv module).
+
+        - A file of an archived year is read from its archive (see archive.py),
+          only that member is decompressed.
+
+        :param file_path (str): The full path to the file.
+
+        Returns
+        -------
+        A text stream, to be closed by the caller.
+        """
+
+        try:
+            return open(file_path, "r", newline= "")
+
+        except FileNotFoundError:
+
+            stream = self.archives().open(file_path)
+
+            if stream is None:
+                raise
+
+            return stream
+
+
+    # Archived years
+    def archives(self):
+        """
+        ### Returns the `ArchiveStore` packing and reading the archived years.
+
+        - Imported lazily, archive.py imports this module.
+        """
+
+        if self.archive_store is None:
+
+            from archive import ArchiveStore
+
+            self.archive_store = ArchiveStore(self)
+
+        return self.archive_store
+
+
+    # Sidecar row offsets of the month files
+    def row_index(self):
+        """
+        ### Returns the `RowIndex` keeping the `.idx` files of the month files.
+        """
+
+        if self.index_store is None:
+            self.index_store = RowIndex(self)
+
+        return self.index_store
+
+
+    # File position of a live row
+    def row_position(self, file_path, start:int, rows:int = None):
+        """
+        ### Converts a 0-based live row number into its position in the file.
+
+        :param file_path (str): The full path to the month CSV file.
+        :param start (int): 0-based number of the live row.
+        :param rows (int): Rows in the file, deleted ones included (read from the index if None).
+
+        Returns
+        -------
+        tuple
+            (position of the row in the file, sorted positions of the deleted rows)
+        """
+
+        rows = self.row_index().rows(file_path) if rows is None else rows
+        tombstones = sorted(num for num in self.read_tombstones(file_path) if num < rows)
+
+        position = start
+
+        # Every deleted row before it shifts the position
+        for num in tombstones:
+
+            if num <= position:
+                position += 1
+            else:
+                break
+
+        return position, tombstones
+
+
+    # Read one page of a month file
+    def read_page(self, file_path, start:int, count:int):
+        """
+        ### Reads a slice of the live rows of a month file without loading the whole file.
+
+        - Served from the columnar snapshot when it is up to date, otherwise
+          parsed with the (csv) module from the offset of the first row (see rowindex.py).
+        - Rows deleted in the tombstone log are left out.
+        - A month of an archived year is decompressed from its start up to the
+          last row of the slice, its row count comes from the archive.
+
+        :param file_path (str): The full path to the month CSV file.
+        :param start (int): 0-based number of the first live row.
+        :param count (int): Maximum number of rows.
+
+        Returns
+        -------
+        tuple
+            (header list, list of rows (lists of strings), number of live rows in the file)
         """
-        return pandas.read_csv(file_path, dtype= str, skiprows= 0)
+
+        header = self.read_header(file_path)
+
+        # A fresh snapshot is never rebuilt here, it needs the whole file
+        if USE_SNAPSHOTS:
+
+            store = self.snapshots()
+            meta = store.read_meta(file_path)
+
+            # Another process may be rebuilding the snapshot, the CSV is read instead
+            if meta is not None:
+
+                try:
+                    return header, store.read_rows(file_path, meta, start, start + count), meta["rows"]
+
+                except (OSError, ValueError):
+                    pass
+
+        # Rows of an archived month (compacted, no tombstones)
+        archived = self.archives().rows(file_path)
+
+        if archived is None:
+
+            index = self.row_index()
+            file_rows = index.rows(file_path)
+
+            # File position of the first live row
+            position, tombstones = self.row_position(file_path, start, file_rows)
+
+        else:
+            file_rows, position, tombstones = archived, start, []
+
+        total = file_rows - len(tombstones)
+
+        rows = []
+
+        if count <= 0 or position >= file_rows:
+            return header, rows, total
+
+        current = position
+        dead = set(tombstones)
+
+        if archived is None:
+
+            raw = open(file_path, "rb")
+            raw.seek(index.offset(file_path, position))
+
+            stream = io.TextIOWrapper(raw, newline= "")
+
+        else:
+
+            # Read from the header (row -1), the rows before the slice are skipped
+            stream = self.open_text(file_path)
+            current = -1
+
+        with stream as f:
+
+            for row in csv.reader(f):
+
+                # Blank lines are not rows
+                if not row:
+                    continue
+
+                if current >= position and current not in dead:
+
+                    # Short rows are padded like pandas does
+                    rows.append(row + [""] * (len(header) - len(row)))
+
+                    if len(rows) == count:
+                        break
+
+                current += 1
+
+        return header, rows, total
+
+
+    # Write a whole table to a CSV file
+    def write_table(self, file_path, header:list, rows:list):
+        """
+        ### Overwrites a CSV file with a header and rows (used by the reports).
+
+        - Written to a temporary file and moved over the old one (see locking.py).
+
+        :param file_path (str): The full path to the CSV file.
+        :param header (list): The header row of the file.
+        :param rows (list): List of rows, every row is a list of values.
+        """
+
+        self.archives().check_writable(file_path)
+
+        with self.locks.lock(file_path), self.locks.atomic_write(file_path) as f:
+
+            writer = csv.writer(f)
+
+            writer.writerow(header)
+            writer.writerows(rows)
+
+        self.track(file_path)
+
+
+    # Store of the columnar snapshots
+    def snapshots(self):
+        """
+        ### Returns the `SnapshotStore` of the month files of this executor.
+
+        - Imported lazily, snapshot.py imports this module.
+        """
+
+        if self.snapshot_store is None:
+
+            from snapshot import SnapshotStore
+
+            self.snapshot_store = SnapshotStore(self)
+
+        return self.snapshot_store
+
+
+    # Analytics totals of a month from its snapshot
+    def snapshot_totals(self, file_path):
+        """
+        ### Returns (rows, total minutes) of a month file from its snapshot.
+
+        :param file_path (str): The full path to the month CSV file.
+
+        Returns
+        -------
+        tuple
+            (number of rows, total minutes), or None if snapshots are not available.
+        """
+
+        # A month of an archived year has no snapshot
+        if not USE_SNAPSHOTS or not os.path.exists(file_path):
+            return None
+
+        return self.snapshots().totals(file_path)
+
+
+    # Read the tombstone log of a month file
+    def read_tombstones(self, file_path):
+        """
+        ### Returns the file positions of the deleted rows of a month file.
+
+        :param file_path (str): The full path to the month CSV file.
+
+        Returns
+        -------
+        set
+            0-based positions of the deleted data rows, empty if nothing was deleted.
+        """
+
+        tomb_path = file_path + TOMBSTONE_SUFFIX
+
+        if not os.path.exists(tomb_path):
+            return set()
+
+        with open(tomb_path, "r") as f:
+
+            return {int(line) for line in f if line.strip()}
+
+
+    # Rewrite a month file without its deleted rows
+    def compact_month(self, file_path):
+        """
+        ### Applies the tombstone log to a month file and removes the log.
+
+        :param file_path (str): The full path to the month CSV file.
+
+        Returns
+        -------
+        int
+            The number of rows removed from the file.
+        """
+
+        self.archives().check_writable(file_path)
+
+        with self.locks.lock(file_path):
+
+            tombstones = self.read_tombstones(file_path)
+
+            if not tombstones:
+                return 0
+
+            # Rewrite the live rows only
+            data = self.read_month(file_path, use_snapshot= False)
+
+            with self.locks.atomic_write(file_path) as f:
+                data.to_csv(f, index= False)
+
+            os.remove(file_path + TOMBSTONE_SUFFIX)
+
+            # The row offsets changed, indexed again on the next read
+            self.row_index().remove(file_path)
+
+        # Same live rows, new file
+        self.track(file_path, delta= 0)
+
+        return len(tombstones)
     
 
+    # Read one-column tracker files (years.csv, tasks.csv, months.csv)
+    def read_registry(self, file_path):
+        """
+        ### Reads a tracker file with the (csv) module and returns its names.
+
+        - Skips the header row and blank lines.
+        - Avoids importing pandas for the small registry files.
+
+        :param file_path (str): The full path to the tracker CSV file.
+
+        Returns
+        -------
+        list
+            The values of the first column as strings, in file order.
+        """
+
+        return list(self.load_registry(file_path)["names"])
+
+
+    # Parse a tracker file once and keep it in the cache
+    def load_registry(self, file_path):
+        """
+        ### Returns the cache entry of a tracker file, parsing it only if it changed.
+
+        :param file_path (str): The full path to the tracker CSV file.
+
+        Returns
+        -------
+        dict
+            {"stamp": (mtime, size), "names": list of names, "index": set of names}
+        """
+
+        # Serve the cached entry while the file is unchanged
+        cached = self.registry_cache.get(file_path)
+
+        if cached and cached["stamp"] == self.file_stamp(file_path):
+            return cached
+
+        with self.open_text(file_path) as f:
+
+            reader = csv.reader(f)
+
+            # Skip the header row
+            next(reader, None)
+
+            # Keep the first field of every non-empty row
+            names = [row[0] for row in reader if row]
+
+        # Remember the parsed names and their hash index for the next calls
+        cached = {"stamp": self.file_stamp(file_path), "names": names, "index": set(names)}
+        self.registry_cache[file_path] = cached
+
+        return cached
+
+
+    # Identify the current version of a file
+    def file_stamp(self, file_path):
+        """
+        ### Returns the (mtime, size) pair used to revalidate cached files.
+
+        :param file_path (str): The full path to the file.
+
+        - A file of an archived year has the stamp of its archive.
+
+        Returns
+        -------
+        tuple
+            (modification time in nanoseconds, size in bytes), or None if the file is missing.
+        """
+
+        try:
+            stat = os.stat(file_path)
+
+        except FileNotFoundError:
+            return self.archives().stamp(file_path)
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+    # Drop cached trackers of a removed file or directory
+    def forget_registry(self, path):
+        """
+        ### Removes the cache entries of a path and of everything below it.
+
+        :param path (str): A tracker file or a directory that was deleted.
+        """
+
+        prefix = os.path.join(path, "")
+
+        for cached_path in list(self.registry_cache):
+
+            if cached_path == path or cached_path.startswith(prefix):
+
+                del self.registry_cache[cached_path]
+
+
+    # Read only the header row of a CSV file
+    def read_header(self, file_path):
+        """
+        ### Returns the header row of a CSV file without reading its data.
+
+        :param file_path (str): The full path to the CSV file.
+
+        Returns
+        -------
+        list
+            The column names of the file, or an empty list if it has no header.
+        """
+
+        with self.open_text(file_path) as f:
+
+            return next(csv.reader(f), [])
+
+
+    # Delete a name from a tracker file
+    def delete_registry_name(self, file_path, name:str):
+        """
+        ### Removes every row holding a name from a tracker file.
+
+        - Rewrites the file from the cached names.
+        - Updates the cached hash index in place.
+
+        :param file_path (str): The full path to the tracker CSV file.
+        :param name (str): The name to delete.
+        """
+
+        self.archives().check_writable(file_path)
+
+        with self.locks.lock(file_path):
+
+            # Names as they are now, another process may have changed the file
+            cached = self.load_registry(file_path)
+            header = self.read_header(file_path)
+
+            # Names kept after deletion
+            cached["names"] = [item for item in cached["names"] if item != name]
+            cached["index"].discard(name)
+
+            with self.locks.atomic_write(file_path) as f:
+
+                writer = csv.writer(f)
+
+                writer.writerow(header)
+                writer.writerows([item] for item in cached["names"])
+
+            cached["stamp"] = self.file_stamp(file_path)
+
+        self.track(file_path)
+
+
     # Count exist directories in the passed dir_path 
     def count_dirs(self,dir_path):
         """
@@ -59,12 +681,25 @@ class Executor():
         :param dir_path: 
             The full path of the directory that should be counted.
 
+        - A directory of the manifest is looked up instead of listed.
+        - Archived directories (see archive.py) are counted, and an archived
+          directory is listed from its archive.
+
         Returns
         -------
         The number of subfolders inside dir_path.
         """
+
+        node = self.manifest.node(dir_path) if self.manifest else None
+
+        if node is None:
+            node = self.archives().node(dir_path)
+
+        if node is not None:
+            return len(node["dirs"]) + self.archives().count(node["files"])
+
         # Count the folder in the directory
-        return len([p for p in Path(dir_path).iterdir() if p.is_dir()])
+        return len([p for p in Path(dir_path).iterdir() if p.is_dir() or self.archives().is_archive(p.name)])
 
         
     # Count exist files in dirs
@@ -72,6 +707,9 @@ class Executor():
         """
         Counts the number of files within a given path.
 
+        - A directory of the manifest is looked up instead of listed
+          (hidden files and tombstone logs are not counted then).
+
         Args:
             dir_path (str): The path to investigate.
 
@@ -79,6 +717,15 @@ class Executor():
             int: The count of files found.
         """
 
+        node = self.manifest.node(dir_path) if self.manifest else None
+
+        # An archived directory is listed from its archive
+        if node is None:
+            node = self.archives().node(dir_path)
+
+        if node is not None:
+            return len(node["files"])
+
         count = 0
 
         # Create a Path object
@@ -95,6 +742,180 @@ class Executor():
         return count
     
 
+    # Check the existence of a file or directory
+    def path_exists(self, path):
+        """
+        ### Checks if a file or directory of the data tree exists.
+
+        :param path: Full path of the file or directory.
+
+        - Years, tasks, months and their files are looked up in the manifest.
+        - Files of an archived year are looked up in its archive.
+
+        Returns:
+            bool: True if it exists. False Otherwise
+        """
+
+        found = self.manifest.contains(path) if self.manifest else None
+
+        if found or (found is None and os.path.exists(path)):
+            return True
+
+        return self.archives().contains(path)
+
+
+    # Remove a file or a whole directory
+    def remove_path(self, path):
+        """
+        ### Deletes a month file or a year/task directory with its content.
+
+        - Drops the cached trackers stored below the path.
+        - Removes the month/task from the running totals of the reports.
+        - An archived year is removed with its archive, the files of an
+          archive can not be removed one by one (PermissionError).
+
+        :param path: Full path of the file or directory.
+        """
+
+        if self.archives().locate(path) is not None:
+
+            self.archives().remove(path)
+            self.forget_registry(path)
+
+            return None
+
+        # Month or task leaving the reports
+        if self.is_month_file(path) and self.reports_exist(path):
+            self.reports().remove_month(path)
+
+        elif os.path.isdir(path) and os.path.exists(os.path.join(path, "months.csv")):
+
+            if os.path.exists(os.path.join(os.path.dirname(path), "tasks_report.csv")):
+                self.reports().remove_task(path)
+
+        # Locks the directory holding the path (the reports lock their own)
+        with self.locks.lock(path):
+
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+
+            else:
+                os.remove(path)
+
+                # Sidecar tombstone log and row index of a month file
+                for sidecar in (path + TOMBSTONE_SUFFIX, path + INDEX_SUFFIX):
+
+                    if os.path.exists(sidecar):
+                        os.remove(sidecar)
+
+                # Columnar snapshot of a month file
+                if self.is_month_file(path):
+                    shutil.rmtree(self.snapshots().snapshot_dir(path), ignore_errors= True)
+
+        self.forget_registry(path)
+        self.track(path)
+
+
+    # Count the data rows of a month file
+    def count_rows(self, file_path):
+        """
+        ### Returns the number of data rows in a month file.
+
+        :param file_path: Path to the month CSV file.
+
+        Returns:
+            int: The count of rows without the header.
+        """
+
+        rows = self.manifest.rows(file_path) if self.manifest else None
+
+        if rows is not None:
+            return rows
+
+        # Counted without parsing the rows (see read_page())
+        rows = self.read_page(file_path, 0, 0)[2]
+
+        # Keep the count for the next lookup (the offsets are cached, no second pass)
+        self.track(file_path)
+
+        return rows
+
+
+    # Record a change in the manifest
+    def track(self, path, delta:int = None):
+        """
+        ### Updates the manifest entry of a created, changed or removed path.
+
+        - Called after the lock of the path was released (see manifest.py).
+
+        :param path: Full path of the file or directory.
+        :param delta (int): Rows added to (or removed from) a month file, None to count them.
+        """
+
+        if self.manifest is not None:
+            self.manifest.update(path, delta)
+
+
+    # Group the manifest changes of an operation
+    def track_batch(self):
+        """
+        ### Returns a context that writes the manifest changes of its block at once (see Manifest.batch()).
+        """
+
+        if self.manifest is None:
+            return contextlib.nullcontext()
+
+        return self.manifest.batch()
+
+
+    # Delete one data row of a month file
+    def delete_row(self, file_path, row_index:int):
+        """
+        ### Deletes a data row from a month file by its 1-based number.
+
+        - Appends the position of the row to the tombstone log instead of
+          rewriting the file.
+        - Only the row is read, through the row index (see read_page()).
+        - Compacts the file once the log holds COMPACT_THRESHOLD rows.
+
+        :param file_path: Path to the month CSV file.
+        :param row_index (int): 1-based number of the row, as displayed to the user.
+
+        Returns:
+            list: The values of the deleted row.
+        """
+
+        self.archives().check_writable(file_path)
+
+        # The row numbers must not change until the deletion is recorded
+        with self.locks.lock(file_path):
+
+            # Row of the data as list and its position in the file
+            _, rows, total = self.read_page(file_path, row_index - 1, 1)
+
+            if not rows or row_index < 1:
+                raise IndexError(f"Row {row_index} is out of range (1 to {total})")
+
+            row_data = rows[0]
+            position = self.row_position(file_path, row_index - 1)[0]
+
+            # Record the deletion in the tombstone log
+            with open(file_path + TOMBSTONE_SUFFIX, "a") as f:
+                f.write(f"{position}\n")
+
+        self.track(file_path, delta= -1)
+
+        # Take the row out of the running totals
+        if self.reports_exist(file_path):
+            self.reports().apply_entries(file_path, [row_data], sign= -1)
+
+        # Rewrite the file when too many rows are dead
+        if len(self.read_tombstones(file_path)) >= COMPACT_THRESHOLD:
+            self.compact_month(file_path)
+
+        return row_data
+
+
     # Delete conten 
     def remove_data(self, main_dir):
         """
@@ -121,7 +942,7 @@ class Executor():
         years_csv = os.path.join( main_dir, "years.csv" )
 
         # List of year names
-        year_list_names = self.read_csv( years_csv )["years"].to_list()
+        year_list_names = self.read_registry( years_csv )
 
 
         # Display Deletion Scope Options
@@ -182,29 +1003,29 @@ class Executor():
             return
         
 
+        # An archived year is read-only, it can only be deleted whole
+        if sub_choice != 1 and self.archives().locate(os.path.join(main_dir, get_year)) is not None:
+
+            print(f"\n\nYear [ {get_year} ] is archived (read-only). Restore it first to delete its tasks, months or rows❗\n")
+            return
+
         # Path of the task names
         tasks_path = os.path.join(main_dir,get_year,"tasks.csv")
 
-        # Dataframe of tasks
-        tasks_file = self.read_csv(tasks_path)
+        # List of task names
+        tasks_file = self.read_registry(tasks_path)
 
 
         # [Option 1 ]
         if sub_choice == 1: #  Remove a year
 
-            # Dataframe of the year names
-            data = pandas.read_csv(years_csv, dtype= str)
-
-            # Delete the entered year from the dataframe and update it
-            update_file = data[data["years"] != get_year]
-            
-            # Make a new csv file after updating
-            update_file.to_csv(years_csv, index=False) # Saves the update as csv_file
+            # Delete the entered year from the tracker file
+            self.delete_registry_name(years_csv, get_year)
 
             year_dir = os.path.join(main_dir, get_year)
 
             # Remove the year dir
-            shutil.rmtree( year_dir )
+            self.remove_path( year_dir )
             
             # Show successful message
             print(f"\nRemoving year [ {get_year} ] was successful\n\n")
@@ -213,7 +1034,7 @@ class Executor():
 
 
         # Validate tasks exist for Options 2 & 3
-        if tasks_file.empty:
+        if not tasks_file:
 
             print("\n\nNo active tasks to delete. Please add a task first.\n")
             return
@@ -241,23 +1062,20 @@ class Executor():
             return
 
         # Get the task name from the tasks tracker
-        task_name = tasks_file["tasks"].iloc[ task_index - 1]
+        task_name = tasks_file[ task_index - 1]
 
 
         # [Option 2 ]
         if sub_choice == 2: # Remove task dir
             
             # Delete the task name from the tasks tracker
-            update_file = tasks_file[tasks_file["tasks"] != task_name]
-            
-            # Make new CSV file content after deletion
-            update_file.to_csv(tasks_path, index=False) # Saves the new data to csv file
+            self.delete_registry_name(tasks_path, task_name)
 
             # Setup The Paht of Dir
             task_dir = os.path.join( main_dir, get_year, task_name )
 
             # Remove task dir
-            shutil.rmtree( task_dir )
+            self.remove_path( task_dir )
             
             # Show successful message
             print(f"\nTask [ {task_name} ] removed successfully.\n")
@@ -289,8 +1107,8 @@ class Executor():
             # Path of the months file
             months_csv =  os.path.join( main_dir, get_year, task_name, "months.csv" )
 
-            # Dataframe of the month names file
-            months_file = self.read_csv(months_csv)
+            # List of the month names
+            months_file = self.read_registry(months_csv)
 
 
             # View the exist months in the file
@@ -320,7 +1138,7 @@ class Executor():
             
 
             # Get month name from it's file
-            month_name = months_file.months.iloc[ month_index - 1]
+            month_name = months_file[ month_index - 1]
 
             # Path of the month
             current_month_path = os.path.join( main_dir, get_year, task_name, f"{month_name}.csv" )
@@ -329,15 +1147,12 @@ class Executor():
             # [3.1] Delete entire month file
             if int(sub_choice) == 1: 
 
-                if os.path.exists(current_month_path):
+                if self.path_exists(current_month_path):
 
-                    os.remove(current_month_path)
+                    self.remove_path(current_month_path)
                     
                     # Delete the month name from the monthsfile
-                    update_file = months_file[months_file.months != month_name]
-
-                    # Generate the update months_file
-                    update_file.to_csv(months_csv, index= False)
+                    self.delete_registry_name(months_csv, month_name)
 
                     print(f"\n\nMonth [ {month_name} ] has been deleted🗑️\n")
                     return True
@@ -351,7 +1166,7 @@ class Executor():
             if int(sub_choice) == 2: 
 
                 # Length of the file rows 
-                file_len = len( self.read_csv(current_month_path))
+                file_len = self.count_rows(current_month_path)
 
                 # Ensure Month has data
                 if not file_len:
@@ -383,63 +1198,183 @@ class Executor():
                     print(f"\n\nEntry [ {get_row_num} ] is out of range. Valid range is 1 to {file_len}.\n")
                     return  
                 
-                # Read month file
-                df = self.read_csv( current_month_path)
-                
-                # Row of the data as list to view it to the user
-                row_data = df.iloc[ row_index - 1 ].to_list()
+                # Delete data row and keep it as list to view it to the user
+                row_data = self.delete_row( current_month_path, row_index )
                 
                 # View list row data
                 print(f"\nData: { row_data }")
                 print("-" * 20)
 
-                # Delete data row
-                df = df.drop(row_index - 1)
+                # Show message that evrything was successful
+                print("\nRow deleted successfully!\n")
+
+
+    # Reads and displaying the csv file content
+    def print_formatted_csv_table(self, file_path):
+        """
+        ### Reads a CSV and displays it as a formatted table with 1-based indexing.
+        
+        :param file_path: The path to the CSV file.
+
+        Ruterns:
+        --------
+        None if the opertion invalid
+        """
+
+        # Tracker files are printed in one table
+        if os.path.basename(file_path) in REGISTRY_FILES:
+
+            self.print_registry_table(file_path)
+            return None
+
+        # Month files are printed page by page
+        self.page_month(file_path)
+
+
+    # Reads and displaying a tracker file content
+    def print_registry_table(self, file_path):
+        """
+        ### Displays a one-column tracker file with 1-based indexing.
+
+        - Uses the same layout as the pandas table of the month files.
+
+        :param file_path: The path to the tracker CSV file.
+        """
+
+        names = self.read_registry(file_path)
+
+        # Check if it has content
+        if not names:
+            print(f"\n\nNo content to view. Add first content❗\n\n")
+            return None
+
+        # Print the header of data
+        print("\n\n" + ",".join(self.read_header(file_path)).strip() + ":" + "\n")
+
+        # Print the data rows
+        print("\n".join(self.format_rows([[name] for name in names], start= 1)) + "\n\n")
+
+
+    # Lay out rows like a pandas table
+    def format_rows(self, rows:list, start:int = 1):
+        """
+        ### Formats rows like `DataFrame.to_string(header= False)` does.
+
+        - The row number is left-aligned, the values are right-aligned,
+          columns are separated by two spaces and empty values show as NaN.
+
+        :param rows (list): List of rows, every row is a list of strings.
+        :param start (int): Number of the first row.
+
+        Returns:
+            list: One text line per row.
+        """
+
+        # Empty cells are shown like pandas shows them
+        rows = [[value if value != "" else "NaN" for value in row] for row in rows]
+
+        # Widths of the index and every column
+        index_width = len(str(start + len(rows) - 1))
+        widths = [max(len(row[num]) for row in rows) for num in range(len(rows[0]))] if rows else []
+
+        return [
+            "  ".join([str(num).ljust(index_width)] + [value.rjust(width) for value, width in zip(row, widths)])
+            for num, row in enumerate(rows, start= start)
+        ]
+
+
+    # Display a month file page by page
+    def page_month(self, file_path, page_size:int = PAGE_SIZE):
+        """
+        ### Displays a month file one page at a time with 1-based indexing.
+
+        - Only the rows of the visible page are read (see read_page()).
+        - On a terminal the pages are redrawn in place (only the changed lines)
+          and keys are read without Enter.
+        - Enter / "n": next page, "p": previous page, a number: jump to
+          that row, "q": stop viewing.
+
+        :param file_path: The path to the month CSV file.
+        :param page_size (int): Number of rows of one page.
+        """
+
+        start = 0
+
+        # Title of the pages: "<task> / <month>"
+        title = f"{os.path.basename(os.path.dirname(file_path))} / {os.path.splitext(os.path.basename(file_path))[0]}"
+
+        paging = False
+
+        while True:
+
+            header, rows, total = self.read_page(file_path, start, page_size)
+
+            # Check if it has content
+            if total == 0:
+                print(f"\n\nNo content to view. Add first content❗\n\n")
+                return None
+
+            table = ["", "", ",".join(header).strip() + ":", ""] + self.format_rows(rows, start= start + 1)
+
+            # A file that fits on one page needs no navigation
+            if total <= page_size:
+                print("\n".join(table) + "\n\n")
+                return None
+
+            # Pages start on a clean screen
+            if not paging:
+
+                self.terminal.clear()
+                paging = True
+
+            # Same number of lines on every page, the last one is padded
+            table += [""] * (page_size - len(rows))
+
+            self.terminal.render([title, "-" * 30] + table + ["", f"Rows {start + 1}-{start + len(rows)} of {total}", ""])
+
+            print("[Enter] Next  [p] Previous  [number] Jump to row  [q] Quit:  ", end= "", flush= True)
+
+            # Single keys on a terminal, whole lines otherwise
+            if self.terminal.ansi:
 
-                # Create a niew ver data fram witout the deleted data
-                df.to_csv(current_month_path, index= False)
+                choice = self.terminal.getch().strip().lower()
 
-                # Show message that evrything was successful
-                print("\nRow deleted successfully!\n")
+                # The rest of a row number is entered with Enter
+                if choice.isdigit():
+                    choice += input(f"Jump to row: {choice}").strip()
 
+            else:
+                choice = input().strip().lower()
 
-    # Reads and displaying the csv file content
-    def print_formatted_csv_table(self, file_path):
-        """
-        ### Reads a CSV and displays it as a formatted table with 1-based indexing.
-        
-        :param file_path: The path to the CSV file.
+            if choice == "q":
+                return None
 
-        Ruterns:
-        --------
-        None if the opertion invalid
-        """
+            if choice == "p":
+                start = max(start - page_size, 0)
 
-        # Read CSV and contan it it as dataframe
-        data = pandas.read_csv(file_path, dtype= str ,skiprows= 0 )
-        
-        # Check if it has content
-        if len(data) == 0:
-            print(f"\n\nNo content to view. Add first content❗\n\n")
-            return None
-        
-        # Start indexing from 1 for user friendliness
-        data.index = pandas.RangeIndex(start= 1, stop= len(data) +1, step= 1) 
+            elif choice.isdigit():
 
-        # repeare the header to display it like a string
-        header = data.columns.to_list()
+                row_num = int(choice)
 
-        # Print the header of data
-        print("\n\n" + ",".join(header).strip()+":" + "\n")
+                # Validate Range Validity, the page stays the same
+                if 1 <= row_num <= total:
+                    start = row_num - 1
 
-        # Print the data rows
-        print(data.iloc[0::].to_string(header= False) + "\n\n")
+            else:
+
+                # The last page was shown
+                if start + page_size >= total:
+                    return None
+
+                start += page_size
 
 
     # Read CSV and Returns the name of the last index.
     def get_latst_active_name(self, filepath):
         """
         ### Retrieves the last entry name from a CSV file.
+
+        - Reads only the end of the file (see read_last_record()).
         
         :param filepath: Path to the CSV.
 
@@ -448,20 +1383,114 @@ class Executor():
         str: The name in the last row, or None if empty.
         """
         
-        # Read the CSV
-        df = pandas.read_csv(filepath, dtype=str, skiprows=0)
+        # Read the last record of the file
+        last_row = self.read_last_record(filepath)
         
-        # Check if dataframe is empty to prevent errors
-        if df.empty:
+        # Check if the file is empty to prevent errors
+        if not last_row:
             return None
 
-        # Get the last row (Series)
-        last_row = df.iloc[-1]
-
-        # Get the first value from the row
-        latest_name = last_row.iloc[0] 
+        # Get the first value from the last row
+        latest_name = last_row[0]
 
         return latest_name # (str) value
+
+
+    # Read the last record of a CSV file from its end
+    def read_last_record(self, file_path, block_size:int = 4096):
+        """
+        ### Returns the last data row of a CSV file without loading the file.
+
+        - Seeks to the end and reads blocks backwards until a full record is found.
+        - Ignores trailing newlines.
+        - A newline is a record boundary only if an even number of quotes follows it,
+          so newlines inside quoted fields are skipped.
+
+        :param file_path (str): Path to the CSV file.
+        :param block_size (int): Size of the first block read from the end.
+
+        Returns:
+        -------
+        list: The fields of the last row, or None if the file has no data rows.
+        """
+
+        # The last row may be deleted in the tombstone log
+        if os.path.exists(file_path + TOMBSTONE_SUFFIX):
+
+            data = self.read_csv(file_path)
+
+            return data.iloc[-1].to_list() if len(data) else None
+
+        # A file of an archived year can only be read from its start
+        if not os.path.exists(file_path):
+
+            last_row = None
+
+            with self.open_text(file_path) as f:
+
+                reader = csv.reader(f)
+
+                # Skip the header row
+                next(reader, None)
+
+                for row in reader:
+
+                    if row:
+                        last_row = row
+
+            return last_row
+
+        with open(file_path, "rb") as f:
+
+            # Position of the end of file
+            end = f.seek(0, 2)
+
+            while True:
+
+                # Read the final block of the file
+                start = max(0, end - block_size)
+                f.seek(start)
+
+                text = f.read(end - start).rstrip(b"\r\n")
+
+                # Empty file
+                if not text:
+                    return None
+
+                # Search the last newline outside of quoted fields
+                pos = len(text)
+                quotes = 0
+                record = None
+
+                while True:
+
+                    newline = text.rfind(b"\n", 0, pos)
+
+                    if newline < 0:
+                        break
+
+                    # Quotes between this newline and the previous checked one
+                    quotes += text.count(b'"', newline + 1, pos)
+                    pos = newline
+
+                    if quotes % 2 == 0:
+                        record = text[newline + 1:]
+                        break
+
+                if record is not None:
+                    break
+
+                # The whole file is one record: only the header
+                if start == 0:
+                    return None
+
+                # The record is longer than the block, read more
+                block_size *= 2
+
+        # Decode like the text mode writers of this module
+        line = record.decode(locale.getpreferredencoding(False))
+
+        return next(csv.reader([line]), None)
     
 
     # Displaying all data of a folder/file
@@ -484,14 +1513,14 @@ class Executor():
         years_csv =  os.path.join(base_dir, "years.csv")
 
         # Check if years path is exists
-        if not os.path.exists(years_csv):
+        if not self.path_exists(years_csv):
 
             print(f"\n\nNo years or tasks exist\n")
             return 
         
 
         # Read the years CSV
-        years_file = self.read_csv(years_csv)
+        years_file = self.read_registry(years_csv)
 
 
         # Ensure existence of years
@@ -542,7 +1571,7 @@ class Executor():
         self.clear_terminal()
 
         # Check if year is exists
-        if get_year not in years_file.years.to_list():
+        if get_year not in years_file:
 
             print(f"\nEntry year: {get_year} does not exist\n")
             return
@@ -552,11 +1581,11 @@ class Executor():
         tasks_csv = os.path.join( base_dir, get_year, "tasks.csv" )
 
         # Read tasks CSV
-        tasks_file = self.read_csv(tasks_csv)
+        tasks_file = self.read_registry(tasks_csv)
 
 
         # Check if tasks file has contint 
-        if tasks_file.empty:
+        if not tasks_file:
 
             print("\n\nThere is no tasks conten❗ Add a task first❗")
             return 
@@ -594,13 +1623,13 @@ class Executor():
 
 
         # Task name
-        task_name =  tasks_file.iloc[task_num - 1].iloc[0]
+        task_name =  tasks_file[task_num - 1]
 
         # Full path of the task folder
         task_dir = os.path.join( base_dir, get_year, task_name )
 
         # Check if task has active month files
-        if self.count_files(task_dir) < 3: # < 3 because dir has 2 default files (months.csv, report.csv)
+        if not self.read_registry(os.path.join(task_dir, "months.csv")):
 
             print(f"\n\nTask: [ { task_name} ] has no acitve months yet❗ Please start an active month first.\n\n")
             return 
@@ -609,7 +1638,7 @@ class Executor():
         months_csv = os.path.join( task_dir, "months.csv" )
 
         # List of the exists months
-        months_list = self.read_csv(file_path= months_csv)["months"].to_list()
+        months_list = self.read_registry(file_path= months_csv)
 
         # [3] View specific month entries
         if get_content_num == "3":
@@ -647,7 +1676,7 @@ class Executor():
                     
                 this_month = os.path.join( task_dir, f"{month}.csv" )
                 
-                if not os.path.exists(this_month):
+                if not self.path_exists(this_month):
                     return None
                 
                 else:
@@ -668,6 +1697,8 @@ class Executor():
         """
         ### Checks if a specific name exists within a CSV file.
 
+        - Tracker files are checked against their cached hash index.
+
         :param file_path: Full CSV path.
         :param name: The name to search for.
 
@@ -676,13 +1707,21 @@ class Executor():
             bool: True if found. False Otherwise
         """
 
-        data = pandas.read_csv(file_path, dtype= str).to_dict()
+        # O(1) lookup for the one-column trackers
+        if os.path.basename(file_path) in REGISTRY_FILES:
+
+            return name in self.load_registry(file_path)["index"]
 
-        for key in data: # key = header item
+        with self.open_text(file_path) as f:
 
-            for i in data[key]: # data[key] = int(index) of such row 
+            reader = csv.reader(f)
 
-                if name == data[key][i]: # data[key][i] = item in the index key
+            # Skip the header row
+            next(reader, None)
+
+            for row in reader: # row = list of the fields of a line
+
+                if name in row:
 
                     return True
 
@@ -697,75 +1736,439 @@ class Executor():
         :param file_path: Target CSV file.
         :param data_list: Data to append.
         """
-        
-        with open( file_path, "a", newline= "") as f:
 
-            # set marker(pointer) at the end of file and reset it to the start
-            f.seek(0, 2) # 2 get the end of file (0, 2), 1 stay currect postion (0, 1), 0 set to start (0, 0)
+        self.archives().check_writable(file_path)
+        
+        with self.locks.lock(file_path):
+
+            # A tracker name registered meanwhile by another process is not added twice
+            if os.path.basename(file_path) in REGISTRY_FILES and self.is_exist(file_path, data_list[0]):
+
+                print(f"\n\nEntry [ {data_list[0]} ] already exists in:\n\n- File: {file_path}\n")
+                return None
+
+            # Cached tracker names, only valid if nobody changed the file meanwhile
+            cached = self.registry_cache.get(file_path)
+
+            if cached and cached["stamp"] != self.file_stamp(file_path):
+                cached = None
+
+            with open( file_path, "a", newline= "") as f:
+
+                # set marker(pointer) at the end of file and reset it to the start
+                f.seek(0, 2) # 2 get the end of file (0, 2), 1 stay currect postion (0, 1), 0 set to start (0, 0)
+
+                # Write data in the file
+                csv.writer(f).writerow(data_list)
+
+            # Offset of the new row in the index of a month
+            if self.is_month_file(file_path):
+                self.row_index().update(file_path, create= False)
+
+            # Update the cached tracker and its index in place instead of parsing it again
+            if cached:
+                cached["names"].append(data_list[0])
+                cached["index"].add(data_list[0])
+                cached["stamp"] = self.file_stamp(file_path)
+
+            else:
+                self.registry_cache.pop(file_path, None)
+
+        self.track(file_path, delta= 1)
+
+        # Keep the running totals of the reports
+        self.update_reports(file_path, [data_list])
+
+        # View details of the storged data
+        print(f"\nEntry(s): {data_list} successfully stored into:\n")
+        print(f"- File: {file_path}\n")
+        
+
+    # Check if a path is a month file
+    def is_month_file(self, file_path):
+        """
+        ### Checks if a CSV path is a month file (not a tracker or a report).
+
+        :param file_path: Full path of the CSV file.
+
+        Returns:
+            bool: True for `<task>/<Month>.csv` files. False Otherwise
+        """
+
+        name = os.path.basename(file_path)
+
+        if not name.endswith(".csv") or name in REGISTRY_FILES or name in REPORT_FILES or name == SCHEMA_FILE:
+            return False
+
+        # Month files live next to the months tracker
+        return os.path.exists(os.path.join(os.path.dirname(file_path), "months.csv"))
+
+
+    # Check if the report files of a month file exist
+    def reports_exist(self, file_path):
+        """
+        ### Checks if the task and year report files above a month file exist.
+
+        :param file_path: Full path of the month file.
+
+        Returns:
+            bool: True if both report files exist. False Otherwise
+        """
+
+        task_dir = os.path.dirname(file_path)
+
+        return (
+            os.path.exists(os.path.join(task_dir, "task_report.csv"))
+            and os.path.exists(os.path.join(os.path.dirname(task_dir), "tasks_report.csv"))
+        )
+
+
+    # Reporter of the running totals
+    def reports(self):
+        """
+        ### Returns the `Reporter` that maintains the report files of this executor.
+
+        - Imported lazily, reporting.py imports this module.
+        """
+
+        if self.reporter is None:
+
+            from reporting import Reporter
+
+            self.reporter = Reporter(self)
+
+        return self.reporter
+
+
+    # Update the reports after rows or names were added
+    def update_reports(self, file_path, rows:list):
+        """
+        ### Adds stored rows or new names to the running totals of the reports.
+
+        - tasks.csv: a new task row in tasks_report.csv.
+        - months.csv: a new month row in task_report.csv.
+        - Month file: the entries are added to the month and task totals.
+
+        :param file_path: The CSV file the rows were appended to.
+        :param rows (list): The appended rows.
+        """
+
+        name = os.path.basename(file_path)
+        parent = os.path.dirname(file_path)
+
+        if name == "tasks.csv" and os.path.exists(os.path.join(parent, "tasks_report.csv")):
+
+            for row in rows:
+                self.reports().add_task(os.path.join(parent, row[0]))
+
+        elif name == "months.csv" and self.reports_exist(file_path):
+
+            for row in rows:
+                self.reports().add_month(os.path.join(parent, f"{row[0]}.csv"))
+
+        elif self.is_month_file(file_path) and self.reports_exist(file_path):
+
+            self.reports().apply_entries(file_path, rows, sign= 1)
+
+
+    # Minutes of the durations of a row
+    def entry_minutes(self, row:list):
+        """
+        ### Sums the duration values ("H:MM") of a row in minutes.
+
+        - Values without a colon are not durations (see get_data()).
+
+        :param row (list): The values of a row.
+
+        Returns:
+            int: Total minutes of the row.
+        """
+
+        total = 0
+
+        for value in row:
+
+            value = str(value).strip()
+            match = DURATION_PATTERN.fullmatch(value)
+
+            if ":" in value and match:
+                total += int(match.group(1)) * 60 + int(match.group(2))
+
+        return total
+
+
+    # Inputs validation
+    def validate_inputs(self, entry, entry_type:str):
+        """
+        ### Validates user input based on expected type.
+
+        - Uses the same ENTRY_PATTERNS rules as validate_batch().
+
+        :param entry: The user input.
+        :param entry_type (str): Expected type ("int", "time", "str", "duration", "date").
+
+        Ruterns:
+        -------
+            bool: True if valid. False Otherwise
+        """
+        if not entry:
+
+            print(f"\nEntry [ {entry} ] can not be empty❗\n")
+            return False
+
+        # Unknown types are not checked
+        pattern = ENTRY_PATTERNS.get(entry_type)
+
+        if pattern is None or pattern.fullmatch(entry):
+
+            # A date must also exist in the calendar (same as validate_batch())
+            if entry_type != "date" or self.valid_date(entry):
+                return True
+
+            print(f"\n\n{ENTRY_ERRORS[entry_type].format(entry= entry, char= entry)}\n\n")
+            return False
+
+        # First character breaking the rule
+        char = next((item for item in entry if not pattern.fullmatch(item)), entry)
+
+        # Show an error message of the type
+        print(f"\n\n{ENTRY_ERRORS[entry_type].format(entry= entry, char= char)}\n\n")
+
+        return False
+
+
+    # Check a date against the calendar
+    def valid_date(self, entry:str):
+        """
+        ### Returns True if a date matching DATE_PATTERN is a real day ("2026-13-45" is not).
+
+        - "YYYY-MM-DD" is read year first, the other forms day first.
+
+        :param entry (str): The date.
+        """
+
+        import datetime
+
+        parts = re.split(r"[/.-]", entry)
+
+        if len(parts[0]) == 4:
+            year, month, day = parts
+
+        else:
+            day, month, year = parts
+
+        # Two digit years are in this century
+        year = int(year) + 2000 if len(year) <= 2 else int(year)
+
+        try:
+            datetime.date(year, int(month), int(day))
+
+        except ValueError:
+            return False
+
+        return True
+
+
+    # Validate many entries at once
+    def validate_batch(self, values, entry_type:str):
+        """
+        ### Validates and parses a whole column of entries of one type.
+
+        - Vectorized with pandas string operations and the compiled ENTRY_PATTERNS,
+          the rules of validate_inputs().
+        - Parsed values: "int" -> number, "time"/"duration" -> minutes,
+          "date" -> datetime, "str" -> the text itself. Invalid entries give NaN/NaT.
+
+        :param values: List or pandas.Series of entries (strings).
+        :param entry_type (str): Expected type ("int", "time", "str", "duration", "date").
+
+        Returns
+        -------
+        tuple
+            (numpy bool array: validity mask, pandas.Series: parsed values)
+        """
+
+        import pandas
+
+        values = pandas.Series(values, dtype= object).fillna("").astype(str)
+
+        # Same rule as a single entry: not empty and matching the pattern
+        pattern = ENTRY_PATTERNS.get(entry_type)
+
+        if pattern is None:
+            mask = (values != "").to_numpy()
+
+        else:
+            mask = values.str.fullmatch(pattern.pattern).fillna(False).astype(bool).to_numpy()
+
+        valid = values.where(mask)
+
+        if entry_type == "int":
+            parsed = pandas.to_numeric(valid.str.replace(" ", "", regex= False), errors= "coerce")
+
+        elif entry_type in ("time", "duration"):
+
+            parts = valid.str.extract(f"^{DURATION_PATTERN.pattern}$")
+            parsed = pandas.to_numeric(parts[0], errors= "coerce").fillna(0) * 60 + pandas.to_numeric(parts[1], errors= "coerce")
+
+        elif entry_type == "date":
+            # "YYYY-MM-DD" first, then the day first forms ("DD/MM/YYYY")
+            parsed = pandas.to_datetime(valid, errors= "coerce", format= "ISO8601")
+            rest = parsed.isna() & valid.notna()
+
+            # Day first, strictly (like valid_date(): "1/13/2026" is not a date)
+            parts = valid[rest].str.extract(r"^(\d{1,2})[/.-](\d{1,2})[/.-](\d{2,4})$")
+            years = parts[2].where(parts[2].str.len() > 2, "20" + parts[2])
+            iso = years.str.zfill(4) + "-" + parts[1].str.zfill(2) + "-" + parts[0].str.zfill(2)
+            parsed[rest] = pandas.to_datetime(iso, errors= "coerce", format= "%Y-%m-%d")
+
+            # Matching the pattern is not enough, the day must exist ("2026-13-45")
+            mask = mask & parsed.notna().to_numpy()
+
+        else:
+            parsed = valid
+
+        return mask, parsed
+
+
+    # Detect the types of many entries at once
+    def detect_types(self, values):
+        """
+        ### Detects the entry type of every value like get_data() does.
+
+        - A colon means "time", a leading digit means "int", anything else is "str".
+
+        :param values (pandas.Series): Entries as strings.
+
+        Returns
+        -------
+        numpy.ndarray
+            The entry type of every value.
+        """
+
+        import numpy
+
+        is_time = values.str.contains(":", regex= False).to_numpy(dtype= bool)
+        is_int = values.str[:1].str.isdigit().fillna(False).to_numpy(dtype= bool)
+
+        return numpy.select([is_time, is_int], ["time", "int"], default= "str")
+
+
+    # Validate a month file
+    def validate_month(self, file_path):
+        """
+        ### Checks every stored entry of a month file with the batch validator.
+
+        :param file_path: Path to the month CSV file.
+
+        Returns
+        -------
+        pandas.Series
+            The reason of the rejection of every invalid row, indexed by 1-based row number.
+        """
+
+        data = self.read_csv(file_path).fillna("")
+
+        reasons = self.validate_frame(data, self.read_header(file_path), self.read_schema(file_path))
+        reasons.index = reasons.index + 1
+
+        return reasons[reasons != ""]
+
+
+    # Read the column types of a task
+    def read_schema(self, path):
+        """
+        ### Returns the typed schema of a task (schema.csv next to months.csv).
+
+        :param path: Path of the task directory or of one of its month files.
+
+        Returns:
+        -------
+            dict: {column name: type} in header order, or None if the task has no schema.
+        """
+
+        # Directories of an archived year are only in its archive
+        is_dir = os.path.isdir(path) or self.archives().node(path) is not None
+
+        task_dir = path if is_dir else os.path.dirname(path)
+        schema_csv = os.path.join(task_dir, SCHEMA_FILE)
+
+        if not os.path.exists(schema_csv) and not self.archives().contains(schema_csv):
+            return None
+
+        with self.open_text(schema_csv) as f:
+
+            reader = csv.reader(f)
+
+            # Skip the header row
+            next(reader, None)
+
+            return {row[0]: row[1] for row in reader if len(row) > 1}
+
+
+    # Store the column types of a task
+    def write_schema(self, task_dir, columns:list, types:list):
+        """
+        ### Writes the typed schema of a task.
+
+        :param task_dir: Path of the task directory.
+        :param columns (list): Column names of the month header.
+        :param types (list): One type of SCHEMA_TYPES per column.
+        """
+
+        self.write_table(
+            os.path.join(task_dir, SCHEMA_FILE),
+            ["column", "type"],
+            [[column, column_type] for column, column_type in zip(columns, types)]
+        )
 
-            # Write data in the file
-            csv.writer(f).writerow(data_list)
-            
-            # View details of the storged data
-            print(f"\nEntry(s): {data_list} successfully stored into:\n")
-            print(f"- File: {file_path}\n")
-        
 
-    # Inputs validation
-    def validate_inputs(self, entry, entry_type:str):
+    # Parse the types entered for a new header
+    def parse_schema_types(self, entry:str, columns:list):
         """
-        ### Validates user input based on expected type.
+        ### Validates the comma separated column types entered for a header.
 
-        :param entry: The user input.
-        :param entry_type (str): Expected type ("int", "time", "str").
+        :param entry (str): The user input, e.g. "date, duration, string".
+        :param columns (list): Column names of the header.
 
-        Ruterns:
+        Returns:
         -------
-            bool: True if valid. False Otherwise
+            list: One type per column, or None if the entry is invalid.
         """
-        if not entry:
 
-            print(f"\nEntry [ {entry} ] can not be empty❗\n")
-            return False
-  
-        # Validate Interger
-        if entry_type == "int":
-    
-            for num in entry:
-        
-                if num.isdigit() or num in [".", " ", "-"]:
-                    continue
+        types = [name.strip().lower() for name in entry.split(",")]
 
-                else:
-                    print(f"\n\nInvalid Entry [ { num } ]. Only digits are accepted\n")
-                    return False
-                
+        if len(types) != len(columns) or any(name not in SCHEMA_TYPES for name in types):
 
-        # Validate Time (Simple heuristic: digits or colon)
-        if entry_type == "time":
+            print(f"\n\nInvalid column types: [ {entry} ]❗ Enter one of {list(SCHEMA_TYPES)} per column.\n")
+            return None
 
-            for char in entry:
+        return types
 
-                if char.isdigit() or char == ":":
-                    continue
 
-                else:
-                    print(f"\n\nInvalid duration: [ {entry} ]❗ Use format H:MM or MM\n\n")
-                    return False
-                    
-        # Validate String ( Alpha or Spaces)
-        if entry_type == "str":
+    # Canonical text of a typed entry
+    def normalize_entry(self, entry:str, column_type:str):
+        """
+        ### Converts a valid entry to the text stored for its column type.
 
-            for content in entry:
+        - duration: parsed once into minutes and stored as "H:MM" (e.g. "90" -> "1:30"),
+          so the snapshots keep it as integer minutes.
 
-                if content.isalpha() or content.isdigit() or content in [ " ", "_", "@", "."]:
-                    continue
+        :param entry (str): A validated entry.
+        :param column_type (str): Type of the column in the schema.
 
-                else:
-                    print(f"\n\nInvalid entry: [ {entry} ]❗ Only characters accepted.\n\n")
-                    return False
-                
-        return True
+        Returns:
+            str: The text to store.
+        """
+
+        if column_type == "duration":
+
+            match = DURATION_PATTERN.fullmatch(entry)
+            minutes = int(match.group(1) or 0) * 60 + int(match.group(2))
+
+            return f"{minutes // 60}:{minutes % 60:02d}"
+
+        return entry
 
 
     # Get a new year dir name
@@ -802,28 +2205,47 @@ class Executor():
             print(f"\nPlease enter a year (e.g., {self.default_year}).")
 
 
-        # Get year 
+        # Get year
         get_year = input("\n\nEnter a year:  ").strip()
 
         self.clear_terminal()
 
+        if not self.is_new_year(get_year, years_path):
+            return
+
+        return get_year # Return the str(year name)
+
+
+    # Validate a new year name
+    def is_new_year(self, year:str, years_path):
+        """
+        ### Checks that a year name is a number after the last active year and not registered yet.
+
+        :param year (str): The year name.
+        :param years_path (str): Path to years.csv
+
+        Returns:
+            bool: True if the year can be created.
+        """
+
+        # The next year after the last active one, or the default year
+        last_year = self.get_latst_active_name(years_path)
+        min_year = int(last_year) + 1 if last_year else self.default_year
+
         # Ensure The Year Not Older Than the Currentlly one.
-        if not get_year.isdigit() or int(get_year) < self.default_year:
+        if not year.isdigit() or int(year) < min_year:
+
+            # View an error
+            print(f"\n\nInvalid entry: [ {year} ], (Format: {min_year})❗")
+            return False
 
-            # View an error 
-            print(f"\n\nInvalid entry: [ {get_year} ], (Format: {self.default_year})❗")
-            return
-      
         # Check if year is already exists
-        elif get_year in self.read_csv( years_path )["years"].to_list():
+        if self.is_exist(years_path, year):
 
-            # Clear terminal
-            self.clear_terminal()
-    
-            print(f"\n\nYear: [ {get_year} ] already exists❗")
-            return
+            print(f"\n\nYear: [ {year} ] already exists❗")
+            return False
 
-        return get_year # Return the str(year name)
+        return True
 
 
     # Get a new month file name
@@ -853,21 +2275,40 @@ class Executor():
 
         self.clear_terminal()
 
+        if not self.is_new_month(get_month, months_list, months_path):
+            return None
+
+        return get_month
+
+
+    # Validate a new month name
+    def is_new_month(self, month:str, months_list: list, months_path: str):
+        """
+        ### Checks that a month name is a standard name and not registered yet.
+
+        :param month (str): The capitalized month name.
+        :param months_list: Standard list of month names.
+        :param months_path: Path to the existing months CSV.
+
+        Returns:
+            bool: True if the month can be created.
+        """
+
         # Check if entry is not in months list
-        if get_month not in months_list:
+        if month not in months_list:
 
             # Show an error message
-            print(f"\nEntry Month [ {get_month} ] Not Found in the List❗\n")
-            print(months_str)
-            return None
-  
+            print(f"\nEntry Month [ {month} ] Not Found in the List❗\n")
+            print(" __ ".join(months_list))
+            return False
+
         # Check if the month name is already used
-        if self.is_exist(months_path, get_month):
-            
-            print(f"Month: [ {get_month} ] already exist❗")
-            return None
+        if self.is_exist(months_path, month):
 
-        return get_month
+            print(f"Month: [ {month} ] already exist❗")
+            return False
+
+        return True
 
 
     # Create task folder
@@ -886,27 +2327,48 @@ class Executor():
 
         self.clear_terminal()
 
+        if not self.is_new_task(folder_name, folder_names_csv):
+
+            # Show the registered tasks of a duplicate
+            if folder_name and self.is_exist( file_path=folder_names_csv, name=folder_name ):
+                self.print_formatted_csv_table(file_path=folder_names_csv)
+
+            return None
+
+
+        return folder_name
+
+
+    # Validate a new task name
+    def is_new_task(self, folder_name:str, folder_names_csv: str):
+        """
+        ### Checks that a task name is not empty, valid and not registered yet.
+
+        :param folder_name (str): The lower case task name.
+        :param folder_names_csv (str): Path to tasks.csv Tracker.
+
+        Returns:
+            bool: True if the task can be created.
+        """
+
         # Validate Entry in empty
         if not folder_name:
 
             print("Folder name cannot be empty.")
-            return None
-        
+            return False
+
         # Validate DataType of input
         if not self.validate_inputs(entry=folder_name, entry_type="str"):
-            return None
+            return False
 
         # Check Duplicate Of Entry
         if self.is_exist( file_path=folder_names_csv, name=folder_name ):
 
             print(f"Task '{folder_name}' already exists in registry!")
+            return False
 
-            self.print_formatted_csv_table(file_path=folder_names_csv)
-            return None
-
+        return True
 
-        return folder_name
-            
 
 
     # Geting data as recorded in the existing header
@@ -919,7 +2381,10 @@ class Executor():
         """
  
         # List of the file header
-        header = list(pandas.read_csv(file_path).columns)
+        header = self.read_header(file_path)
+
+        # Types of the columns, if the task has a schema
+        schema = self.read_schema(file_path) or {}
 
         # List to apped the new data
         row_entries = []
@@ -933,27 +2398,335 @@ class Executor():
             if not get_entry:
                 print("You forgot to enter data!\n")
                 return None
-            
-            # Auto-detect type based on first character/format
-            current_type = "str"
-
-            for char in get_entry:
 
-                if char.isdigit():
-                    current_type = "int"
-                
-                if ":" in get_entry:
-                    current_type = "time"
+            entry = self.check_entry(col_name, get_entry, schema)
 
-                break
+            if entry is None:
+                return None
 
-            if self.validate_inputs(entry= get_entry, entry_type= current_type):
+            row_entries.append(entry)
 
-                row_entries.append(get_entry)
-            else:
-                print(f"Validation failed for {col_name}\n\n")
-                return None
-        
         if len(row_entries) == len(header):
             self.store_data(file_path= file_path, data_list= row_entries)
 
+
+    # Validate the entry of one column
+    def check_entry(self, col_name:str, entry:str, schema:dict):
+        """
+        ### Validates an entry with the type of its column and normalizes it.
+
+        - Uses the schema type, or detects the type from the entry
+          ("time" with a colon, "int" with a leading digit, "str" otherwise).
+
+        :param col_name (str): Name of the column.
+        :param entry (str): The entry.
+        :param schema (dict): Types of the columns, empty if the task has no schema.
+
+        Returns:
+            str: The normalized entry, or None if it is invalid.
+        """
+
+        # Type of the schema, or auto-detect based on first character/format
+        current_type = SCHEMA_TYPES.get(schema.get(col_name), "str")
+
+        if col_name not in schema and entry:
+
+            if entry[0].isdigit():
+                current_type = "int"
+
+            if ":" in entry:
+                current_type = "time"
+
+        if not self.validate_inputs(entry= entry, entry_type= current_type):
+
+            print(f"Validation failed for {col_name}\n\n")
+            return None
+
+        return self.normalize_entry(entry, schema.get(col_name))
+
+
+    # Validate a whole row of entries
+    def build_row(self, file_path: str, values: list):
+        """
+        ### Validates the entries of one row against the header of a month file.
+
+        :param file_path: Path to the month CSV file.
+        :param values (list): One entry per column of the header.
+
+        Returns:
+            list: The normalized row, or None if an entry is invalid.
+        """
+
+        header = self.read_header(file_path)
+
+        if len(values) != len(header):
+
+            print(f"\n\nExpected {len(header)} value(s) for {header}, got {len(values)}❗\n")
+            return None
+
+        # Types of the columns, if the task has a schema
+        schema = self.read_schema(file_path) or {}
+
+        row = []
+
+        for col_name, entry in zip(header, values):
+
+            entry = self.check_entry(col_name, entry.strip(), schema)
+
+            if entry is None:
+                return None
+
+            row.append(entry)
+
+        return row
+
+
+    # Append many rows with a single write
+    def append_rows(self, file_path, rows:list, record:bool = True):
+        """
+        ### Appends a list of rows to a CSV file in one buffered write.
+
+        :param file_path: Target CSV file.
+        :param rows (list): List of rows, every row is a list of values.
+        :param record (bool): Also update the row index, the manifest and the
+            reports (see record_rows()). False lets a caller do it apart from the write.
+        """
+
+        self.archives().check_writable(file_path)
+
+        with self.locks.lock(file_path):
+
+            with open( file_path, "a", newline= "") as f:
+                csv.writer(f).writerows(rows)
+
+        if record:
+            self.record_rows(file_path, rows)
+
+
+    # Bookkeeping of appended rows
+    def record_rows(self, file_path, rows:list):
+        """
+        ### Adds appended rows to the row index, the manifest and the running totals.
+
+        - The rows are already in the file: a failure here leaves them stored.
+
+        :param file_path: The CSV file the rows were appended to.
+        :param rows (list): The appended rows.
+        """
+
+        # Offsets of the new rows in the index of a month
+        if self.is_month_file(file_path):
+            self.row_index().update(file_path, create= False)
+
+        self.track(file_path, delta= len(rows))
+
+        # Keep the running totals of the reports
+        self.update_reports(file_path, rows)
+
+
+    # Load the rows to import from a file or the standard input
+    def read_import_source(self, source:str, header:list):
+        """
+        ### Reads the rows of a CSV or JSONL import source as a DataFrame of strings.
+
+        - `-` reads from the standard input.
+        - `.jsonl`/`.json` sources hold one JSON object (keys = header names) or list per line.
+          Other lines (invalid JSON, a number, a string) are rejected with their line number,
+          their text is kept in the first column.
+        - CSV sources may start with the header row of the month, it is skipped.
+
+        :param source (str): Path of the source file, or `-` for stdin.
+        :param header (list): Header of the target month file.
+
+        Returns
+        -------
+        tuple
+            (pandas.DataFrame: one column per header name, missing values as empty strings,
+             pandas.Series: the reason of the rejection of every unreadable row, empty string for the others)
+        """
+
+        import pandas
+
+        stream = sys.stdin if source == "-" else open(source, "r", newline= "")
+
+        # Reasons of the rows that could not be read
+        errors = []
+
+        try:
+
+            # JSON Lines: one record per line
+            if source.endswith((".jsonl", ".json")):
+
+                rows = []
+
+                for number, line in enumerate(stream, start= 1):
+
+                    if not line.strip():
+                        continue
+
+                    try:
+                        record = json.loads(line)
+
+                    except ValueError:
+                        record = None
+
+                    if isinstance(record, dict):
+                        rows.append([record.get(name, "") for name in header])
+                        errors.append("")
+
+                    elif isinstance(record, list):
+                        rows.append(record)
+                        errors.append("")
+
+                    else:
+                        rows.append([line.strip()])
+                        errors.append(f"line {number}: not a JSON object or list")
+
+            else:
+
+                rows = list(csv.reader(stream))
+
+                # Skip blank lines and the header row
+                rows = [row for row in rows if row]
+
+                if rows and [name.strip().lower() for name in rows[0]] == [name.lower() for name in header]:
+                    rows = rows[1:]
+
+                errors = [""] * len(rows)
+
+        finally:
+
+            if stream is not sys.stdin:
+                stream.close()
+
+        # Rows shorter than the header are padded, longer ones are kept for the length check
+        width = max([len(header)] + [len(row) for row in rows])
+
+        frame = pandas.DataFrame(
+            [[str(value).strip() for value in row] + [""] * (width - len(row)) for row in rows],
+            columns= header + [f"extra_{num}" for num in range(width - len(header))],
+            dtype= str
+        )
+
+        return frame.fillna(""), pandas.Series(errors, index= frame.index, dtype= str)
+
+
+    # Validate a whole frame of entries at once
+    def validate_frame(self, frame, header:list, schema:dict = None):
+        """
+        ### Validates every value of a DataFrame with vectorized string operations.
+
+        - Columns of the schema are validated against their type.
+        - Other types are detected like in get_data(): a colon means "time",
+          a leading digit means "int", anything else is "str".
+
+        :param frame (pandas.DataFrame): Rows to validate, all values as strings.
+        :param header (list): Header of the target month file.
+        :param schema (dict): Column types of the task, see read_schema().
+
+        Returns
+        -------
+        pandas.Series
+            The reason of the rejection of every row, empty string for valid rows.
+        """
+
+        import numpy
+        import pandas
+
+        reasons = pandas.Series("", index= frame.index)
+
+        # Values outside the header
+        for col_name in frame.columns[len(header):]:
+
+            extra = (frame[col_name] != "") & (reasons == "")
+            reasons[extra] = "too many values"
+
+        for col_name in header:
+
+            values = frame[col_name]
+
+            if schema and col_name in schema:
+
+                # Typed column
+                valid, _ = self.validate_batch(values, SCHEMA_TYPES.get(schema[col_name], "str"))
+
+            else:
+
+                # Detect the type of every value and validate every type group
+                types = self.detect_types(values)
+                valid = numpy.zeros(len(values), dtype= bool)
+
+                for entry_type in numpy.unique(types):
+
+                    group = types == entry_type
+                    valid[group], _ = self.validate_batch(values[group], entry_type)
+
+            # Keep the first reason of every row
+            empty = (values == "") & (reasons == "")
+            invalid = ~valid & (values != "") & (reasons == "")
+
+            reasons[empty] = f"empty {col_name}"
+            reasons[invalid] = f"invalid {col_name}"
+
+        return reasons
+
+
+    # Import many entries into a month file
+    def import_entries(self, file_path: str, source: str):
+        """
+        ### Bulk import of entries from a CSV/JSONL file (or stdin) into a month file.
+
+        - Validates the whole source against the month header at once.
+        - Appends all valid rows in one write.
+        - Writes the rejected rows with their reason to a reject file.
+
+        :param file_path: Path to the month CSV file.
+        :param source: Path of the source file, or `-` for the standard input.
+
+        Returns:
+        -------
+            tuple: (number of imported rows, number of rejected rows)
+        """
+
+        # List of the file header
+        header = self.read_header(file_path)
+
+        # Types of the columns, if the task has a schema
+        schema = self.read_schema(file_path) or {}
+
+        frame, errors = self.read_import_source(source, header)
+        reasons = self.validate_frame(frame, header, schema)
+
+        # Unreadable rows keep the reason of the source
+        reasons = errors.where(errors != "", reasons)
+
+        accepted = frame[reasons == ""][header].copy()
+        rejected = frame[reasons != ""][header].assign(error= reasons[reasons != ""])
+
+        # Durations of typed columns are stored as "H:MM"
+        for col_name, column_type in schema.items():
+
+            if column_type == "duration" and col_name in accepted and len(accepted):
+
+                minutes = self.validate_batch(accepted[col_name], "duration")[1].astype("int64")
+
+                accepted[col_name] = (minutes // 60).astype(str) + ":" + (minutes % 60).astype(str).str.zfill(2)
+
+        # One write for all the valid rows
+        if len(accepted):
+            self.append_rows(file_path, accepted.values.tolist())
+
+        print(f"\nImported {len(accepted)} row(s) into:\n")
+        print(f"- File: {file_path}\n")
+
+        # Keep the bad rows next to the source to fix and import them again
+        if len(rejected):
+
+            reject_path = "rejects.csv" if source == "-" else f"{os.path.splitext(source)[0]}.rejects.csv"
+
+            rejected.to_csv(reject_path, index= False)
+
+            print(f"Rejected {len(rejected)} row(s), see:\n")
+            print(f"- File: {reject_path}\n")
+
+        return len(accepted), len(rejected)
@@ -0,0 +1,594 @@
+"""
+Manifest Module
+================
+
+This module contains the `Manifest` class, an index of the whole data tree
+kept in `TaskData/manifest.json`:
+
+    {"version": 1, "root": {"dirs": {"2026": {"dirs": {"gym": {"dirs": {}, "files": {
+        "Jan.csv": {"size": 1204, "mtime": 1767225600000000000, "tomb": 0, "rows": 31},
+        "months.csv": {"size": 11, "mtime": 1767225600000000000}, ...}}}, ...}}, "files": {...}}}
+
+- Every directory and file made by `Generator` and every write of `Executor`
+  updates its entry, so the number of years, tasks and files of a directory
+  and the row count of a month are lookups instead of directory walks or
+  file reads.
+- Appends and deletions add to the row count of a month, the rows are not
+  counted again.
+- A month entry keeps the size and mtime of the file and the size of its
+  tombstone log. A month changed without the manifest (by hand, by an older
+  version) does not match anymore and is counted again on its next lookup.
+- A missing manifest is built by walking the tree once.
+- Changes are not written into manifest.json: each one is a JSON line
+  appended to `manifest.journal` under the manifest lock (the new entry of a
+  file, the new node of a directory, or a removal). Loading replays the
+  journal on top of manifest.json, a process that already holds the
+  manifest only reads the lines appended since. Once the journal passes
+  `JOURNAL_LIMIT` bytes it is compacted: manifest.json is replaced and the
+  journal removed.
+- `batch()` groups the changes of one operation (a command, a group commit
+  of the daemon) into one append.
+- Only the names of the tree are recorded: hidden files (locks, snapshots,
+  temporary files), tombstone logs and row indexes are left out. An
+  archived year (archive.py) is recorded as its `<year>.zip` file.
+
+Usage:
+    python manifest.py rebuild|show [--base-dir DIR]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+from manager import Executor, REPORT_LOG_SUFFIX, TOMBSTONE_SUFFIX
+from rowindex import INDEX_SUFFIX
+
+
+# File of the manifest in the base folder
+MANIFEST_FILE = "manifest.json"
+
+# Journal of the changes since manifest.json was written
+JOURNAL_FILE = "manifest.journal"
+
+# Format of the manifest, an other version is rebuilt
+MANIFEST_VERSION = 1
+
+# Size of the journal (bytes) that gets it compacted into manifest.json
+JOURNAL_LIMIT = 256 * 1024
+
+
+class Manifest():
+    """
+    Index of the years, tasks, months and files of a data tree."""
+
+    def __init__(self, executor: Executor, base_dir:str):
+
+        # Counts the rows of a month and locks the manifest
+        self.executor = executor
+
+        # Root of the tree and path of the manifest
+        self.base_dir = os.path.abspath(base_dir)
+        self.path = os.path.join(self.base_dir, MANIFEST_FILE)
+
+        self.journal_path = os.path.join(self.base_dir, JOURNAL_FILE)
+
+        # Parsed manifest and the (mtime, size) it was read at
+        self.cache = None
+        self.stamp = None
+
+        # Inode of the journal and the bytes of it applied to the cache
+        self.journal_inode = None
+        self.journal_offset = 0
+
+        # Journal lines of the running batch (see batch()), None outside of a batch
+        self.pending = None
+        self.depth = 0
+
+
+    # Names of a path below the base folder
+    def parts(self, path):
+        """
+        ### Splits a path into the names below the base folder.
+
+        :param path (str): A file or directory of the tree.
+
+        Returns:
+            list: e.g. ["2026", "gym", "Jan.csv"], [] for the base folder,
+            or None for a path outside the tree or not recorded.
+        """
+
+        relative = os.path.relpath(os.path.abspath(path), self.base_dir)
+
+        if relative == os.curdir:
+            return []
+
+        parts = relative.split(os.sep)
+
+        if parts[0] == os.pardir or not all(self.is_tracked(name) for name in parts):
+            return None
+
+        return parts
+
+
+    # Check if a name is recorded
+    def is_tracked(self, name:str):
+        """
+        ### Returns True if a file or directory name belongs in the manifest.
+        """
+
+        return (
+            not name.startswith(".") and not name.endswith((TOMBSTONE_SUFFIX, INDEX_SUFFIX, REPORT_LOG_SUFFIX))
+            and name not in (MANIFEST_FILE, JOURNAL_FILE)
+        )
+
+
+    # Read the manifest
+    def load(self):
+        """
+        ### Returns the manifest, parsing it only if it changed and building it if it is missing.
+
+        - manifest.json is parsed again only if it was replaced, the journal
+          is read from the last applied line.
+
+        Returns:
+            dict: {"version": int, "root": directory node}
+        """
+
+        # Twice at most: a journal compacted while it was read is read again
+        for _ in range(2):
+
+            stamp = self.executor.file_stamp(self.path)
+
+            if self.cache is None or stamp != self.stamp:
+
+                try:
+                    with open(self.path, "r") as f:
+                        data = json.load(f)
+
+                except (OSError, ValueError):
+                    data = None
+
+                if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+                    return self.rebuild()
+
+                self.cache, self.stamp = data, stamp
+                self.journal_inode, self.journal_offset = None, 0
+
+            if self.replay():
+                return self.cache
+
+            self.cache = None
+
+        return self.rebuild()
+
+
+    # Apply the new lines of the journal
+    def replay(self):
+        """
+        ### Applies the journal lines appended since the last load to the cached manifest.
+
+        - A last line without its line break (being written) is left for the next load.
+
+        Returns:
+            bool: False if the journal was replaced since the last load (the cache
+            must be read again), True otherwise.
+        """
+
+        try:
+            f = open(self.journal_path, "rb")
+
+        except FileNotFoundError:
+
+            self.journal_inode, self.journal_offset = None, 0
+            return True
+
+        with f:
+
+            stat = os.fstat(f.fileno())
+
+            # A journal compacted (removed) and started again
+            if self.journal_offset and (stat.st_ino != self.journal_inode or stat.st_size < self.journal_offset):
+                return False
+
+            f.seek(self.journal_offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+
+        for line in data[:end].splitlines():
+
+            if line.strip():
+                self.apply(self.cache, json.loads(line))
+
+        self.journal_inode = stat.st_ino
+        self.journal_offset += end
+
+        return True
+
+
+    # Apply one change
+    def apply(self, data:dict, change:dict):
+        """
+        ### Applies one journal change to a manifest.
+
+        :param data (dict): The whole manifest, changed in place.
+        :param change (dict): {"path": names, "entry": file entry} for a file,
+            {"path": names, "node": directory node} for a directory, {"path": names} for a removal.
+        """
+
+        node = data["root"]
+        *parents, name = change["path"]
+
+        for parent in parents:
+
+            if parent not in node["dirs"] and "entry" not in change and "node" not in change:
+                return None
+
+            node = node["dirs"].setdefault(parent, {"dirs": {}, "files": {}})
+
+        if "entry" in change:
+
+            node["files"][name] = change["entry"]
+
+        elif "node" in change:
+
+            node["dirs"][name] = change["node"]
+
+        else:
+
+            node["dirs"].pop(name, None)
+            node["files"].pop(name, None)
+
+
+    # Record a change in the journal
+    def record(self, change:dict):
+        """
+        ### Appends a change to the journal, compacts the journal once it is too long.
+
+        - Held back until the end of a batch (see batch()).
+        - Called under the lock of the manifest, the change is already in the cache.
+
+        :param change (dict): The change (see apply()).
+        """
+
+        line = json.dumps(change, separators= (",", ":")) + "\n"
+
+        if self.pending is not None:
+
+            self.pending.append(line)
+            return None
+
+        self.write_journal(line)
+
+
+    # Append to the journal
+    def write_journal(self, text:str):
+        """
+        ### Appends lines to the journal and marks them as applied to the cache.
+
+        :param text (str): One or more journal lines.
+        """
+
+        size = self.executor.locks.append(self.journal_path, text)
+
+        self.journal_inode = os.stat(self.journal_path).st_ino
+        self.journal_offset = size
+
+        if size > JOURNAL_LIMIT:
+            self.save(self.cache)
+
+
+    # Group the changes of an operation
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        ### Writes every change recorded inside the block with one append at its end.
+
+        - The changes are applied to the cache right away, lookups inside the
+          block see them. Blocks can be nested, the outer one writes.
+        """
+
+        self.depth += 1
+
+        if self.pending is None:
+            self.pending = []
+
+        try:
+            yield self
+
+        finally:
+
+            self.depth -= 1
+
+            if self.depth == 0:
+
+                pending, self.pending = self.pending, None
+
+                if pending:
+
+                    with self.executor.locks.lock(self.path):
+
+                        # Lines of other processes first, then this batch (again if
+                        # manifest.json was replaced meanwhile, the changes are idempotent)
+                        data = self.load()
+
+                        for line in pending:
+                            self.apply(data, json.loads(line))
+
+                        self.write_journal("".join(pending))
+
+
+    # Write the manifest
+    def save(self, data:dict):
+        """
+        ### Replaces the manifest file atomically, removes the journal and keeps it in the cache.
+
+        - Full rewrites only: a rebuild or the compaction of the journal.
+
+        :param data (dict): The whole manifest.
+        """
+
+        with self.executor.locks.lock(self.path):
+
+            with self.executor.locks.atomic_write(self.path) as f:
+                json.dump(data, f, separators= (",", ":"))
+
+            # Every change of the journal is in the new file
+            try:
+                os.remove(self.journal_path)
+
+            except FileNotFoundError:
+                pass
+
+        self.cache, self.stamp = data, self.executor.file_stamp(self.path)
+        self.journal_inode, self.journal_offset = None, 0
+
+
+    # Walk a directory
+    def scan(self, directory):
+        """
+        ### Returns the node of a directory and of everything below it, from the disk.
+
+        :param directory (str): Path of the directory.
+        """
+
+        node = {"dirs": {}, "files": {}}
+
+        with os.scandir(directory) as entries:
+
+            for entry in entries:
+
+                if not self.is_tracked(entry.name):
+                    continue
+
+                if entry.is_dir(follow_symlinks= False):
+                    node["dirs"][entry.name] = self.scan(entry.path)
+
+                elif entry.is_file(follow_symlinks= False):
+                    node["files"][entry.name] = self.file_entry(entry.path)
+
+        return node
+
+
+    # Walk the tree
+    def rebuild(self):
+        """
+        ### Builds the manifest from the files on disk.
+
+        Returns:
+            dict: The new manifest.
+        """
+
+        with self.executor.locks.lock(self.path):
+
+            root = self.scan(self.base_dir) if os.path.isdir(self.base_dir) else {"dirs": {}, "files": {}}
+            data = {"version": MANIFEST_VERSION, "root": root}
+
+            if os.path.isdir(self.base_dir):
+                self.save(data)
+
+        return data
+
+
+    # Describe a file
+    def file_entry(self, file_path, old:dict = None, delta:int = None):
+        """
+        ### Returns the entry of a file: size, mtime and, for a month, the tombstone size and rows.
+
+        :param file_path (str): Path of the file.
+        :param old (dict): The previous entry of the file, if any.
+        :param delta (int): Rows added (or removed) since the previous entry, None to count them.
+        """
+
+        stat = os.stat(file_path)
+        entry = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+        if self.executor.is_month_file(file_path):
+
+            entry["tomb"] = self.tomb_size(file_path)
+
+            if delta is not None and old and "rows" in old:
+                entry["rows"] = old["rows"] + delta
+
+            else:
+                # Counted without the manifest (see Executor.count_rows())
+                entry["rows"] = self.executor.read_page(file_path, 0, 0)[2]
+
+        return entry
+
+
+    # Size of the tombstone log of a month
+    def tomb_size(self, file_path):
+        """
+        ### Returns the size of the tombstone log of a month file, 0 without a log.
+        """
+
+        try:
+            return os.stat(file_path + TOMBSTONE_SUFFIX).st_size
+
+        except FileNotFoundError:
+            return 0
+
+
+    # Record a change
+    def update(self, path, delta:int = None):
+        """
+        ### Refreshes the entry of a changed file or directory from the disk.
+
+        - A path that does not exist anymore is removed with everything below it.
+        - A new directory is recorded with its content.
+        - The lock of the manifest is taken last: nothing else is locked while it is held.
+
+        :param path (str): The created, changed or removed path.
+        :param delta (int): Rows added to (or removed from) a month file, None to count them.
+        """
+
+        parts = self.parts(path)
+
+        # The base folder itself or a path that is not recorded
+        if not parts:
+            return None
+
+        with self.executor.locks.lock(self.path):
+
+            data = self.load()
+            node = data["root"]
+            exists = os.path.exists(path)
+
+            # Directories above the path, made on the way (unless the path is gone)
+            for name in parts[:-1]:
+
+                if name not in node["dirs"] and not exists:
+                    return None
+
+                node = node["dirs"].setdefault(name, {"dirs": {}, "files": {}})
+
+            name = parts[-1]
+
+            if os.path.isdir(path):
+
+                if name in node["dirs"]:
+                    return None
+
+                # A new directory is empty, a restored year (archive.py) is not
+                change = {"path": parts, "node": self.scan(path)}
+
+            elif os.path.isfile(path):
+
+                entry = self.file_entry(path, node["files"].get(name), delta)
+
+                if node["files"].get(name) == entry:
+                    return None
+
+                change = {"path": parts, "entry": entry}
+
+            else:
+
+                if name not in node["dirs"] and name not in node["files"]:
+                    return None
+
+                change = {"path": parts}
+
+            self.apply(data, change)
+            self.record(change)
+
+
+    # Find a directory
+    def node(self, dir_path):
+        """
+        ### Returns the node of a directory: {"dirs": {name: node}, "files": {name: entry}}.
+
+        :param dir_path (str): Path of a directory of the tree.
+
+        Returns:
+            dict: The node, or None if the directory is not recorded.
+        """
+
+        parts = self.parts(dir_path)
+
+        if parts is None:
+            return None
+
+        node = self.load()["root"]
+
+        for name in parts:
+
+            node = node["dirs"].get(name)
+
+            if node is None:
+                return None
+
+        return node
+
+
+    # Check a path
+    def contains(self, path):
+        """
+        ### Returns True if a path is recorded, False if not, None if it is not a recorded kind of path.
+        """
+
+        parts = self.parts(path)
+
+        if not parts:
+            return None
+
+        node = self.node(os.path.dirname(path))
+
+        if node is None:
+            return False
+
+        return parts[-1] in node["dirs"] or parts[-1] in node["files"]
+
+
+    # Row count of a month
+    def rows(self, file_path):
+        """
+        ### Returns the recorded row count of a month file if the file did not change since.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            int: The live rows, or None if the month is unknown or was changed without the manifest.
+        """
+
+        node = self.node(os.path.dirname(file_path))
+        entry = node["files"].get(os.path.basename(file_path)) if node else None
+
+        if not entry or "rows" not in entry:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+
+        except FileNotFoundError:
+            return None
+
+        if (stat.st_size, stat.st_mtime_ns, self.tomb_size(file_path)) != (entry["size"], entry["mtime"], entry["tomb"]):
+            return None
+
+        return entry["rows"]
+
+
+if __name__ == "__main__":
+
+    # Default base directory of the tracker
+    default_base = os.path.join(os.path.expanduser("~"), "Documents", "TaskData")
+
+    parser = argparse.ArgumentParser(description= "Manifest of the Task Data Tracker.")
+    parser.add_argument("command", choices= ["rebuild", "show"], help= "Rebuild the manifest from the tree or print it.")
+    parser.add_argument("--base-dir", default= default_base, help= "Base directory of the CSV tree.")
+
+    args = parser.parse_args()
+
+    manifest = Manifest(Executor(), args.base_dir)
+
+    data = manifest.rebuild() if args.command == "rebuild" else manifest.load()
+
+    for year, year_node in data["root"]["dirs"].items():
+
+        print(f"\nYear [ {year} ]: {len(year_node['dirs'])} task(s)")
+
+        for task, task_node in year_node["dirs"].items():
+
+            months = {name: entry for name, entry in task_node["files"].items() if "rows" in entry}
+            print(f"- {task}: " + ", ".join(f"{name[:-4]} ({entry['rows']} rows)" for name, entry in months.items()))
@@ -0,0 +1,294 @@
+"""
+Profiling Module
+================
+
+This module contains the `Profiler` class, an opt-in instrumentation of the
+`Executor` and `Generator` methods. It is turned on with the environment
+variable `TASK_TRACKER_PROFILE=1` or with `python main.py --profile ...`.
+
+For every method call it records:
+
+- wall time,
+- bytes read and written by the process (`rchar`/`wchar` of `/proc/self/io`,
+  Linux only, page cache included),
+- files opened (an audit hook on the "open" event),
+- peak traced memory above the memory at the call (`tracemalloc`).
+
+The numbers of a call include the methods it calls. Calls slower than
+`TASK_TRACKER_PROFILE_THRESHOLD` milliseconds (default 100) are logged when
+they end, to `TASK_TRACKER_PROFILE_LOG` or the standard error, and a summary
+table of every method is printed there when the program exits.
+
+Tracing the memory slows the program down, the profiler costs nothing when
+it is off.
+"""
+
+import atexit
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+
+# Profiling is turned on by the environment (or main.py --profile)
+PROFILE_ENABLED = os.environ.get("TASK_TRACKER_PROFILE", "0").strip() not in ("", "0")
+
+# Calls slower than this (milliseconds) are logged
+SLOW_THRESHOLD_MS = float(os.environ.get("TASK_TRACKER_PROFILE_THRESHOLD", "100"))
+
+# File of the log and the summary (standard error if not set)
+PROFILE_LOG = os.environ.get("TASK_TRACKER_PROFILE_LOG")
+
+# I/O counters of the process (Linux)
+PROC_IO = "/proc/self/io"
+
+
+class Profiler():
+    """
+    Times the methods of instrumented classes and summarizes them at exit."""
+
+    def __init__(self, threshold_ms:float = SLOW_THRESHOLD_MS, log_path:str = PROFILE_LOG):
+
+        # Turned on by enable()
+        self.enabled = False
+
+        # Calls slower than this are logged
+        self.threshold_ms = threshold_ms
+        self.log_path = log_path
+
+        # Totals of every method: {name: {"calls", "seconds", "max_seconds", "read", "written", "opens", "peak"}}
+        self.stats = {}
+
+        # Files opened by the process while profiling
+        self.opens = 0
+
+        # Open descriptor of /proc/self/io, None if it is not available
+        self.io_fd = None
+
+        # Running calls of every thread (for the nested memory peaks)
+        self.local = threading.local()
+
+        # Protects the totals
+        self.guard = threading.Lock()
+
+
+    # Start profiling
+    def enable(self):
+        """
+        ### Starts the memory tracing, the open counter and the summary at exit (once).
+        """
+
+        if self.enabled:
+            return None
+
+        self.enabled = True
+
+        tracemalloc.start()
+
+        # Audit hooks can not be removed, the hook only counts while enabled
+        sys.addaudithook(self.audit)
+
+        try:
+            self.io_fd = os.open(PROC_IO, os.O_RDONLY)
+
+        except OSError:
+            self.io_fd = None
+
+        atexit.register(self.report)
+
+
+    # Count the opened files
+    def audit(self, event:str, args):
+        """
+        ### Audit hook: counts the "open" events of the process.
+        """
+
+        if event == "open" and self.enabled:
+            self.opens += 1
+
+
+    # Read the I/O counters
+    def io_counters(self):
+        """
+        ### Returns (bytes read, bytes written) by the process so far, or None without /proc.
+
+        - Read with pread() on a kept descriptor, no file is opened. The bytes of
+          this read itself are left out.
+        """
+
+        if self.io_fd is None:
+            return None
+
+        data = os.pread(self.io_fd, 4096, 0)
+
+        counters = dict(line.split(b": ") for line in data.splitlines() if b": " in line)
+
+        return int(counters[b"rchar"]) - len(data), int(counters[b"wchar"])
+
+
+    # Wrap the methods of an object
+    def instrument(self, obj):
+        """
+        ### Wraps the public methods of the classes of an object (Executor, Generator, ...).
+
+        - The classes are patched, every instance is profiled. A method is wrapped once.
+        - Generator methods (e.g. read_month_chunks) are left out, their work is
+          counted in the methods consuming them.
+
+        :param obj: An instance of the class to profile.
+        """
+
+        for cls in type(obj).__mro__:
+
+            if cls is object:
+                continue
+
+            for name, function in list(vars(cls).items()):
+
+                if name.startswith("__") or not inspect.isfunction(function) or inspect.isgeneratorfunction(function):
+                    continue
+
+                if getattr(function, "profiled", False):
+                    continue
+
+                setattr(cls, name, self.wrap(function))
+
+
+    # Wrap one method
+    def wrap(self, function):
+        """
+        ### Returns a method recording its calls in the totals.
+        """
+
+        name = function.__qualname__
+
+        @functools.wraps(function)
+        def profiled(*args, **kwargs):
+
+            if not self.enabled:
+                return function(*args, **kwargs)
+
+            stack = self.local.__dict__.setdefault("stack", [])
+
+            # The peak of the running call is kept before it is reset for this one
+            current, peak = tracemalloc.get_traced_memory()
+
+            if stack:
+                stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+
+            tracemalloc.reset_peak()
+
+            frame = {"peak": current}
+            stack.append(frame)
+
+            io_before = self.io_counters()
+            opens_before = self.opens
+            started = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+
+                seconds = time.perf_counter() - started
+                io_after = self.io_counters()
+
+                stack.pop()
+
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+
+                # The running call saw this peak too
+                if stack:
+                    stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+
+                read, written = (
+                    (io_after[0] - io_before[0], io_after[1] - io_before[1]) if io_before and io_after else (0, 0)
+                )
+
+                self.record(name, seconds, read, written, self.opens - opens_before, peak - current)
+
+        profiled.profiled = True
+
+        return profiled
+
+
+    # Add a call to the totals
+    def record(self, name:str, seconds:float, read:int, written:int, opens:int, peak:int):
+        """
+        ### Adds one call to the totals of a method and logs it if it was slow.
+        """
+
+        with self.guard:
+
+            stats = self.stats.setdefault(
+                name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "read": 0, "written": 0, "opens": 0, "peak": 0}
+            )
+
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["read"] += read
+            stats["written"] += written
+            stats["opens"] += opens
+            stats["peak"] = max(stats["peak"], peak)
+
+        if seconds * 1000 >= self.threshold_ms:
+
+            self.write(
+                f"[profile] slow: {name} {seconds * 1000:.1f} ms, read {read / 1024:.1f} KB, "
+                f"written {written / 1024:.1f} KB, {opens} file(s) opened, peak {peak / 1024:.1f} KB"
+            )
+
+
+    # Write to the log
+    def write(self, text:str):
+        """
+        ### Writes a line to the profile log, or to the standard error.
+        """
+
+        if self.log_path:
+
+            with open(self.log_path, "a") as f:
+                f.write(text + "\n")
+
+        else:
+            print(text, file= sys.stderr)
+
+
+    # Summary table
+    def report(self):
+        """
+        ### Writes the totals of every method, the slowest first (called at exit).
+        """
+
+        if not self.stats:
+            return None
+
+        # The summary itself is not counted
+        self.enabled = False
+
+        lines = [
+            "",
+            f"[profile] {'method':<36}{'calls':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}"
+            f"{'read KB':>10}{'written KB':>12}{'opens':>7}{'peak KB':>10}"
+        ]
+
+        for name, stats in sorted(self.stats.items(), key= lambda item: item[1]["seconds"], reverse= True):
+
+            lines.append(
+                f"[profile] {name:<36}{stats['calls']:>7}{stats['seconds'] * 1000:>11.1f}"
+                f"{stats['seconds'] * 1000 / stats['calls']:>10.2f}{stats['max_seconds'] * 1000:>10.1f}"
+                f"{stats['read'] / 1024:>10.1f}{stats['written'] / 1024:>12.1f}{stats['opens']:>7}{stats['peak'] / 1024:>10.1f}"
+            )
+
+        if self.io_fd is None:
+            lines.append("[profile] (bytes read/written need /proc/self/io, not available here)")
+
+        self.write("\n".join(lines))
+
+
+# One profiler per process
+PROFILER = Profiler()
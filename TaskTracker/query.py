@@ -0,0 +1,475 @@
+"""
+Query Module
+================
+
+This module contains the `QueryEngine` class, which searches the rows of many
+month files at once instead of opening them one by one in the menu:
+
+    year=2026 task=gym month>=Mar where hours>1 select date,hours
+
+- `year`, `task` and `month` terms select the month files. They are checked
+  against the trackers (years.csv, tasks.csv, months.csv), so the plan is
+  known before any month file is opened. Months compare in calendar order.
+- `where` terms filter the rows. All terms must match. A column typed in the
+  schema of the task is compared with that type, otherwise the type of the
+  value decides: "1:30" -> duration (minutes), "2026-01-05" -> date,
+  "12" -> number, anything else -> text.
+- A bare number means hours against a duration: `hours>1` keeps the rows
+  over 1:00. A column typed "duration" is a duration; in a task without a
+  schema every "H:MM" entry is one (detected like `get_data()` does), its
+  other entries compare as numbers.
+- `select` lists the returned columns (all columns without it).
+
+Only the selected and filtered columns are parsed (`usecols`), in chunks of
+`CHUNK_SIZE` rows, and the matching rows are streamed one by one.
+
+Used by `python main.py query "..."`.
+"""
+
+import operator
+import os
+import re
+from manager import CHUNK_SIZE, DATE_PATTERN, DURATION_PATTERN, ENTRY_PATTERNS, SCHEMA_TYPES
+
+
+# Terms selecting the month files instead of rows
+SCOPE_KEYS = ("year", "task", "month")
+
+# Comparison operators of the terms
+OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+
+# One term: name, operator, value (a quoted value may hold spaces)
+TERM_PATTERN = re.compile(r"""\s*("[^"]+"|\w+)\s*(==|!=|<=|>=|=|<|>)\s*("[^"]*"|'[^']*'|[^\s"']+)\s*""")
+
+# Keywords starting the filter and the column list
+KEYWORD_PATTERN = re.compile(r"\b(where|select)\b", re.IGNORECASE)
+
+
+class QueryEngine():
+    """
+    Plans and runs queries over the Year/Task/Month hierarchy."""
+
+    def __init__(self, executor, base_dir:str, month_names:list):
+
+        # Reads the trackers and the month files
+        self.executor = executor
+        self.base_dir = base_dir
+
+        # Calendar position of every month name
+        self.month_order = {name: num for num, name in enumerate(month_names)}
+
+
+    # Split a query into its terms
+    def parse(self, text:str):
+        """
+        ### Parses the text of a query.
+
+        :param text (str): e.g. "year=2026 task=gym month>=Mar where hours>1 select date,hours"
+
+        Returns:
+            dict: {"scope": [(key, operator, value)], "where": [(column, operator, value)],
+            "select": list of columns or None}, or None if the query is invalid.
+        """
+
+        query = {"scope": [], "where": [], "select": None}
+
+        parts = KEYWORD_PATTERN.split(text)
+
+        # Terms before the first keyword, then (keyword, text) pairs
+        sections = [("where", parts[0])] + [(parts[num].lower(), parts[num + 1]) for num in range(1, len(parts), 2)]
+
+        for keyword, body in sections:
+
+            if keyword == "select":
+
+                columns = [name.strip().strip('"').lower() for name in body.split(",")]
+
+                if not all(columns):
+
+                    print(f"\n\nInvalid column list: [ {body.strip()} ]❗\n")
+                    return None
+
+                # "*" keeps every column
+                query["select"] = None if columns == ["*"] else [name for name in columns if name not in SCOPE_KEYS]
+                continue
+
+            terms = self.parse_terms(body)
+
+            if terms is None:
+                return None
+
+            for name, symbol, value in terms:
+
+                # Hierarchy terms select files, the other terms filter rows
+                if name in SCOPE_KEYS:
+
+                    value = self.scope_value(name, value)
+
+                    if value is None:
+                        return None
+
+                    query["scope"].append((name, symbol, value))
+
+                else:
+                    query["where"].append((name, symbol, value))
+
+        return query
+
+
+    # Read the terms of one section
+    def parse_terms(self, body:str):
+        """
+        ### Splits a section into (name, operator, value) terms, "and" between terms is optional.
+
+        :param body (str): Text of the section.
+
+        Returns:
+            list: The terms, or None if a part of the text is not a term.
+        """
+
+        terms = []
+        position = 0
+        body = body.strip()
+
+        while position < len(body):
+
+            # Skip the optional "and"
+            joiner = re.match(r"\s*and\s+", body[position:], re.IGNORECASE)
+
+            if joiner and terms:
+                position += joiner.end()
+
+            match = TERM_PATTERN.match(body, position)
+
+            if not match:
+
+                print(f"\n\nInvalid term: [ {body[position:].strip()} ]❗ Use name=value (=, !=, <, <=, >, >=).\n")
+                return None
+
+            name, symbol, value = match.groups()
+
+            terms.append((name.strip('"').lower(), symbol, value.strip("\"'")))
+            position = match.end()
+
+        return terms
+
+
+    # Normalize the value of a hierarchy term
+    def scope_value(self, key:str, value:str):
+        """
+        ### Returns the value of a year/task/month term in the form it is compared in.
+
+        - year -> number, month -> calendar position, task -> lower case name.
+
+        Returns:
+            The comparable value, or None if it is invalid.
+        """
+
+        if key == "year":
+
+            if not value.isdigit():
+
+                print(f"\n\nInvalid year: [ {value} ]❗\n")
+                return None
+
+            return int(value)
+
+        if key == "month":
+
+            month = value.capitalize()
+
+            if month not in self.month_order:
+
+                print(f"\n\nInvalid month: [ {value} ]❗ Use one of {' '.join(self.month_order)}.\n")
+                return None
+
+            return self.month_order[month]
+
+        return value.lower()
+
+
+    # Check the hierarchy terms of one level
+    def in_scope(self, query:dict, key:str, name:str):
+        """
+        ### Returns True if a year, task or month name matches every term of its level.
+        """
+
+        if key == "year":
+            value = int(name) if name.isdigit() else None
+
+        elif key == "month":
+            value = self.month_order.get(name)
+
+        else:
+            value = name.lower()
+
+        # Names that can not be compared (e.g. a stray registry row) never match
+        if value is None:
+            return False
+
+        return all(OPERATORS[symbol](value, expected) for term_key, symbol, expected in query["scope"] if term_key == key)
+
+
+    # Find the month files of a query
+    def plan(self, query:dict):
+        """
+        ### Lists the month files a query has to read, using only the trackers.
+
+        - A file missing a filtered column, or holding none of the selected
+          columns, is left out.
+        - Only the selected and filtered columns of a file are read.
+        - The where values are checked against the column types of every task.
+
+        :param query (dict): A parsed query.
+
+        Returns:
+            list: One dict per file: {"year", "task", "month", "path", "columns": columns to read,
+            "terms": where terms of the task}, or None if a where value does not fit its column.
+        """
+
+        executor = self.executor
+        steps = []
+
+        # Columns of the where terms
+        filtered = {name for name, _, _ in query["where"]}
+
+        for year in executor.read_registry(os.path.join(self.base_dir, "years.csv")):
+
+            if not self.in_scope(query, "year", year):
+                continue
+
+            year_dir = os.path.join(self.base_dir, year)
+
+            for task in executor.read_registry(os.path.join(year_dir, "tasks.csv")):
+
+                if not self.in_scope(query, "task", task):
+                    continue
+
+                task_dir = os.path.join(year_dir, task)
+
+                # The where terms typed with the schema of the task
+                terms = self.compile_terms(query["where"], executor.read_schema(task_dir) or {})
+
+                if terms is None:
+                    return None
+
+                for month in executor.read_registry(os.path.join(task_dir, "months.csv")):
+
+                    if not self.in_scope(query, "month", month):
+                        continue
+
+                    path = os.path.join(task_dir, f"{month}.csv")
+                    header = executor.read_header(path)
+
+                    if not filtered.issubset(header):
+                        continue
+
+                    if query["select"] and not set(query["select"]).intersection(header):
+                        continue
+
+                    # Keep the order of the file
+                    wanted = filtered.union(query["select"] if query["select"] is not None else header)
+
+                    # At least one column is parsed to count the rows
+                    columns = [name for name in header if name in wanted] or header[:1]
+
+                    steps.append({
+                        "year": year, "task": task, "month": month, "path": path,
+                        "columns": columns, "terms": terms
+                    })
+
+        return steps
+
+
+    # Type of a where term
+    def term_type(self, value:str, column_type:str = None):
+        """
+        ### Returns the entry type a term compares with.
+
+        :param value (str): The value of the term.
+        :param column_type (str): Type of the column in the task schema, if any.
+
+        Returns:
+            str: An entry type, "hours" for a bare number against a duration column,
+            or "number" for a bare number against an untyped column.
+        """
+
+        number = ENTRY_PATTERNS["int"].fullmatch(value) and any(char.isdigit() for char in value)
+
+        if column_type in SCHEMA_TYPES:
+
+            entry_type = SCHEMA_TYPES[column_type]
+
+            return "hours" if entry_type == "duration" and number else entry_type
+
+        if ":" in value and DURATION_PATTERN.fullmatch(value):
+            return "duration"
+
+        if DATE_PATTERN.fullmatch(value):
+            return "date"
+
+        if number:
+            return "number"
+
+        return "str"
+
+
+    # Type and parse the values of the where terms
+    def compile_terms(self, terms:list, schema:dict):
+        """
+        ### Parses the value of every where term once, with the type it compares with.
+
+        :param terms (list): The where terms (column, operator, value).
+        :param schema (dict): Column types of the task, empty without a schema.
+
+        Returns:
+            list: (column, operator, entry type, parsed value) per term, or None
+            if a value does not fit its column type.
+        """
+
+        compiled = []
+
+        for name, symbol, value in terms:
+
+            entry_type = self.term_type(value, schema.get(name))
+
+            # Text compares as it is stored
+            if entry_type == "str":
+
+                compiled.append((name, symbol, entry_type, value))
+                continue
+
+            # Bare numbers are parsed as numbers, compared in hours with durations
+            valid, parsed = self.executor.validate_batch([value], "int" if entry_type in ("hours", "number") else entry_type)
+
+            if not valid[0]:
+
+                print(f"\n\nInvalid value for [ {name} ] ({entry_type}): [ {value} ]❗\n")
+                return None
+
+            compiled.append((name, symbol, entry_type, parsed.iloc[0]))
+
+        return compiled
+
+
+    # Rows of a chunk matching the where terms
+    def match_rows(self, chunk, terms:list):
+        """
+        ### Returns the mask of the rows of a chunk that match every where term.
+
+        :param chunk (pandas.DataFrame): Rows of a month file (strings).
+        :param terms (list): The compiled where terms.
+
+        Returns:
+            numpy.ndarray: bool mask.
+        """
+
+        import numpy
+
+        mask = numpy.ones(len(chunk), dtype= bool)
+
+        for name, symbol, entry_type, expected in terms:
+
+            values = chunk[name].fillna("")
+
+            if entry_type == "str":
+
+                mask &= OPERATORS[symbol](values, expected).to_numpy(dtype= bool)
+                continue
+
+            if entry_type in ("hours", "number"):
+
+                mask &= self.match_number(values, symbol, expected, entry_type == "hours")
+                continue
+
+            # Column parsed like the value, entries of another type never match
+            valid, parsed = self.executor.validate_batch(values, entry_type)
+
+            mask &= valid & OPERATORS[symbol](parsed, expected).fillna(False).to_numpy(dtype= bool)
+
+        return mask
+
+
+    # Rows matching a bare number
+    def match_number(self, values, symbol:str, expected, duration:bool):
+        """
+        ### Returns the mask of the entries matching a bare number term.
+
+        - Durations compare with the number in hours, other entries as numbers.
+
+        :param values (pandas.Series): Entries of the column (strings).
+        :param symbol (str): Operator of the term.
+        :param expected: The number of the term.
+        :param duration (bool): The column is typed "duration" in the schema. Otherwise
+            only the entries detected as durations ("H:MM") are.
+
+        Returns:
+            numpy.ndarray: bool mask.
+        """
+
+        import numpy
+
+        compare = OPERATORS[symbol]
+
+        if duration:
+            is_duration = numpy.ones(len(values), dtype= bool)
+
+        else:
+            is_duration = self.executor.detect_types(values) == "time"
+
+        minutes_valid, minutes = self.executor.validate_batch(values, "duration")
+        numbers_valid, numbers = self.executor.validate_batch(values, "int")
+
+        by_minutes = minutes_valid & compare(minutes, expected * 60).fillna(False).to_numpy(dtype= bool)
+        by_number = numbers_valid & compare(numbers, expected).fillna(False).to_numpy(dtype= bool)
+
+        return numpy.where(is_duration, by_minutes, by_number)
+
+
+    # Stream the rows of a query
+    def run(self, query:dict, steps:list = None, chunk_size:int = CHUNK_SIZE):
+        """
+        ### Reads the planned month files and yields the matching rows.
+
+        :param query (dict): A parsed query.
+        :param steps (list): The plan of the query (planned here if None).
+        :param chunk_size (int): Rows parsed at once.
+
+        Yields
+        ------
+        dict
+            {"year", "task", "month", then the selected columns} ("" for a missing value).
+        """
+
+        steps = self.plan(query) if steps is None else steps
+
+        for step in steps or []:
+
+            path = step["path"]
+
+            # Selected columns of this file, missing ones are empty
+            select = query["select"] if query["select"] is not None else step["columns"]
+
+            for chunk in self.executor.read_month_chunks(path, chunk_size, usecols= step["columns"]):
+
+                matches = chunk[self.match_rows(chunk, step["terms"])]
+
+                if matches.empty:
+                    continue
+
+                matches = matches.reindex(columns= select).fillna("")
+
+                for values in matches.itertuples(index= False, name= None):
+
+                    row = {"year": step["year"], "task": step["task"], "month": step["month"]}
+                    row.update(zip(select, values))
+
+                    yield row
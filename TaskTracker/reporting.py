@@ -1,4 +1,852 @@
 """
-Future module for statistical analysis and reporting.
+Reporting Module
+================
+
+This module contains the `Reporter` class, which aggregates the month files
+into the report files of the tracker:
+
+1. `<year>/<task>/task_report.csv`: month, days, hours, minutes
+2. `<year>/tasks_report.csv`: task, months, days, hours, minutes
+
+- days: number of entries logged in the month(s).
+- hours/minutes: total of the duration ("H:MM") values.
+
+The reports are kept up to date by `Executor` on every write (running
+totals). A change is one line appended to the log next to the report
+(`task_report.csv.log`), not a rewrite of the report:
+
+    +,Jan,1,90      (add 1 day and 90 minutes to the row "Jan")
+    -,Feb           (drop the row "Feb")
+
+Readers (the report, verify) fold the log into the report file under its
+lock. Once the log passes `REPORT_LOG_LIMIT` bytes it is folded into the
+report file, which is rewritten once.
+
+The log also marks a maintained report: it is kept (empty) when the report
+is rewritten. Trees made before the running totals have reports without a
+log, most of them only a header. Their changes are not logged and the year
+is rebuilt from the month files the first time its report is used.
+
+A full rebuild from the month files is only needed to verify or repair
+them; month files are then read in chunks, so memory stays bounded, and the
+tasks of a year are aggregated in parallel worker processes
+(`TASK_TRACKER_WORKERS`, default: number of CPUs).
+
+Usage:
+    python reporting.py rebuild|verify [--base-dir DIR]
 """
-pass
\ No newline at end of file
+
+import argparse
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from manager import Executor, DURATION_PATTERN, REPORT_LOG_SUFFIX
+
+
+# Header rows of the report files
+TASK_REPORT_HEADER = ["month", "days", "hours", "minutes"]
+TASKS_REPORT_HEADER = ["task", "months", "days", "hours", "minutes"]
+
+# Size of a report log (bytes) that gets it folded into its report file
+REPORT_LOG_LIMIT = 64 * 1024
+
+# Number of worker processes of a year rebuild
+WORKERS = int(os.environ.get("TASK_TRACKER_WORKERS", 0)) or os.cpu_count() or 1
+
+
+# Worker of the process pool
+def aggregate_task(task_dir):
+    """
+    ### Computes the month totals of one task in a worker process.
+
+    :param task_dir (str): Path of the task directory.
+
+    Returns:
+        list: One [month, days, total minutes] row per month.
+    """
+
+    return Reporter(Executor(), workers= 1).task_rows(task_dir)
+
+
+class Reporter():
+    """
+    Aggregates durations per month, task and year and writes the report files."""
+
+    def __init__(self, executor: Executor = None, workers:int = WORKERS):
+
+        # Reads the trackers and month files (CSV or SQLite backend)
+        self.executor = executor or Executor()
+
+        # Number of processes used to aggregate the tasks of a year
+        self.workers = workers
+
+
+    # Convert duration texts to minutes
+    def parse_durations(self, values):
+        """
+        ### Converts a column of "H:MM" or "MM" texts to integer minutes.
+
+        - Vectorized with pandas string operations (same DURATION_PATTERN as
+          `Executor.entry_minutes`).
+        - Empty or invalid values count as 0 minutes.
+
+        :param values (pandas.Series): Duration texts.
+
+        Returns
+        -------
+        numpy.ndarray
+            The durations in minutes (int64).
+        """
+
+        import pandas
+
+        parts = values.fillna("").str.strip().str.extract(f"^{DURATION_PATTERN.pattern}$")
+
+        hours = pandas.to_numeric(parts[0], errors= "coerce").fillna(0)
+        minutes = pandas.to_numeric(parts[1], errors= "coerce").fillna(0)
+
+        return (hours * 60 + minutes).to_numpy(dtype= "int64")
+
+
+    # Minutes of all the durations of a chunk
+    def chunk_minutes(self, chunk):
+        """
+        ### Sums the duration values of a chunk of rows.
+
+        - Only values with a colon are durations, like the "time" type
+          detected by get_data().
+
+        :param chunk (pandas.DataFrame): Rows of a month file.
+
+        Returns
+        -------
+        int
+            Total minutes of the chunk.
+        """
+
+        total = 0
+
+        for col_name in chunk.columns:
+
+            values = chunk[col_name].fillna("")
+            is_time = values.str.contains(":", regex= False)
+
+            if is_time.any():
+                total += int(self.parse_durations(values[is_time]).sum())
+
+        return total
+
+
+    # Totals of one month file
+    def month_totals(self, month_path):
+        """
+        ### Counts the entries and sums the durations of a month file.
+
+        :param month_path (str): Path of the month file.
+
+        Returns
+        -------
+        tuple
+            (number of entries, total minutes)
+        """
+
+        # Straight from the columnar snapshot when available
+        totals = self.executor.snapshot_totals(month_path)
+
+        if totals is not None:
+            return totals
+
+        days = 0
+        total = 0
+
+        for chunk in self.executor.read_month_chunks(month_path):
+
+            days += len(chunk)
+            total += self.chunk_minutes(chunk)
+
+        return days, total
+
+
+    # Aggregate the months of a task
+    def task_report(self, task_dir, write:bool = True):
+        """
+        ### Aggregates every month of a task and writes its task_report.csv.
+
+        :param task_dir (str): Path of the task directory.
+        :param write (bool): Overwrite task_report.csv with the result.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per month: month, days, minutes (total minutes).
+        """
+
+        return self.task_frame(task_dir, self.task_rows(task_dir), write)
+
+
+    # Month totals of a task
+    def task_rows(self, task_dir):
+        """
+        ### Computes the totals of every month of a task.
+
+        :param task_dir (str): Path of the task directory.
+
+        Returns
+        -------
+        list
+            One [month, days, total minutes] row per month.
+        """
+
+        months_csv = os.path.join(task_dir, "months.csv")
+
+        rows = []
+
+        for month in self.executor.read_registry(months_csv):
+
+            month_path = os.path.join(task_dir, f"{month}.csv")
+
+            if self.executor.path_exists(month_path):
+
+                days, total = self.month_totals(month_path)
+                rows.append([month, days, total])
+
+        return rows
+
+
+    # Build and write the report of a task
+    def task_frame(self, task_dir, rows:list, write:bool = True):
+        """
+        ### Turns the month totals of a task into a DataFrame and writes task_report.csv.
+
+        :param task_dir (str): Path of the task directory.
+        :param rows (list): One [month, days, total minutes] row per month.
+        :param write (bool): Overwrite task_report.csv with the result.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per month: month, days, minutes (total minutes).
+        """
+
+        import pandas
+
+        report = pandas.DataFrame(rows, columns= ["month", "days", "minutes"])
+
+        if write:
+
+            self.replace_report(
+                os.path.join(task_dir, "task_report.csv"),
+                TASK_REPORT_HEADER,
+                self.split_minutes(report, "month").values.tolist()
+            )
+
+        return report
+
+
+    # Aggregate the tasks of a year
+    def year_report(self, year_dir, write:bool = True):
+        """
+        ### Aggregates every task of a year and writes its tasks_report.csv.
+
+        - Also refreshes the task_report.csv of every task.
+
+        :param year_dir (str): Path of the year directory.
+        :param write (bool): Overwrite the report files with the result.
+
+        Returns
+        -------
+        tuple
+            (tasks DataFrame: task, months, days, minutes,
+             {task: months DataFrame: month, days, minutes})
+        """
+
+        import pandas
+
+        tasks_csv = os.path.join(year_dir, "tasks.csv")
+
+        tasks = self.executor.read_registry(tasks_csv)
+        task_dirs = [os.path.join(year_dir, task) for task in tasks]
+
+        # Tasks are independent: fan out over worker processes (CSV trees only,
+        # other backends hold a connection that can not be shared)
+        if self.workers > 1 and len(tasks) > 1 and type(self.executor) is Executor:
+
+            with ProcessPoolExecutor(max_workers= min(self.workers, len(tasks))) as pool:
+                results = list(pool.map(aggregate_task, task_dirs))
+
+        else:
+            results = [self.task_rows(task_dir) for task_dir in task_dirs]
+
+        # Per month totals of all the tasks
+        task_reports = {
+            task: self.task_frame(task_dir, rows, write)
+            for task, task_dir, rows in zip(tasks, task_dirs, results)
+        }
+
+        frames = [report.assign(task= task) for task, report in task_reports.items()]
+
+        months = pandas.concat(frames) if frames else pandas.DataFrame(columns= ["month", "days", "minutes", "task"])
+
+        # Group the months by task, tasks without months get zeros
+        report = months.groupby("task").agg(
+            months= ("month", "count"),
+            days= ("days", "sum"),
+            minutes= ("minutes", "sum")
+        ).reindex(tasks, fill_value= 0).rename_axis("task").reset_index()
+
+        if write:
+
+            self.replace_report(
+                os.path.join(year_dir, "tasks_report.csv"),
+                TASKS_REPORT_HEADER,
+                self.split_minutes(report, "task").values.tolist()
+            )
+
+        return report, task_reports
+
+
+    # Convert total minutes to hours and minutes
+    def split_minutes(self, report, key:str):
+        """
+        ### Splits the total minutes of a report into hours and minutes columns.
+
+        :param report (pandas.DataFrame): Report with a "minutes" total column.
+        :param key (str): Name of the first column (month or task).
+
+        Returns
+        -------
+        pandas.DataFrame
+            The report with "hours" and "minutes" (0 to 59) columns.
+        """
+
+        columns = [key] + [name for name in report.columns if name not in (key, "minutes")]
+
+        return report[columns].assign(
+            hours= report["minutes"] // 60,
+            minutes= report["minutes"] % 60
+        )
+
+
+    # Display a year report
+    def print_year_report(self, year_dir, rebuild:bool = False):
+        """
+        ### Displays the report of a year.
+
+        - Uses the maintained tasks_report.csv, it is only rebuilt from the
+          month files if asked or if it is not maintained (see is_current()).
+        - The reports of an archived year are read from its archive and
+          recomputed without being written.
+
+        :param year_dir (str): Path of the year directory.
+        :param rebuild (bool): Recompute the reports from the month files.
+        """
+
+        tasks_report = os.path.join(year_dir, "tasks_report.csv")
+
+        if rebuild or not self.is_current(tasks_report):
+
+            # An archived year is read-only
+            report = self.year_report(year_dir, write= os.path.isdir(year_dir))[0]
+
+        else:
+            report = self.read_report_frame(tasks_report)
+
+        if report.empty:
+            print("\n\nNo tasks to analyze. Add first a task❗\n")
+            return None
+
+        table = self.split_minutes(report, "task")
+        table.index = range(1, len(table) + 1)
+
+        print(f"\n\n--- Year: {os.path.basename(year_dir)} ---\n")
+        print(",".join(TASKS_REPORT_HEADER) + ":\n")
+        print(table.to_string(header= False) + "\n")
+
+        # Totals of the whole year
+        total = int(report["minutes"].sum())
+
+        print("-" * 30)
+        print(f"Total: {int(report['days'].sum())} day(s), {total // 60} hour(s), {total % 60} minute(s)\n")
+
+
+    # Read a report file with its durations as total minutes
+    def read_report_frame(self, file_path):
+        """
+        ### Reads a report file into a DataFrame with a total "minutes" column.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The report without "hours", its "minutes" column holds total minutes.
+        """
+
+        import pandas
+
+        header, totals = self.read_report(file_path)
+
+        rows = [[key] + values for key, values in totals.items()]
+        columns = [header[0]] + [name for name in header[1:] if name != "hours"]
+
+        return pandas.DataFrame(rows, columns= columns)
+
+
+    # Read a report file as running totals
+    def read_report(self, file_path):
+        """
+        ### Reads a report file with the (csv) module, with the changes of its log.
+
+        - Read under the lock of the report: a fold rewrites the report and
+          removes the log, a reader sees both before or both after.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+
+        Returns
+        -------
+        tuple
+            (header, {key: [counts..., total minutes]}), keys in file order.
+        """
+
+        totals = {}
+
+        with self.executor.locks.lock(file_path):
+
+            # Also from an archived year (see archive.py)
+            with self.executor.open_text(file_path) as f:
+
+                reader = csv.reader(f)
+                header = next(reader, [])
+
+                for row in reader:
+
+                    if not row:
+                        continue
+
+                    values = [int(value or 0) for value in row[1:]]
+
+                    # hours and minutes are kept as total minutes
+                    totals[row[0]] = values[:-2] + [values[-2] * 60 + values[-1]]
+
+            self.apply_log(file_path, totals)
+
+        return header, totals
+
+
+    # Check that a report holds running totals
+    def is_current(self, file_path):
+        """
+        ### Checks if a report file is maintained on every write (has a log).
+
+        - A report without a log comes from an older tree, its rows were never
+          updated (see the module docstring).
+        - An archived report is maintained, its year is refreshed before it is
+          packed (see refresh_year()).
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+
+        Returns:
+            bool: True if the report can be read as is. False Otherwise
+        """
+
+        if os.path.exists(self.log_path(file_path)):
+            return True
+
+        return not os.path.exists(file_path) and self.executor.archives().contains(file_path)
+
+
+    # Mark a new report as maintained
+    def mark(self, file_path):
+        """
+        ### Creates the empty log of a new report file, its changes are logged from now on.
+
+        - Reports that are not on disk (other backends) are left alone.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        """
+
+        with self.executor.locks.lock(file_path):
+
+            if os.path.exists(file_path):
+                self.executor.locks.append(self.log_path(file_path), b"")
+
+
+    # Drop the mark of the reports above a month
+    def invalidate(self, month_path):
+        """
+        ### Marks the task and year reports above a month file as not maintained.
+
+        - For a change that could not be added to the running totals: the
+          reports are rebuilt from the month files on their next use.
+
+        :param month_path (str): Path of the month file.
+        """
+
+        task_dir = os.path.dirname(month_path)
+
+        for path in (os.path.join(os.path.dirname(task_dir), "tasks_report.csv"), os.path.join(task_dir, "task_report.csv")):
+
+            with self.executor.locks.lock(path):
+
+                try:
+                    os.remove(self.log_path(path))
+
+                except FileNotFoundError:
+                    pass
+
+
+    # Rebuild the reports of a year that are not maintained
+    def refresh_year(self, year_dir):
+        """
+        ### Rebuilds the reports of a year if one of them is not maintained.
+
+        :param year_dir (str): Path of the year directory.
+
+        Returns:
+            bool: True if the reports were rebuilt. False Otherwise
+        """
+
+        paths = [path for path in self.report_paths(year_dir) if os.path.exists(path)]
+
+        if all(self.is_current(path) for path in paths):
+            return False
+
+        self.year_report(year_dir)
+
+        return True
+
+
+    # Path of the log of a report
+    def log_path(self, file_path):
+        """
+        ### Returns the path of the change log of a report file.
+        """
+
+        return file_path + REPORT_LOG_SUFFIX
+
+
+    # Fold the log of a report into totals
+    def apply_log(self, file_path, totals:dict):
+        """
+        ### Applies the lines of the log of a report file to its totals.
+
+        - A last line without its line break (a write cut short) is ignored.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        :param totals (dict): {key: [counts..., total minutes]}, changed in place.
+        """
+
+        try:
+            with open(self.log_path(file_path), "r", newline= "") as f:
+                lines = f.read().split("\n")[:-1]
+
+        except FileNotFoundError:
+            return None
+
+        for row in csv.reader(lines):
+
+            if len(row) < 2:
+                continue
+
+            if row[0] == "-":
+
+                totals.pop(row[1], None)
+                continue
+
+            deltas = [int(value) for value in row[2:]]
+            current = totals.setdefault(row[1], [0] * len(deltas))
+
+            totals[row[1]] = [value + delta for value, delta in zip(current, deltas)]
+
+
+    # Append a change to the log of a report
+    def log_change(self, file_path, header:list, row:list):
+        """
+        ### Appends one change to the log of a report, folds the log once it is too long.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        :param header (list): Header row of the report.
+        :param row (list): ["+", key, deltas...] or ["-", key].
+        """
+
+        line = io.StringIO()
+        csv.writer(line, lineterminator= "\n").writerow(row)
+
+        with self.executor.locks.lock(file_path):
+
+            # Not maintained: rebuilt from the month files on first use
+            if not os.path.exists(self.log_path(file_path)):
+                return None
+
+            size = self.executor.locks.append(self.log_path(file_path), line.getvalue())
+
+        if size > REPORT_LOG_LIMIT:
+            self.fold(file_path, header)
+
+
+    # Fold the log into the report file
+    def fold(self, file_path, header:list = None):
+        """
+        ### Rewrites a report file with the changes of its log and empties the log.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        :param header (list): Header row of the report (default: the one of the file).
+        """
+
+        with self.executor.locks.lock(file_path):
+
+            # Nothing logged (or not maintained)
+            if not os.path.exists(self.log_path(file_path)) or not os.path.getsize(self.log_path(file_path)):
+                return None
+
+            file_header, totals = self.read_report(file_path)
+
+            self.write_report(file_path, header or file_header, totals)
+
+
+    # Write running totals back to a report file
+    def write_report(self, file_path, header:list, totals:dict):
+        """
+        ### Writes running totals to a report file, splitting minutes into hours.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        :param header (list): Header row of the report.
+        :param totals (dict): {key: [counts..., total minutes]}.
+        """
+
+        rows = [
+            [key] + values[:-1] + [values[-1] // 60, values[-1] % 60]
+            for key, values in totals.items()
+        ]
+
+        self.replace_report(file_path, header, rows)
+
+
+    # Rewrite a report file
+    def replace_report(self, file_path, header:list, rows:list):
+        """
+        ### Rewrites a report file whole and empties its log, the rows hold every change.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        :param header (list): Header row of the report.
+        :param rows (list): Rows of the report (hours and minutes split).
+        """
+
+        with self.executor.locks.lock(file_path):
+
+            self.executor.write_table(file_path, header, rows)
+
+            # The empty log marks the report as maintained (see is_current())
+            if os.path.exists(file_path):
+
+                with open(self.log_path(file_path), "w"):
+                    pass
+
+
+    # Add to a row of a report
+    def update_report(self, file_path, header:list, key:str, deltas:list):
+        """
+        ### Adds deltas to the running totals of one row of a report file.
+
+        - One line appended to the log of the report (see log_change()).
+        - Missing rows are created with zeros.
+
+        :param file_path (str): Path of task_report.csv or tasks_report.csv.
+        :param header (list): Header row of the report.
+        :param key (str): Month or task name of the row.
+        :param deltas (list): Values added to [counts..., total minutes].
+        """
+
+        self.log_change(file_path, header, ["+", key, *deltas])
+
+
+    # Running totals: entries added or deleted
+    def apply_entries(self, month_path, rows:list, sign:int = 1):
+        """
+        ### Adds (sign=1) or removes (sign=-1) entries from the month and task totals.
+
+        :param month_path (str): Path of the month file of the entries.
+        :param rows (list): The entries, every entry is a list of values.
+        :param sign (int): 1 for stored entries, -1 for deleted ones.
+        """
+
+        task_dir = os.path.dirname(month_path)
+        year_dir = os.path.dirname(task_dir)
+
+        month = os.path.basename(month_path)[:-4]
+        task = os.path.basename(task_dir)
+
+        days = sign * len(rows)
+        minutes = sign * sum(self.executor.entry_minutes(row) for row in rows)
+
+        self.update_report(os.path.join(task_dir, "task_report.csv"), TASK_REPORT_HEADER, month, [days, minutes])
+        self.update_report(os.path.join(year_dir, "tasks_report.csv"), TASKS_REPORT_HEADER, task, [0, days, minutes])
+
+
+    # Running totals: new month
+    def add_month(self, month_path):
+        """
+        ### Adds an empty month row to the task report and counts it in the year report.
+
+        :param month_path (str): Path of the new month file.
+        """
+
+        task_dir = os.path.dirname(month_path)
+        month = os.path.basename(month_path)[:-4]
+
+        self.update_report(os.path.join(task_dir, "task_report.csv"), TASK_REPORT_HEADER, month, [0, 0])
+        self.update_report(
+            os.path.join(os.path.dirname(task_dir), "tasks_report.csv"),
+            TASKS_REPORT_HEADER, os.path.basename(task_dir), [1, 0, 0]
+        )
+
+
+    # Running totals: month deleted
+    def remove_month(self, month_path):
+        """
+        ### Drops a month from the task report and takes its totals out of the year report.
+
+        :param month_path (str): Path of the deleted month file.
+        """
+
+        task_dir = os.path.dirname(month_path)
+        month = os.path.basename(month_path)[:-4]
+
+        task_report = os.path.join(task_dir, "task_report.csv")
+
+        with self.executor.locks.lock(task_report):
+
+            # Not maintained: rebuilt first, the month file is still there
+            if not self.is_current(task_report):
+                self.task_report(task_dir)
+
+            _, totals = self.read_report(task_report)
+            days, minutes = totals.get(month, [0, 0])
+
+            self.log_change(task_report, TASK_REPORT_HEADER, ["-", month])
+
+        self.update_report(
+            os.path.join(os.path.dirname(task_dir), "tasks_report.csv"),
+            TASKS_REPORT_HEADER, os.path.basename(task_dir), [-1, -days, -minutes]
+        )
+
+
+    # Running totals: new task
+    def add_task(self, task_dir):
+        """
+        ### Adds an empty task row to the year report.
+
+        :param task_dir (str): Path of the new task directory.
+        """
+
+        self.update_report(
+            os.path.join(os.path.dirname(task_dir), "tasks_report.csv"),
+            TASKS_REPORT_HEADER, os.path.basename(task_dir), [0, 0, 0]
+        )
+
+
+    # Running totals: task deleted
+    def remove_task(self, task_dir):
+        """
+        ### Drops a task from the year report.
+
+        :param task_dir (str): Path of the deleted task directory.
+        """
+
+        tasks_report = os.path.join(os.path.dirname(task_dir), "tasks_report.csv")
+
+        self.log_change(tasks_report, TASKS_REPORT_HEADER, ["-", os.path.basename(task_dir)])
+
+
+    # Compare the maintained reports with a full rebuild
+    def verify_year(self, year_dir, repair:bool = False):
+        """
+        ### Recomputes the reports of a year and lists the rows that differ.
+
+        :param year_dir (str): Path of the year directory.
+        :param repair (bool): Write the recomputed reports (full rebuild).
+
+        Returns
+        -------
+        list
+            Text of every mismatch, empty if the reports are correct.
+        """
+
+        mismatches = []
+
+        # Stored reports, before a repair overwrites them
+        stored = {}
+
+        for path in self.report_paths(year_dir):
+            stored[path] = self.read_report(path)[1] if os.path.exists(path) else {}
+
+        report, task_reports = self.year_report(year_dir, write= repair)
+
+        # Recomputed totals in the format of read_report()
+        computed = {
+            os.path.join(year_dir, "tasks_report.csv"): {
+                row[0]: [int(value) for value in row[1:]] for row in report.values.tolist()
+            }
+        }
+
+        for task, months in task_reports.items():
+
+            computed[os.path.join(year_dir, task, "task_report.csv")] = {
+                row[0]: [int(value) for value in row[1:]] for row in months.values.tolist()
+            }
+
+        for path, totals in stored.items():
+
+            expected = computed.get(path, {})
+
+            for key in sorted(set(totals) | set(expected)):
+
+                if totals.get(key) != expected.get(key):
+                    mismatches.append(f"{path}: [ {key} ] stored {totals.get(key)} != computed {expected.get(key)}")
+
+        return mismatches
+
+
+    # Paths of the report files of a year
+    def report_paths(self, year_dir):
+        """
+        ### Lists tasks_report.csv of a year and task_report.csv of its tasks.
+
+        :param year_dir (str): Path of the year directory.
+
+        Returns
+        -------
+        list
+            Paths of the report files.
+        """
+
+        tasks = self.executor.read_registry(os.path.join(year_dir, "tasks.csv"))
+
+        return [os.path.join(year_dir, "tasks_report.csv")] + [
+            os.path.join(year_dir, task, "task_report.csv") for task in tasks
+        ]
+
+
+if __name__ == "__main__":
+
+    # Default base directory of the tracker
+    default_base = os.path.join(os.path.expanduser("~"), "Documents", "TaskData")
+
+    parser = argparse.ArgumentParser(description= "Reports of the Task Data Tracker.")
+    parser.add_argument("command", choices= ["rebuild", "verify"], help= "Rebuild the reports or only check them.")
+    parser.add_argument("--base-dir", default= default_base, help= "Base directory of the CSV tree.")
+
+    args = parser.parse_args()
+
+    executor = Executor()
+    reporter = Reporter(executor)
+
+    for year in executor.read_registry(os.path.join(args.base_dir, "years.csv")):
+
+        mismatches = reporter.verify_year(os.path.join(args.base_dir, year), repair= args.command == "rebuild")
+
+        print(f"\nYear [ {year} ]: {len(mismatches)} mismatch(es)")
+
+        for mismatch in mismatches:
+            print(f"- {mismatch}")
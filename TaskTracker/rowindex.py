@@ -0,0 +1,363 @@
+"""
+Row Index Module
+================
+
+This module contains the `RowIndex` class, a sidecar index of the rows of
+every month file: `<Month>.csv.idx` holds the byte offset of every data row.
+
+- Row N of a month is read with one seek in the index and one in the CSV,
+  and the row count comes from the index header: the month file is not parsed.
+- Appends of `Executor` extend the index by scanning only the new bytes.
+- The header records the inode, mtime and indexed size of the CSV file:
+  rows appended by another program are scanned on the next read, and a
+  replaced (compacted) or edited file gets a new index.
+- A file that grew is only extended if its indexed part is unchanged: it
+  must still end with a line break at the indexed size, and its last indexed
+  record must match the CRC32 kept in the header. A file edited in place and
+  grown is indexed again.
+- The index is written under the directory lock of the month file. An
+  extension writes the new offsets before the header, and a new index
+  replaces the old one atomically, so readers need no lock.
+
+Layout (little endian):
+
+    header: magic b"TTRX", version (uint32), inode (uint64), mtime in ns (int64),
+            indexed bytes of the CSV (uint64), rows (uint64),
+            CRC32 of the last indexed record, header row if no rows (uint32)
+    body:   one uint64 offset per data row, in file order
+"""
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+
+# Suffix of the index file next to the month file
+INDEX_SUFFIX = ".idx"
+
+# First bytes and format version of an index file
+INDEX_MAGIC = b"TTRX"
+INDEX_VERSION = 2
+
+# Header and offset records of an index file
+HEADER = struct.Struct("<4sIQqQQI")
+OFFSET = struct.Struct("<Q")
+
+
+class RowIndex():
+    """
+    Keeps the byte offsets of the rows of the month files in sidecar files."""
+
+    def __init__(self, executor):
+
+        # Locks the month directories and rewrites files atomically
+        self.executor = executor
+
+
+    # Path of the index of a month file
+    def index_path(self, file_path):
+        """
+        ### Returns the path of the index file of a month file.
+        """
+
+        return file_path + INDEX_SUFFIX
+
+
+    # Read the header of an index
+    def read_state(self, file_path):
+        """
+        ### Reads the header of the index of a month file.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            dict: {"inode", "mtime", "covered": indexed bytes, "rows", "tail": CRC32 of
+            the last indexed record}, or None if the index is missing or not valid.
+        """
+
+        try:
+            with open(self.index_path(file_path), "rb") as f:
+                data = f.read(HEADER.size)
+
+        except FileNotFoundError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+
+        magic, version, inode, mtime, covered, rows, tail = HEADER.unpack(data)
+
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            return None
+
+        return {"inode": inode, "mtime": mtime, "covered": covered, "rows": rows, "tail": tail}
+
+
+    # Check an index against its file
+    def is_current(self, state:dict, stat):
+        """
+        ### Returns True if an index covers the whole month file as it is now.
+
+        :param state (dict): Header of the index (see read_state()), or None.
+        :param stat (os.stat_result): Status of the month file.
+        """
+
+        return (
+            state is not None
+            and state["inode"] == stat.st_ino
+            and state["covered"] == stat.st_size
+            and state["mtime"] == stat.st_mtime_ns
+        )
+
+
+    # Number of rows of a month file
+    def rows(self, file_path):
+        """
+        ### Returns the number of data rows of a month file (deleted rows included).
+
+        - Brings the index up to date first, if the file changed.
+        """
+
+        state = self.read_state(file_path)
+
+        if not self.is_current(state, os.stat(file_path)):
+            state = self.update(file_path)
+
+        return state["rows"]
+
+
+    # Offset of one row
+    def offset(self, file_path, row:int):
+        """
+        ### Returns the byte offset of a data row in its month file.
+
+        - The index must be up to date (see rows()).
+
+        :param file_path (str): Path of the month file.
+        :param row (int): 0-based position of the row in the file.
+        """
+
+        with open(self.index_path(file_path), "rb") as f:
+
+            f.seek(HEADER.size + row * OFFSET.size)
+
+            return OFFSET.unpack(f.read(OFFSET.size))[0]
+
+
+    # Find the rows of a part of a month file
+    def scan(self, file_path, position:int, header_read:bool):
+        """
+        ### Returns the offsets of the complete records from a position to the end of a month file.
+
+        - A quoted value may hold line breaks: a record ends on a line break
+          only when its quotes are balanced.
+        - Blank lines are skipped like pandas does. A last record without its
+          line break (being written) is left for the next scan.
+
+        :param file_path (str): Path of the month file.
+        :param position (int): Byte offset of a record start.
+        :param header_read (bool): False if the position is the header row.
+
+        Returns:
+            tuple: (list of row offsets, offset after the last complete record)
+        """
+
+        offsets = []
+        covered = position
+        record_start = position
+        quotes = 0
+
+        with open(file_path, "rb") as f:
+
+            f.seek(position)
+
+            for line in f:
+
+                # Blank lines between records
+                if quotes == 0 and not line.strip():
+
+                    position += len(line)
+
+                    if line.endswith(b"\n"):
+                        covered = position
+
+                    continue
+
+                # A new record starts on this line
+                if quotes == 0:
+                    record_start = position
+
+                position += len(line)
+                quotes = (quotes + line.count(b'"')) % 2
+
+                # The record continues on the next line, or is not complete yet
+                if quotes or not line.endswith(b"\n"):
+                    continue
+
+                covered = position
+
+                # The first record is the header
+                if not header_read:
+
+                    header_read = True
+                    continue
+
+                offsets.append(record_start)
+
+        return offsets, covered
+
+
+    # Checksum of the end of the indexed part
+    def tail_hash(self, file_path, start:int, end:int):
+        """
+        ### Returns the CRC32 of the bytes of a month file between two offsets.
+
+        :param file_path (str): Path of the month file.
+        :param start (int): Start of the last indexed record (0 for the header row).
+        :param end (int): Indexed bytes of the file.
+        """
+
+        with open(file_path, "rb") as f:
+
+            f.seek(start)
+
+            return zlib.crc32(f.read(end - start))
+
+
+    # Check the indexed part of a grown file
+    def prefix_intact(self, file_path, state:dict):
+        """
+        ### Returns True if the indexed part of a month file was not edited.
+
+        - The indexed part must end with a line break and its last record
+          must match the checksum of the header.
+
+        :param file_path (str): Path of the month file.
+        :param state (dict): Header of the index (see read_state()).
+        """
+
+        covered = state["covered"]
+
+        if not covered:
+            return True
+
+        start = self.offset(file_path, state["rows"] - 1) if state["rows"] else 0
+
+        if start >= covered:
+            return False
+
+        with open(file_path, "rb") as f:
+
+            f.seek(covered - 1)
+
+            if f.read(1) != b"\n":
+                return False
+
+        return self.tail_hash(file_path, start, covered) == state["tail"]
+
+
+    # Pack offsets
+    def pack(self, offsets:list):
+        """
+        ### Returns the little endian bytes of a list of offsets.
+        """
+
+        packed = array("Q", offsets)
+
+        if sys.byteorder != "little":
+            packed.byteswap()
+
+        return packed.tobytes()
+
+
+    # Bring an index up to date
+    def update(self, file_path, create:bool = True):
+        """
+        ### Extends the index of an appended month file, or builds it again.
+
+        - Only the appended bytes are scanned when the indexed part did not change
+          (see prefix_intact()).
+        - A replaced or edited file is scanned whole.
+
+        :param file_path (str): Path of the month file.
+        :param create (bool): Build a missing or stale index. If False (appends),
+            only a current index is extended and a stale one is removed.
+
+        Returns:
+            dict: The new header (see read_state()), or None if no index was kept.
+        """
+
+        index_path = self.index_path(file_path)
+
+        with self.executor.locks.lock(file_path):
+
+            state = self.read_state(file_path)
+            stat = os.stat(file_path)
+
+            if self.is_current(state, stat):
+                return state
+
+            # Same file, rows added after the indexed part
+            appended = (
+                state is not None and state["inode"] == stat.st_ino and state["covered"] < stat.st_size
+                and os.path.getsize(index_path) >= HEADER.size + state["rows"] * OFFSET.size
+                and self.prefix_intact(file_path, state)
+            )
+
+            if appended:
+
+                offsets, covered = self.scan(file_path, state["covered"], header_read= True)
+
+                # The last record is a new one, or the old one with the blank lines after it
+                start = offsets[-1] if offsets else (self.offset(file_path, state["rows"] - 1) if state["rows"] else 0)
+                tail = self.tail_hash(file_path, start, covered)
+
+                state = {
+                    "inode": stat.st_ino, "mtime": stat.st_mtime_ns,
+                    "covered": covered, "rows": state["rows"] + len(offsets), "tail": tail
+                }
+
+                with open(index_path, "r+b") as f:
+
+                    # Offsets first, the header makes them visible
+                    f.seek(HEADER.size + (state["rows"] - len(offsets)) * OFFSET.size)
+                    f.write(self.pack(offsets))
+                    f.flush()
+
+                    f.seek(0)
+                    f.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stat.st_ino, stat.st_mtime_ns, covered, state["rows"], tail))
+
+                return state
+
+            if not create:
+
+                # Built again by the next read
+                if state is not None or os.path.exists(index_path):
+                    self.remove(file_path)
+
+                return None
+
+            offsets, covered = self.scan(file_path, 0, header_read= False)
+            tail = self.tail_hash(file_path, offsets[-1] if offsets else 0, covered)
+
+            with self.executor.locks.atomic_write(index_path, mode= "wb") as f:
+
+                f.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stat.st_ino, stat.st_mtime_ns, covered, len(offsets), tail))
+                f.write(self.pack(offsets))
+
+            return {"inode": stat.st_ino, "mtime": stat.st_mtime_ns, "covered": covered, "rows": len(offsets), "tail": tail}
+
+
+    # Delete an index
+    def remove(self, file_path):
+        """
+        ### Removes the index of a month file, if it exists.
+        """
+
+        try:
+            os.remove(self.index_path(file_path))
+
+        except FileNotFoundError:
+            pass
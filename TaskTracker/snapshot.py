@@ -0,0 +1,384 @@
+"""
+Snapshot Module
+================
+
+This module contains the `SnapshotStore` class, a binary columnar cache of
+the month files used by the display and the analytics instead of the CSV text.
+
+Every month file `<task>/<Month>.csv` gets a folder `<task>/.snapshot/<Month>/`:
+
+- meta.json: stamp of the source files, columns and their encoding.
+- positions.npy: file positions of the live rows (tombstones applied).
+- <n>.npy: one NumPy array per column, loaded memory-mapped:
+    - "int": int64 values.
+    - "duration": int64 minutes of "H:MM" values.
+    - "string": int32 codes of a dictionary (<n>.json), -1 for empty cells.
+
+Columns are encoded as numbers only when every value converts back to the
+exact same text, so a snapshot always shows what the CSV holds. A snapshot is
+rebuilt only when the CSV file or its tombstone log changed.
+"""
+
+import json
+import os
+import re
+import shutil
+from manager import DURATION_PATTERN, TOMBSTONE_SUFFIX
+
+
+# Folder of the snapshots inside a task directory
+SNAPSHOT_DIR_NAME = ".snapshot"
+
+# Values stored as numbers (must convert back to the same text)
+INT_PATTERN = re.compile(r"-?[1-9]\d{0,17}|0")
+DURATION_TEXT_PATTERN = re.compile(r"(?:0|[1-9]\d{0,12}):[0-5]\d")
+
+
+class SnapshotStore():
+    """
+    Builds, validates and reads the columnar snapshots of month files."""
+
+    def __init__(self, executor):
+
+        # Reads the month files when a snapshot is (re)built
+        self.executor = executor
+
+
+    # Folder of the snapshot of a month file
+    def snapshot_dir(self, file_path):
+        """
+        ### Returns the snapshot folder of a month file.
+
+        :param file_path (str): Path of the month file.
+        """
+
+        month = os.path.splitext(os.path.basename(file_path))[0]
+
+        return os.path.join(os.path.dirname(file_path), SNAPSHOT_DIR_NAME, month)
+
+
+    # Version of the source files
+    def source_stamp(self, file_path):
+        """
+        ### Returns the stamps of a month file and of its tombstone log.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            list: [[mtime, size], [mtime, size] or None]
+        """
+
+        stamp = self.executor.file_stamp(file_path)
+        tomb_stamp = self.executor.file_stamp(file_path + TOMBSTONE_SUFFIX)
+
+        return [list(stamp) if stamp else None, list(tomb_stamp) if tomb_stamp else None]
+
+
+    # Read the description of a snapshot
+    def read_meta(self, file_path):
+        """
+        ### Returns the meta data of a snapshot if it matches the source files.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            dict: The meta data, or None if the snapshot is missing or stale.
+        """
+
+        meta_path = os.path.join(self.snapshot_dir(file_path), "meta.json")
+
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("stamp") != self.source_stamp(file_path):
+            return None
+
+        return meta
+
+
+    # Encode a column of texts
+    def encode_column(self, values):
+        """
+        ### Chooses the encoding of a column and converts it to an array.
+
+        :param values (pandas.Series): The texts of the column (NaN for empty cells).
+
+        Returns:
+            tuple: (encoding name, numpy array, dictionary list or None)
+        """
+
+        import numpy
+
+        texts = values.fillna("")
+
+        # Numbers only if every value converts back to the same text
+        if len(texts) and not values.isna().any():
+
+            if texts.str.fullmatch(INT_PATTERN.pattern).all():
+                return "int", texts.astype("int64").to_numpy(), None
+
+            if texts.str.fullmatch(DURATION_TEXT_PATTERN.pattern).all():
+
+                parts = texts.str.extract(f"^{DURATION_PATTERN.pattern}$").astype("int64")
+
+                return "duration", (parts[0] * 60 + parts[1]).to_numpy(), None
+
+        # Dictionary encoding, -1 for empty cells
+        codes, categories = values.factorize(use_na_sentinel= True)
+
+        return "string", codes.astype(numpy.int32), [str(item) for item in categories]
+
+
+    # Write the snapshot of a month file
+    def build(self, file_path):
+        """
+        ### Reads a month file once and writes its columnar snapshot.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            dict: The meta data of the new snapshot.
+        """
+
+        import numpy
+
+        # Writers of the month file wait until the snapshot is complete
+        with self.executor.locks.lock(file_path):
+
+            stamp = self.source_stamp(file_path)
+            data = self.executor.read_month(file_path, use_snapshot= False)
+
+            snapshot_dir = self.snapshot_dir(file_path)
+
+            # Start from an empty folder
+            shutil.rmtree(snapshot_dir, ignore_errors= True)
+            os.makedirs(snapshot_dir)
+
+            numpy.save(os.path.join(snapshot_dir, "positions.npy"), data.index.to_numpy(dtype= "int64"))
+
+            columns = []
+
+            for num, col_name in enumerate(data.columns):
+
+                encoding, array, categories = self.encode_column(data[col_name])
+
+                numpy.save(os.path.join(snapshot_dir, f"{num}.npy"), array)
+
+                if categories is not None:
+
+                    with open(os.path.join(snapshot_dir, f"{num}.json"), "w") as f:
+                        json.dump(categories, f)
+
+                columns.append({"name": col_name, "encoding": encoding})
+
+            meta = {"stamp": stamp, "rows": len(data), "columns": columns}
+
+            # Written last: a snapshot without meta.json is never used
+            with open(os.path.join(snapshot_dir, "meta.json"), "w") as f:
+                json.dump(meta, f)
+
+        return meta
+
+
+    # Fresh snapshot of a month file
+    def ensure(self, file_path):
+        """
+        ### Returns the meta data of an up to date snapshot, rebuilding it if needed.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            dict: The meta data, or None if the snapshot can not be written.
+        """
+
+        meta = self.read_meta(file_path)
+
+        if meta is not None:
+            return meta
+
+        try:
+            return self.build(file_path)
+
+        except OSError:
+            return None
+
+
+    # Memory-mapped arrays of a snapshot
+    def load_arrays(self, file_path, meta:dict):
+        """
+        ### Loads the positions and the column arrays of a snapshot.
+
+        :param file_path (str): Path of the month file.
+        :param meta (dict): Meta data of the snapshot.
+
+        Returns:
+            tuple: (positions array, [(column meta, array, dictionary or None), ...])
+        """
+
+        import numpy
+
+        snapshot_dir = self.snapshot_dir(file_path)
+
+        positions = numpy.load(os.path.join(snapshot_dir, "positions.npy"), mmap_mode= "r")
+
+        columns = []
+
+        for num, column in enumerate(meta["columns"]):
+
+            array = numpy.load(os.path.join(snapshot_dir, f"{num}.npy"), mmap_mode= "r")
+            categories = None
+
+            if column["encoding"] == "string":
+
+                with open(os.path.join(snapshot_dir, f"{num}.json"), "r") as f:
+                    categories = json.load(f)
+
+            columns.append((column, array, categories))
+
+        return positions, columns
+
+
+    # Month file as a DataFrame of texts
+    def read_frame(self, file_path):
+        """
+        ### Returns the live rows of a month file from its snapshot.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            pandas.DataFrame: Same content and index as `Executor.read_month()`,
+            or None if no snapshot is available.
+        """
+
+        import numpy
+        import pandas
+
+        meta = self.ensure(file_path)
+
+        if meta is None:
+            return None
+
+        # Another process may be rebuilding the snapshot, the CSV is read instead
+        try:
+            positions, columns = self.load_arrays(file_path, meta)
+
+        except (OSError, ValueError):
+            return None
+
+        data = {}
+
+        for column, array, categories in columns:
+            data[column["name"]] = self.decode_column(column, array, categories).to_numpy(dtype= object)
+
+        frame = pandas.DataFrame(data, columns= [column["name"] for column in meta["columns"]])
+        frame.index = pandas.Index(numpy.asarray(positions))
+
+        return frame
+
+
+    # Texts of an encoded column
+    def decode_column(self, column:dict, array, categories):
+        """
+        ### Converts an encoded column (or a slice of it) back to its texts.
+
+        :param column (dict): Meta data of the column.
+        :param array (numpy.ndarray): The encoded values.
+        :param categories (list): Dictionary of a "string" column, None otherwise.
+
+        Returns:
+            pandas.Series: The texts, NaN for empty cells.
+        """
+
+        import numpy
+        import pandas
+
+        if column["encoding"] == "int":
+            return pandas.Series(numpy.asarray(array)).astype(str)
+
+        if column["encoding"] == "duration":
+
+            minutes = pandas.Series(numpy.asarray(array))
+
+            return (minutes // 60).astype(str) + ":" + (minutes % 60).astype(str).str.zfill(2)
+
+        return pandas.Series(pandas.Categorical.from_codes(numpy.asarray(array), categories)).astype(object)
+
+
+    # A slice of the rows as texts
+    def read_rows(self, file_path, meta:dict, start:int, stop:int):
+        """
+        ### Returns live rows of a month file from its memory-mapped arrays.
+
+        - Only the rows of the slice are decoded.
+
+        :param file_path (str): Path of the month file.
+        :param meta (dict): Meta data of an up to date snapshot.
+        :param start (int): 0-based number of the first live row.
+        :param stop (int): Number of the row after the last one.
+
+        Returns:
+            list: Rows (lists of strings), "" for empty cells.
+        """
+
+        _, columns = self.load_arrays(file_path, meta)
+
+        texts = [
+            self.decode_column(column, array[start:stop], categories).fillna("").tolist()
+            for column, array, categories in columns
+        ]
+
+        return [list(row) for row in zip(*texts)]
+
+
+    # Analytics totals straight from the arrays
+    def totals(self, file_path):
+        """
+        ### Counts the rows and sums the duration values of a month file.
+
+        - Duration columns are summed from their minutes array.
+        - Dictionary columns count every distinct "H:MM" value once, weighted
+          by how often it appears.
+
+        :param file_path (str): Path of the month file.
+
+        Returns:
+            tuple: (number of rows, total minutes), or None if no snapshot is available.
+        """
+
+        import numpy
+
+        meta = self.ensure(file_path)
+
+        if meta is None:
+            return None
+
+        # Another process may be rebuilding the snapshot, the CSV is read instead
+        try:
+            _, columns = self.load_arrays(file_path, meta)
+
+        except (OSError, ValueError):
+            return None
+
+        total = 0
+
+        for column, array, categories in columns:
+
+            if column["encoding"] == "duration":
+                total += int(numpy.sum(array))
+
+            elif column["encoding"] == "string" and len(array):
+
+                # Minutes of every dictionary value (0 for non durations)
+                minutes = numpy.array(
+                    [self.executor.entry_minutes([item]) for item in categories] + [0],
+                    dtype= "int64"
+                )
+
+                # Code -1 (empty cell) points to the trailing 0
+                total += int(numpy.sum(minutes[numpy.asarray(array)]))
+
+        return meta["rows"], total
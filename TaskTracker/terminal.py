@@ -0,0 +1,207 @@
+"""
+Terminal Module
+================
+
+This module contains the `Terminal` class, the screen layer of the menus:
+
+- Clears the screen with ANSI escape codes instead of spawning a `clear`/`cls`
+  shell command.
+- Redraws a frame of lines in place, only the lines that changed since the
+  previous frame are written (used by the paged month viewer).
+- Reads single keypresses natively (msvcrt on Windows, termios elsewhere).
+
+Nothing is drawn when the output is not a terminal (pipes, logs, commands),
+and keys are then read line by line.
+"""
+
+import os
+import shutil
+import sys
+
+# Only available on Windows
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Only available on POSIX systems
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+
+# Escape codes: clear screen + scrollback, cursor to a position, erase line / rest of screen
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+MOVE_CURSOR = "\033[{row};1H"
+ERASE_LINE = "\033[2K"
+ERASE_BELOW = "\033[J"
+
+
+class Terminal():
+    """
+    Draws on the terminal and reads keypresses without external processes."""
+
+    def __init__(self, stream= None, input_stream= None):
+
+        # Output and input of the screen
+        self.stream = stream or sys.stdout
+        self.input_stream = input_stream or sys.stdin
+
+        # Lines of the last drawn frame, top of the screen first
+        self.frame = []
+
+        # Escape codes are understood (enabled once on Windows)
+        self.ansi = self.is_tty() and self.enable_ansi()
+
+
+    # Check if the output is a terminal
+    def is_tty(self):
+        """
+        ### Returns True if the output stream is an interactive terminal."""
+
+        try:
+            return self.stream.isatty()
+
+        except (AttributeError, ValueError):
+            return False
+
+
+    # Turn on the escape codes of the Windows console
+    def enable_ansi(self):
+        """
+        ### Enables the virtual terminal mode of the Windows console.
+
+        Returns:
+            bool: True if escape codes can be written.
+        """
+
+        if os.name != "nt":
+            return True
+
+        try:
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)
+            mode = ctypes.c_uint32()
+
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+
+        except (AttributeError, OSError):
+            return False
+
+
+    # Clear screen terminal
+    def clear(self):
+        """
+        ### Clears the screen and forgets the last frame.
+
+        - Old Windows consoles without escape codes fall back to `cls`.
+        """
+
+        self.frame = []
+
+        if not self.is_tty():
+            return None
+
+        if self.ansi:
+
+            self.stream.write(CLEAR_SCREEN)
+            self.stream.flush()
+
+        else:
+            os.system("cls")
+
+
+    # Draw a frame of lines
+    def render(self, lines:list):
+        """
+        ### Draws a frame from the top of the screen, rewriting only the changed lines.
+
+        - Lines longer than the terminal are cut, so every line keeps one row.
+        - The cursor is left on the row below the frame (for a prompt).
+
+        :param lines (list): The text lines of the frame.
+        """
+
+        if not self.ansi:
+
+            print("\n".join(lines))
+            return None
+
+        width = shutil.get_terminal_size().columns
+        lines = [line[:width] for line in lines]
+
+        # A new frame starts on a clean screen
+        if not self.frame:
+
+            self.stream.write(CLEAR_SCREEN)
+
+        output = []
+
+        for num, line in enumerate(lines):
+
+            # Unchanged line
+            if num < len(self.frame) and self.frame[num] == line:
+                continue
+
+            output.append(MOVE_CURSOR.format(row= num + 1) + ERASE_LINE + line)
+
+        # Remove the rest of a longer previous frame and the last prompt
+        output.append(MOVE_CURSOR.format(row= len(lines) + 1) + ERASE_BELOW)
+
+        self.stream.write("".join(output))
+        self.stream.flush()
+
+        self.frame = list(lines)
+
+
+    # Read a single keypress
+    def getch(self):
+        """
+        ### Waits for one keypress and returns it.
+
+        - Without a terminal a whole line is read and its first character
+          returned ("\\n" for an empty line).
+
+        Returns:
+            str: The key.
+        """
+
+        if msvcrt is not None and self.is_tty():
+            return msvcrt.getwch()
+
+        try:
+            fd = self.input_stream.fileno()
+            interactive = termios is not None and os.isatty(fd)
+
+        except (AttributeError, ValueError, OSError):
+            interactive = False
+
+        if not interactive:
+
+            line = self.input_stream.readline()
+            return line[:1] or "\n"
+
+        old_settings = termios.tcgetattr(fd)
+
+        try:
+            tty.setraw(fd)
+
+            # Escape sequences (arrows) arrive in one read
+            key = os.read(fd, 8).decode(errors= "ignore")
+
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+        # Ctrl+C still stops the program
+        if key == "\x03":
+            raise KeyboardInterrupt
+
+        return "\n" if key == "\r" else key
@@ -0,0 +1,66 @@
+"""
+Shared fixtures of the tests.
+
+The modules of TaskTracker/ import each other by their bare names, like
+`python main.py` does, so the folder is put on the import path first.
+"""
+
+import os
+import sys
+import pytest
+
+
+# Folder of the program modules
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "TaskTracker")
+
+sys.path.insert(0, SOURCE_DIR)
+
+
+# Run one command line of main.py in this process
+@pytest.fixture
+def run(tmp_path, capsys):
+    """
+    ### Returns a function running `python main.py --base-dir <tmp> <args>` and returning its output.
+    """
+
+    import main
+
+    base_dir = str(tmp_path / "TaskData")
+
+    def run_command(*args, status:int = 0):
+
+        result = main.main(["--base-dir", base_dir, *args])
+        output = capsys.readouterr()
+
+        assert result == status, (args, output.out, output.err)
+        return output.out
+
+    run_command.base_dir = base_dir
+    return run_command
+
+
+# Backend objects of a tree
+@pytest.fixture
+def backend(run):
+    """
+    ### Returns a fresh (executor, generator) pair of the tree of `run`.
+    """
+
+    import main
+
+    return main.make_backend(run.base_dir)
+
+
+# A year with one typed task
+@pytest.fixture
+def gym(run):
+    """
+    ### Creates year 2026 with task "gym" and month Jan (date, hours, note). Returns the month path.
+    """
+
+    run("year", "add", "2026")
+    run("task", "add", "gym", "--year", "2026")
+    run("month", "add", "Jan", "--task", "gym", "--year", "2026",
+        "--header", "date,hours,note", "--types", "date,duration,string")
+
+    return os.path.join(run.base_dir, "2026", "gym", "Jan.csv")
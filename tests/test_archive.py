@@ -0,0 +1,85 @@
+"""
+Archived years: read in place, refused for writes, restored unchanged.
+"""
+
+import os
+import pytest
+from main import make_backend
+
+
+# Commands reading a year
+READS = [
+    ("show", "--year", "2026"),
+    ("show", "--year", "2026", "--task", "gym", "--month", "Jan"),
+    ("show", "--year", "2026", "--task", "gym", "--month", "Jan", "--from", "3", "--limit", "2"),
+    ("report", "--year", "2026"),
+    ("query", "year=2026 where hours>1 select date,hours,note"),
+]
+
+
+@pytest.fixture
+def closed_year(run, gym):
+
+    run("year", "add", "2027")
+
+    for day in range(1, 9):
+        run("entry", "add", f"2026-01-0{day}", f"{day % 3}:{day:02d}", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "3")
+
+    return run
+
+
+def test_archive_round_trip(closed_year):
+
+    run = closed_year
+    year_dir = os.path.join(run.base_dir, "2026")
+
+    before = {command: run(*command) for command in READS}
+
+    run("year", "archive", "2026")
+
+    assert not os.path.exists(year_dir)
+    assert os.path.isfile(year_dir + ".zip")
+
+    # Read in place, same output
+    for command in READS:
+        assert run(*command) == before[command], command
+
+    executor, _ = make_backend(run.base_dir)
+    month = os.path.join(year_dir, "gym", "Jan.csv")
+
+    assert executor.count_rows(month) == 7
+    assert executor.count_dirs(year_dir) == 1
+    assert executor.read_schema(os.path.join(year_dir, "gym"))["hours"] == "duration"
+
+    run("year", "restore", "2026")
+
+    assert os.path.isdir(year_dir) and not os.path.exists(year_dir + ".zip")
+
+    for command in READS:
+        assert run(*command) == before[command], command
+
+    # Writable again, the reports stay consistent
+    run("entry", "add", "2026-01-20", "1:00", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    executor, _ = make_backend(run.base_dir)
+
+    assert executor.count_rows(month) == 8
+    assert executor.reports().verify_year(year_dir) == []
+
+
+@pytest.mark.parametrize("command", [
+    ("entry", "add", "2026-01-30", "1:00", "x", "--task", "gym", "--year", "2026", "--month", "Jan"),
+    ("task", "add", "read", "--year", "2026"),
+    ("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "1"),
+    ("month", "add", "Feb", "--task", "gym", "--year", "2026"),
+])
+def test_archived_year_is_read_only(closed_year, command):
+
+    run = closed_year
+    run("year", "archive", "2026")
+
+    run(*command, status= 1)
+
+    assert not os.path.exists(os.path.join(run.base_dir, "2026"))
@@ -0,0 +1,47 @@
+"""
+Benchmark harness: a small generated tree, every operation timed, regressions found by compare().
+"""
+
+import copy
+import os
+from benchmark import Benchmark, MONTHS, compare
+
+
+def test_small_run_times_every_operation(tmp_path, capsys):
+
+    base_dir = str(tmp_path / "TaskData")
+    bench = Benchmark(base_dir, tasks= 2, rows= 20, repeat= 2)
+
+    results = bench.run()
+
+    assert results["parameters"]["rows"] == 20
+    assert set(results["operations"]) >= {"read_csv", "read_page", "is_exist", "store_data", "delete_row",
+                                          "delete_month", "delete_task", "year_report", "year_report_rebuild"}
+    assert all(stats["runs"] == 2 for stats in results["operations"].values())
+
+    # The tree was made like the menu does: registered, reported and consistent
+    executor = bench.executor
+    year_dir = os.path.join(base_dir, "2026")
+
+    assert executor.read_registry(os.path.join(year_dir, "task0", "months.csv")) == MONTHS
+    assert executor.count_rows(os.path.join(year_dir, "task1", "Mar.csv")) == 20
+    assert executor.reports().verify_year(year_dir) == []
+
+
+def test_compare_flags_slower_operations(capsys):
+
+    baseline = {
+        "parameters": {"rows": 20},
+        "operations": {"read_csv": {"median_ms": 10.0}, "store_data": {"median_ms": 1.0}, "gone": {"median_ms": 1.0}}
+    }
+
+    results = copy.deepcopy(baseline)
+    results["operations"] = {"read_csv": {"median_ms": 12.0}, "store_data": {"median_ms": 2.0}, "new": {"median_ms": 5.0}}
+
+    assert compare(results, baseline, tolerance= 0.25) == [("store_data", 1.0, 2.0, 2.0)]
+    assert "not comparable" not in capsys.readouterr().out
+
+    results["parameters"] = {"rows": 40}
+    compare(results, baseline, tolerance= 0.25)
+
+    assert "not comparable" in capsys.readouterr().out
@@ -0,0 +1,81 @@
+"""
+Command line: every level of the tree created, shown and deleted without prompts.
+"""
+
+import os
+import pytest
+
+
+def test_create_and_show_every_level(run, gym):
+
+    run("entry", "add", "2026-01-05", "1:30", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+    run("entry", "add", "2026-01-06", "0:45", "arms", "--task", "gym")
+
+    assert "2026" in run("show")
+    assert "gym" in run("show", "--year", "2026")
+    assert "Jan" in run("show", "--year", "2026", "--task", "gym")
+
+    rows = run("show", "--year", "2026", "--task", "gym", "--month", "Jan")
+
+    assert rows.splitlines()[0] == "date,hours,note:"
+    assert "legs" in rows and "arms" in rows
+
+    # Only the asked slice
+    rows = run("show", "--year", "2026", "--task", "gym", "--month", "Jan", "--from", "2", "--limit", "1")
+
+    assert "arms" in rows and "legs" not in rows
+
+
+def test_names_are_normalized_and_unique(run, gym):
+
+    run("task", "add", "Read", "--year", "2026")
+    run("month", "add", "feb", "--task", "read", "--year", "2026", "--header", "pages,time")
+
+    assert os.path.exists(os.path.join(run.base_dir, "2026", "read", "Feb.csv"))
+
+    run("year", "add", "2026", status= 1)
+    run("task", "add", "gym", "--year", "2026", status= 1)
+    run("month", "add", "Jan", "--task", "gym", "--year", "2026", status= 1)
+
+
+def test_unknown_names_fail(run, gym):
+
+    run("task", "add", "read", "--year", "2030", status= 1)
+    run("show", "--year", "2026", "--task", "swim", status= 1)
+    run("entry", "add", "2026-01-05", "1:30", "legs", "--task", "swim", "--year", "2026", status= 1)
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Mar", status= 1)
+    run("report", "--year", "2030", status= 1)
+
+
+def test_delete_the_deepest_given_level(run, gym):
+
+    for day in ("05", "06"):
+        run("entry", "add", f"2026-01-{day}", "1:00", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    place = ("--year", "2026", "--task", "gym", "--month", "Jan")
+
+    run("delete", *place, "--row", "3", status= 1)
+    run("delete", "--year", "2026", "--row", "1", status= 1)
+
+    assert "2026-01-05" in run("delete", *place, "--row", "1")
+    assert "2026-01-05" not in run("show", *place)
+
+    run("delete", *place)
+
+    assert not os.path.exists(os.path.join(run.base_dir, "2026", "gym", "Jan.csv"))
+    assert "Jan" not in run("show", "--year", "2026", "--task", "gym")
+
+    run("delete", "--year", "2026")
+
+    assert not os.path.exists(os.path.join(run.base_dir, "2026"))
+    assert "2026" not in run("show")
+
+
+def test_usage_errors_exit_with_status_2(run):
+
+    for args in ([], ["year"], ["entry", "add", "1:00"], ["delete"]):
+
+        with pytest.raises(SystemExit) as raised:
+            run(*args)
+
+        assert raised.value.code == 2
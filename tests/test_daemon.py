@@ -0,0 +1,91 @@
+"""
+Daemon: group commit, bookkeeping before the answers, answers from the append.
+"""
+
+import asyncio
+import json
+import os
+from daemon import IngestServer
+from manifest import Manifest
+
+
+# Send request lines to a server started in this event loop, return the answers
+def exchange(server, requests):
+
+    async def session():
+
+        listener = await asyncio.start_unix_server(server.handle_client, path= server.socket_path)
+
+        async with listener:
+
+            reader, writer = await asyncio.open_unix_connection(server.socket_path)
+            writer.write("".join(json.dumps(request) + "\n" for request in requests).encode())
+            await writer.drain()
+
+            answers = [json.loads(await reader.readline()) for _ in requests]
+
+            writer.close()
+
+        return answers
+
+    return asyncio.run(session())
+
+
+# Server of the tree of `run`
+def make_server(backend, run, tmp_path):
+
+    executor, _ = backend
+
+    return IngestServer(executor, run.base_dir, socket_path= str(tmp_path / "ingest.sock"), fsync= False)
+
+
+def test_group_commit_stores_and_records(run, gym, backend, tmp_path):
+
+    server = make_server(backend, run, tmp_path)
+
+    requests = [{"task": "gym", "values": [f"2026-01-{day:02d}", "0:30", "legs"]} for day in range(1, 21)]
+    requests.append({"task": "gym", "values": ["2026-13-45", "0:30", "legs"]})
+
+    answers = exchange(server, requests)
+
+    assert answers[:-1] == [{"ok": True}] * 20
+    assert answers[-1]["ok"] is False
+
+    executor, _ = backend
+    year_dir = os.path.join(run.base_dir, "2026")
+
+    assert executor.count_rows(gym) == 20
+    assert Manifest(executor.__class__(), run.base_dir).rows(gym) == 20
+    assert executor.reports().verify_year(year_dir) == []
+
+
+def test_report_failure_does_not_fail_stored_rows(run, gym, backend, tmp_path, monkeypatch, capsys):
+
+    server = make_server(backend, run, tmp_path)
+    executor, _ = backend
+
+    def broken(file_path, rows):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(executor, "update_reports", broken)
+
+    answers = exchange(server, [{"task": "gym", "values": ["2026-01-05", "1:00", "legs"]}])
+
+    assert answers == [{"ok": True}]
+    assert "rows are stored" in capsys.readouterr().err
+
+    # Stored once, the reports are rebuilt on their next use
+    assert executor.read_page(gym, 0, 10)[1] == [["2026-01-05", "1:00", "legs"]]
+
+    monkeypatch.undo()
+    year_dir = os.path.join(run.base_dir, "2026")
+
+    assert not executor.reports().is_current(os.path.join(year_dir, "tasks_report.csv"))
+    assert "Total: 1 day(s), 1 hour(s), 0 minute(s)" in run("report", "--year", "2026")
+    assert executor.reports().verify_year(year_dir) == []
+
+    # Maintained again from the next entry on
+    exchange(server, [{"task": "gym", "values": ["2026-01-06", "0:30", "legs"]}])
+
+    assert "Total: 2 day(s), 1 hour(s), 30 minute(s)" in run("report", "--year", "2026")
+    assert executor.reports().verify_year(year_dir) == []
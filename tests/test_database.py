@@ -0,0 +1,85 @@
+"""
+SQLite backend: migration of a CSV tree and row deletion.
+"""
+
+import os
+import shutil
+import pytest
+from database import Database, SQLiteExecutor, migrate_tree
+
+
+# Rows of every month in the database
+def month_rows(database):
+
+    return database.execute(
+        "SELECT year, task, month, COUNT(*) FROM entries GROUP BY year, task, month ORDER BY year, task, month"
+    ).fetchall()
+
+
+def test_migrate_twice_does_not_double_entries(run, gym, tmp_path):
+
+    for day in range(1, 5):
+        run("entry", "add", f"2026-01-0{day}", "1:00", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "2")
+
+    database = Database(run.base_dir, str(tmp_path / "tree.db"))
+
+    first = migrate_tree(run.base_dir, database)
+    second = migrate_tree(run.base_dir, database)
+
+    assert first == second
+    assert month_rows(database) == [("2026", "gym", "Jan", 3)]
+
+    executor = SQLiteExecutor(database)
+
+    assert executor.read_csv(gym).values.tolist() == [
+        ["2026-01-01", "1:00", "legs"], ["2026-01-03", "1:00", "legs"], ["2026-01-04", "1:00", "legs"]]
+
+
+# Files and directories of a tree with their modification times
+def listing(base_dir):
+
+    found = {}
+
+    for root, dirs, files in os.walk(base_dir):
+
+        for name in dirs + files:
+
+            path = os.path.join(root, name)
+            found[path] = os.stat(path).st_mtime_ns
+
+    return found
+
+
+def test_migrate_leaves_the_source_tree_unchanged(run, gym, tmp_path):
+
+    run("entry", "add", "2026-01-01", "1:00", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    # A tree without the lock files and snapshots of this version
+    for root, dirs, files in os.walk(run.base_dir):
+
+        for name in files:
+
+            if name == ".lock":
+                os.remove(os.path.join(root, name))
+
+        for name in dirs:
+
+            if name == ".snapshot":
+                shutil.rmtree(os.path.join(root, name))
+
+    before = listing(run.base_dir)
+
+    migrate_tree(run.base_dir, Database(run.base_dir, str(tmp_path / "tree.db")))
+
+    assert listing(run.base_dir) == before
+
+
+def test_delete_row_of_missing_month(tmp_path):
+
+    database = Database(str(tmp_path))
+    executor = SQLiteExecutor(database)
+
+    with pytest.raises(IndexError, match= "out of range"):
+        executor.delete_row(os.path.join(str(tmp_path), "2026", "gym", "Jan.csv"), 1)
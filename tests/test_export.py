@@ -0,0 +1,85 @@
+"""
+Export: ranges of years and tasks, formats and compression.
+"""
+
+import csv
+import gzip
+import io
+import json
+import pytest
+from export import Exporter
+
+
+@pytest.fixture
+def tree(run):
+
+    for year in ("2026", "2027"):
+
+        run("year", "add", year)
+
+        for task, header in (("gym", "date,hours"), ("read", "date,pages"), ("swim", "date,hours")):
+
+            run("task", "add", task, "--year", year)
+            run("month", "add", "Jan", "--task", task, "--year", year, "--header", header)
+            run("entry", "add", f"{year}-01-05", "1:30" if header.endswith("hours") else "12",
+                "--task", task, "--year", year, "--month", "Jan")
+
+    return run
+
+
+# Tags of the rows of a CSV export
+def tags(text):
+
+    return [(row["year"], row["task"]) for row in csv.DictReader(io.StringIO(text))]
+
+
+def test_ranges(tree, backend):
+
+    exporter = Exporter(backend[0], tree.base_dir)
+
+    assert exporter.parse_range("2026:2027") == ("2026", "2027")
+    assert exporter.parse_range("2027:") == ("2027", None)
+    assert exporter.parse_range(":2026") == (None, "2026")
+    assert exporter.parse_range("gym") == ("gym", "gym")
+
+    cases = {
+        (None, None): [("2026", "gym"), ("2026", "read"), ("2026", "swim"), ("2027", "gym"), ("2027", "read"), ("2027", "swim")],
+        ("2027", None): [("2027", "gym"), ("2027", "read"), ("2027", "swim")],
+        ("2026:", "h:t"): [("2026", "read"), ("2026", "swim"), ("2027", "read"), ("2027", "swim")],
+        (":2026", ":r"): [("2026", "gym")],
+        ("2028:", None): [],
+    }
+
+    for (years, tasks), expected in cases.items():
+
+        output = tree("export", "-", *(["--years", years] if years else []), *(["--tasks", tasks] if tasks else []))
+
+        assert tags(output) == expected, (years, tasks)
+
+
+def test_csv_header_has_every_column(tree):
+
+    rows = list(csv.reader(io.StringIO(tree("export", "-", "--years", "2026"))))
+
+    assert rows[0] == ["year", "task", "month", "date", "hours", "pages"]
+    assert rows[1:] == [
+        ["2026", "gym", "Jan", "2026-01-05", "1:30", ""],
+        ["2026", "read", "Jan", "2026-01-05", "", "12"],
+        ["2026", "swim", "Jan", "2026-01-05", "1:30", ""],
+    ]
+
+
+def test_jsonl_gzip_file(tree, tmp_path):
+
+    target = tmp_path / "out.jsonl.gz"
+
+    tree("export", str(target), "--tasks", "read")
+
+    with gzip.open(target, "rt", encoding= "utf-8") as f:
+        rows = [json.loads(line) for line in f]
+
+    assert rows == [
+        {"year": "2026", "task": "read", "month": "Jan", "date": "2026-01-05", "pages": "12"},
+        {"year": "2027", "task": "read", "month": "Jan", "date": "2027-01-05", "pages": "12"},
+    ]
+    assert [item.name for item in tmp_path.iterdir() if item.name.startswith(".tmp-")] == []
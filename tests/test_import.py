@@ -0,0 +1,77 @@
+"""
+Bulk import: valid rows are appended at once, bad ones go to the reject file.
+"""
+
+import csv
+import io
+from manager import Executor
+
+
+# Rows of a reject file
+def read_rejects(path):
+
+    with open(path, newline= "") as f:
+        return list(csv.reader(f))[1:]
+
+
+def test_jsonl_lines_that_are_not_records_are_rejected(gym, tmp_path, capsys):
+
+    source = tmp_path / "in.jsonl"
+    source.write_text('{"date": "2026-01-05", "hours": "1:30", "note": "legs"}\n42\n\n"x"\n{oops\n["2026-01-06", "0:45", "arms"]\n')
+
+    assert Executor().import_entries(gym, str(source)) == (2, 3)
+
+    with open(gym) as f:
+        assert f.read().splitlines()[1:] == ["2026-01-05,1:30,legs", "2026-01-06,0:45,arms"]
+
+    rejects = read_rejects(tmp_path / "in.rejects.csv")
+
+    assert [row[0] for row in rejects] == ["42", '"x"', "{oops"]
+    assert [row[-1] for row in rejects] == [f"line {number}: not a JSON object or list" for number in (2, 4, 5)]
+
+
+def test_csv_import_through_the_cli(run, gym, backend, tmp_path):
+
+    source = tmp_path / "in.csv"
+    source.write_text("date,hours,note\n2026-01-05,1:30,legs\n\n2026-01-06,45,arms\n2026-01-07,0:30,run,extra\n2026-01-08,x,bike\n")
+
+    run("entry", "import", str(source), "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    # Typed durations are stored as H:MM
+    with open(gym) as f:
+        assert f.read().splitlines()[1:] == ["2026-01-05,1:30,legs", "2026-01-06,0:45,arms"]
+
+    rejects = read_rejects(tmp_path / "in.rejects.csv")
+
+    assert [row[0] for row in rejects] == ["2026-01-07", "2026-01-08"]
+    assert rejects[0][-1] == "too many values"
+
+    # The imported rows are in the reports
+    executor, _ = backend
+
+    assert executor.reports().verify_year(str(tmp_path / "TaskData" / "2026")) == []
+    assert "Total: 2 day(s), 2 hour(s), 15 minute(s)" in run("report", "--year", "2026")
+
+
+def test_jsonl_records_are_matched_by_key(gym, tmp_path, capsys):
+
+    source = tmp_path / "in.jsonl"
+    source.write_text('{"date": "2026-01-05", "hours": "1:30"}\n{"note": "legs", "hours": "0:10", "date": "2026-01-06"}\n')
+
+    # A missing key is an empty value
+    assert Executor().import_entries(gym, str(source)) == (1, 1)
+
+    with open(gym) as f:
+        assert f.read().splitlines()[1:] == ["2026-01-06,0:10,legs"]
+
+    assert read_rejects(tmp_path / "in.rejects.csv")[0][:3] == ["2026-01-05", "1:30", ""]
+
+
+def test_import_from_stdin(run, gym, monkeypatch):
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("2026-01-05,1:30,legs\n2026-01-06,0:15,arms\n"))
+
+    run("entry", "import", "-", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    with open(gym) as f:
+        assert len(f.read().splitlines()) == 3
@@ -0,0 +1,61 @@
+"""
+Last record of a CSV file, read backwards from its end.
+"""
+
+import csv
+import pytest
+from manager import Executor
+
+
+# Write rows with the csv module (quoted fields where needed)
+def write_rows(path, rows):
+
+    with open(path, "w", newline= "") as f:
+        csv.writer(f).writerows(rows)
+
+
+@pytest.mark.parametrize("last", [
+    ["Jan"],
+    ["2026-01-05", "1:30", "line one\nline two"],
+    ["2026-01-05", "1:30", 'said "hi"\nthen\n"left"'],
+    ["2026-01-05", "1:30", "\n\n"],
+    ["2026-01-05", "1:30", "été, à midi"],
+])
+def test_last_record_matches_the_csv_module(tmp_path, last):
+
+    path = str(tmp_path / "Jan.csv")
+    write_rows(path, [["date", "hours", "note"], ["2026-01-01", "0:30", "a\nb"], last])
+
+    assert Executor().read_last_record(path, block_size= 8) == last
+
+
+def test_record_longer_than_the_block(tmp_path):
+
+    path = str(tmp_path / "Jan.csv")
+    last = ["2026-01-05", "x" * 10_000 + "\n" + "y" * 10_000]
+
+    write_rows(path, [["date", "note"], last])
+
+    assert Executor().read_last_record(path, block_size= 16) == last
+
+
+def test_header_only_and_trailing_newlines(tmp_path):
+
+    path = tmp_path / "months.csv"
+    executor = Executor()
+
+    path.write_text("months\n")
+    assert executor.read_last_record(str(path)) is None
+
+    path.write_text("months\nJan\nFeb\n\n\n")
+    assert executor.get_latst_active_name(str(path)) == "Feb"
+
+
+def test_deleted_last_row_is_skipped(run, gym, backend):
+
+    for day in ("01", "02"):
+        run("entry", "add", f"2026-01-{day}", "1:00", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "2")
+
+    assert backend[0].read_last_record(gym) == ["2026-01-01", "1:00", "legs"]
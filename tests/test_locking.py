@@ -0,0 +1,66 @@
+"""
+Locks, atomic rewrites and locked appends.
+"""
+
+import os
+import threading
+import pytest
+from locking import LockManager, TEMP_PREFIX
+
+
+@pytest.mark.parametrize("name", ["Jan.csv", "Jan.csv.idx", "manifest.json", "2026.zip"])
+def test_temporary_file_keeps_the_extension(tmp_path, name):
+
+    locks = LockManager()
+    target = tmp_path / name
+
+    with locks.atomic_write(str(target), mode= "wb") as f:
+
+        temp = [item for item in os.listdir(tmp_path) if item.startswith(TEMP_PREFIX)]
+        f.write(b"data")
+
+    assert len(temp) == 1 and temp[0].endswith(os.path.splitext(name)[1])
+    assert target.read_bytes() == b"data"
+    assert os.listdir(tmp_path) == [name]
+
+
+def test_failed_rewrite_keeps_the_original(tmp_path):
+
+    locks = LockManager()
+    target = tmp_path / "Jan.csv"
+    target.write_text("old\n")
+
+    with pytest.raises(RuntimeError):
+
+        with locks.atomic_write(str(target)) as f:
+
+            f.write("new\n")
+            raise RuntimeError("stop")
+
+    assert target.read_text() == "old\n"
+    assert os.listdir(tmp_path) == ["Jan.csv"]
+
+
+def test_appends_are_whole_lines(tmp_path):
+
+    locks = LockManager()
+    target = str(tmp_path / "report.log")
+
+    def writer(number):
+
+        for count in range(200):
+            locks.append(target, f"{number},{count}\n")
+
+    threads = [threading.Thread(target= writer, args= (number,)) for number in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    with open(target) as f:
+        lines = f.read().splitlines()
+
+    assert sorted(lines) == sorted(f"{number},{count}" for number in range(4) for count in range(200))
+    assert locks.append(target, b"") == os.path.getsize(target)
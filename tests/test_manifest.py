@@ -0,0 +1,107 @@
+"""
+Manifest: changes go to the journal, loads replay it, compaction folds it.
+"""
+
+import copy
+import os
+import manifest
+from manager import Executor
+from manifest import Manifest, JOURNAL_FILE, MANIFEST_FILE
+
+
+# Entries without the mtimes (a rebuild reads them again)
+def strip(node):
+
+    return {
+        "dirs": {name: strip(child) for name, child in node["dirs"].items()},
+        "files": {name: {key: value for key, value in entry.items() if key != "mtime"} for name, entry in node["files"].items()}
+    }
+
+
+# Add entries to the gym month
+def add_entries(run, count):
+
+    for day in range(1, count + 1):
+        run("entry", "add", f"2026-01-{day:02d}", "1:00", "legs", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+
+def test_rows_are_journaled_not_rewritten(run, gym):
+
+    manifest_path = os.path.join(run.base_dir, MANIFEST_FILE)
+    journal_path = os.path.join(run.base_dir, JOURNAL_FILE)
+
+    Manifest(Executor(), run.base_dir).load()
+    stat = os.stat(manifest_path)
+
+    with open(journal_path) as f:
+        lines = len(f.readlines())
+
+    add_entries(run, 3)
+
+    # One journal line per command, manifest.json untouched
+    with open(journal_path) as f:
+        assert len(f.readlines()) == lines + 3
+
+    assert (os.stat(manifest_path).st_ino, os.stat(manifest_path).st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns)
+
+
+def test_load_matches_a_rebuild(run, gym):
+
+    add_entries(run, 4)
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "2")
+    run("task", "add", "read", "--year", "2026")
+    run("delete", "--year", "2026", "--task", "read")
+
+    index = Manifest(Executor(), run.base_dir)
+    loaded = copy.deepcopy(index.load()["root"])
+
+    assert index.rows(gym) == 3
+    assert strip(loaded) == strip(index.rebuild()["root"])
+    assert not os.path.exists(os.path.join(run.base_dir, JOURNAL_FILE))
+
+
+def test_cached_manifest_reads_only_new_lines(run, gym):
+
+    index = Manifest(Executor(), run.base_dir)
+    index.load()
+    offset = index.journal_offset
+
+    add_entries(run, 2)
+
+    assert index.rows(gym) == 2
+    assert index.journal_offset > offset
+
+
+def test_long_journal_is_compacted(run, gym, monkeypatch):
+
+    monkeypatch.setattr(manifest, "JOURNAL_LIMIT", 200)
+
+    add_entries(run, 5)
+
+    journal_path = os.path.join(run.base_dir, JOURNAL_FILE)
+
+    assert not os.path.exists(journal_path) or os.path.getsize(journal_path) <= 200
+
+    index = Manifest(Executor(), run.base_dir)
+    loaded = copy.deepcopy(index.load()["root"])
+
+    assert index.rows(gym) == 5
+    assert strip(loaded) == strip(index.rebuild()["root"])
+
+
+def test_batch_writes_once(run, gym, backend):
+
+    executor, _ = backend
+    journal_path = os.path.join(run.base_dir, JOURNAL_FILE)
+
+    with executor.track_batch():
+
+        for day in range(1, 4):
+            executor.store_data(gym, [f"2026-01-0{day}", "1:00", "legs"])
+
+        # Lookups inside the batch see the changes
+        assert executor.manifest.rows(gym) == 3
+        size = os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+
+    assert os.path.getsize(journal_path) > size
+    assert Manifest(Executor(), run.base_dir).rows(gym) == 3
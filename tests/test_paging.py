@@ -0,0 +1,94 @@
+"""
+Paged reads of month files with deleted rows, before and after compaction.
+"""
+
+import os
+import pytest
+import manager
+from manager import Executor
+
+
+# Month file with numbered rows
+@pytest.fixture
+def month(tmp_path):
+
+    path = str(tmp_path / "Jan.csv")
+
+    with open(path, "w") as f:
+
+        f.write("date,hours,note\n")
+
+        for number in range(1, 51):
+            f.write(f"2026-01-{(number - 1) % 28 + 1:02d},0:{number:02d},n{number}\n")
+
+    return path
+
+
+# Notes of the live rows
+def notes(executor, path):
+
+    return executor.read_csv(path)["note"].tolist()
+
+
+@pytest.mark.parametrize("snapshots", [False, True])
+def test_pages_skip_deleted_rows(month, monkeypatch, snapshots):
+
+    monkeypatch.setattr(manager, "USE_SNAPSHOTS", snapshots)
+
+    executor = Executor()
+    expected = [f"n{number}" for number in range(1, 51)]
+
+    for row in (1, 10, 10, 30, 46):
+
+        assert executor.delete_row(month, row)[2] == expected.pop(row - 1)
+
+    # Every page agrees with the whole file
+    assert notes(executor, month) == expected
+
+    for start in range(0, 50, 7):
+
+        header, rows, total = executor.read_page(month, start, 7)
+
+        assert total == len(expected)
+        assert [row[2] for row in rows] == expected[start:start + 7]
+
+    assert executor.count_rows(month) == len(expected)
+
+
+def test_compaction_keeps_the_live_rows(month, monkeypatch):
+
+    monkeypatch.setattr(manager, "COMPACT_THRESHOLD", 5)
+
+    executor = Executor()
+    expected = [f"n{number}" for number in range(1, 51)]
+
+    for row in (2, 2, 2, 2):
+        expected.pop(row - 1)
+        executor.delete_row(month, row)
+
+    assert os.path.exists(month + ".tomb")
+
+    # The fifth deletion rewrites the file without its dead rows
+    expected.pop(0)
+    executor.delete_row(month, 1)
+
+    assert not os.path.exists(month + ".tomb")
+
+    with open(month) as f:
+        assert [line.split(",")[2] for line in f.read().splitlines()[1:]] == expected
+
+    assert executor.read_page(month, 40, 10)[1][-1][2] == "n50"
+    assert executor.count_rows(month) == 45
+
+
+def test_show_pages(run, gym):
+
+    for day in range(1, 6):
+        run("entry", "add", f"2026-01-0{day}", "1:00", f"n{day}", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "2")
+
+    output = run("show", "--year", "2026", "--task", "gym", "--month", "Jan", "--from", "2", "--limit", "2")
+
+    assert "n3" in output and "n4" in output
+    assert "n1" not in output and "n2" not in output and "n5" not in output
@@ -0,0 +1,68 @@
+"""
+Profiling: off by default, with --profile every executor/generator call is counted and summarized.
+
+Run in a child process: profiling patches the classes and starts tracemalloc for good.
+"""
+
+import os
+import subprocess
+import sys
+from conftest import SOURCE_DIR
+
+
+# Run `python main.py --base-dir <tmp> <args>` with the given profiling settings
+def run_main(tmp_path, *args, **settings):
+
+    env = dict(os.environ, **settings)
+
+    for name in ("TASK_TRACKER_PROFILE", "TASK_TRACKER_BACKEND"):
+
+        if name not in settings:
+            env.pop(name, None)
+
+    command = [sys.executable, os.path.join(SOURCE_DIR, "main.py"), "--base-dir", str(tmp_path / "TaskData"), *args]
+
+    result = subprocess.run(command, env= env, capture_output= True, text= True, timeout= 60)
+
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def test_profile_summary_and_slow_calls(tmp_path):
+
+    log = tmp_path / "profile.log"
+
+    run_main(tmp_path, "--profile", "year", "add", "2026",
+             TASK_TRACKER_PROFILE_LOG= str(log), TASK_TRACKER_PROFILE_THRESHOLD= "0")
+
+    text = log.read_text()
+
+    # Every call is slower than 0 ms, so every call is logged
+    assert "[profile] slow: Executor.store_data" in text
+    assert "[profile] slow: Generator.make_file" in text
+
+    summary = [line.split() for line in text.splitlines() if line.startswith("[profile] ") and "slow:" not in line]
+
+    assert summary[0][1:4] == ["method", "calls", "total"]
+
+    calls = {row[1]: int(row[2]) for row in summary[1:] if row[1].startswith(("Executor.", "Generator."))}
+
+    assert calls["Executor.store_data"] == 1
+    assert calls["Generator.make_directory"] >= 2
+
+    # The profiled command still did its work
+    assert (tmp_path / "TaskData" / "2026" / "tasks.csv").exists()
+
+
+def test_environment_turns_profiling_on(tmp_path):
+
+    result = run_main(tmp_path, "year", "add", "2026", TASK_TRACKER_PROFILE= "1")
+
+    assert "[profile] method" in result.stderr
+
+
+def test_off_by_default(tmp_path):
+
+    result = run_main(tmp_path, "year", "add", "2026")
+
+    assert "[profile]" not in result.stderr
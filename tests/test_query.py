@@ -0,0 +1,75 @@
+"""
+Queries: scope terms, where terms and the meaning of their values.
+"""
+
+import os
+import pytest
+from query import QueryEngine
+
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+ENTRIES = [("2026-01-01", "0:30", "a"), ("2026-01-02", "1:30", "b"), ("2026-01-03", "2:00", "c"), ("2026-01-04", "1:00", "d")]
+
+
+# Tree with the same entries in a typed and an untyped task
+@pytest.fixture
+def tree(run, gym):
+
+    run("task", "add", "read", "--year", "2026")
+    run("month", "add", "Jan", "--task", "read", "--year", "2026", "--header", "date,hours,note")
+    run("month", "add", "Feb", "--task", "read", "--year", "2026", "--header", "date,hours,note")
+
+    for task in ("gym", "read"):
+
+        for entry in ENTRIES:
+            run("entry", "add", *entry, "--task", task, "--year", "2026", "--month", "Jan")
+
+    run("entry", "add", "2026-02-01", "3:00", "e", "--task", "read", "--year", "2026", "--month", "Feb")
+
+    return run
+
+
+# Notes of the rows matching a query
+def notes(backend, run, text):
+
+    executor, _ = backend
+    engine = QueryEngine(executor, run.base_dir, MONTHS)
+
+    return [(row["task"], row["note"]) for row in engine.run(engine.parse(text))]
+
+
+@pytest.mark.parametrize("task", ["gym", "read"])
+def test_bare_number_means_hours_for_typed_and_untyped_tasks(tree, backend, task):
+
+    assert notes(backend, tree, f"task={task} month=Jan where hours>1") == [(task, "b"), (task, "c")]
+    assert notes(backend, tree, f"task={task} month=Jan where hours>=1.5") == [(task, "b"), (task, "c")]
+    assert notes(backend, tree, f"task={task} month=Jan where hours=1") == [(task, "d")]
+
+
+def test_duration_and_date_values(tree, backend):
+
+    assert notes(backend, tree, "task=gym where hours<1:00") == [("gym", "a")]
+    assert notes(backend, tree, "task=read where date>=2026-01-03") == [("read", "c"), ("read", "d"), ("read", "e")]
+
+
+def test_scope_terms_choose_the_months(tree, backend):
+
+    assert notes(backend, tree, "month>=Feb") == [("read", "e")]
+    assert notes(backend, tree, "year=2026 task!=read where note=a") == [("gym", "a")]
+
+
+def test_invalid_value_for_a_typed_column(tree, backend, capsys):
+
+    executor, _ = backend
+    engine = QueryEngine(executor, tree.base_dir, MONTHS)
+
+    assert engine.compile_terms([("hours", ">", "x")], {"hours": "duration"}) is None
+    assert "Invalid value" in capsys.readouterr().out
+
+
+def test_query_command(tree):
+
+    output = tree("query", "year=2026 task=gym where hours>1 select date,hours")
+
+    assert output.splitlines() == ["year,task,month,date,hours", "2026,gym,Jan,2026-01-02,1:30", "2026,gym,Jan,2026-01-03,2:00"]
@@ -0,0 +1,93 @@
+"""
+Tracker files: parsed once per change, revalidated by their mtime and size.
+"""
+
+import os
+from manager import Executor
+
+
+# Write a tracker file with a given modification time
+def write_tracker(path, names, mtime_ns:int):
+
+    with open(path, "w", newline= "") as f:
+        f.write("tasks\n" + "".join(f"{name}\n" for name in names))
+
+    os.utime(path, ns= (mtime_ns, mtime_ns))
+
+
+def test_unchanged_tracker_is_served_from_the_cache(tmp_path):
+
+    path = str(tmp_path / "tasks.csv")
+    write_tracker(path, ["gym", "read"], 1_000_000_000)
+
+    executor = Executor()
+    cached = executor.load_registry(path)
+
+    assert executor.read_registry(path) == ["gym", "read"]
+    assert executor.load_registry(path) is cached
+
+
+def test_tracker_changed_outside_is_parsed_again(tmp_path):
+
+    path = str(tmp_path / "tasks.csv")
+    write_tracker(path, ["gym", "read"], 1_000_000_000)
+
+    executor = Executor()
+    executor.read_registry(path)
+
+    # Appended by another process
+    with open(path, "a") as f:
+        f.write("swim\n")
+
+    assert executor.read_registry(path) == ["gym", "read", "swim"]
+
+    # Same size, only the mtime tells the change
+    write_tracker(path, ["gym", "bike", "swim"], 2_000_000_000)
+
+    assert executor.read_registry(path) == ["gym", "bike", "swim"]
+
+
+def test_removed_task_leaves_the_cache(run, gym, backend):
+
+    executor, _ = backend
+    task_dir = os.path.join(run.base_dir, "2026", "gym")
+    months_csv = os.path.join(task_dir, "months.csv")
+
+    assert executor.read_registry(months_csv) == ["Jan"]
+
+    executor.remove_path(task_dir)
+
+    assert months_csv not in executor.registry_cache
+
+
+def test_membership_follows_the_tracker(tmp_path):
+
+    path = str(tmp_path / "tasks.csv")
+    write_tracker(path, ["gym", "read"], 1_000_000_000)
+
+    executor = Executor()
+
+    assert executor.is_exist(path, "gym")
+    assert not executor.is_exist(path, "swim")
+
+    # Only whole names of the first column count
+    assert not executor.is_exist(path, "gy")
+    assert not executor.is_exist(path, "tasks")
+
+    with open(path, "a") as f:
+        f.write("swim\n")
+
+    assert executor.is_exist(path, "swim")
+
+
+def test_membership_of_new_names(run, gym, backend):
+
+    executor, _ = backend
+    tasks_csv = os.path.join(run.base_dir, "2026", "tasks.csv")
+
+    assert executor.is_exist(tasks_csv, "gym")
+    assert not executor.is_exist(tasks_csv, "read")
+
+    run("task", "add", "read", "--year", "2026")
+
+    assert executor.is_exist(tasks_csv, "read")
@@ -0,0 +1,199 @@
+"""
+Running totals of the reports: changes are logged, folded on read and on size.
+"""
+
+import os
+import reporting
+from reporting import Reporter
+
+
+# Add entries to the gym month
+def add_entries(run, entries):
+
+    for entry in entries:
+        run("entry", "add", *entry, "--task", "gym", "--year", "2026", "--month", "Jan")
+
+
+def test_rows_append_to_the_log_instead_of_rewriting(run, gym, backend):
+
+    year_dir = os.path.join(run.base_dir, "2026")
+    task_report = os.path.join(year_dir, "gym", "task_report.csv")
+    inode = os.stat(task_report).st_ino
+
+    add_entries(run, [("2026-01-01", "1:30", "a"), ("2026-01-02", "0:45", "b")])
+
+    assert os.stat(task_report).st_ino == inode
+    assert os.path.exists(task_report + ".log")
+
+    executor, _ = backend
+    reporter = executor.reports()
+
+    assert reporter.read_report(task_report)[1] == {"Jan": [2, 135]}
+    assert reporter.read_report(os.path.join(year_dir, "tasks_report.csv"))[1] == {"gym": [1, 2, 135]}
+    assert reporter.verify_year(year_dir) == []
+
+
+def test_deletions_keep_the_reports_consistent(run, gym, backend):
+
+    year_dir = os.path.join(run.base_dir, "2026")
+
+    run("task", "add", "read", "--year", "2026")
+    run("month", "add", "Feb", "--task", "gym", "--year", "2026")
+    add_entries(run, [("2026-01-01", "1:30", "a"), ("2026-01-02", "0:45", "b"), ("2026-01-03", "2:00", "c")])
+    run("entry", "add", "2026-02-01", "1:00", "d", "--task", "gym", "--year", "2026", "--month", "Feb")
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "2")
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Feb")
+    run("delete", "--year", "2026", "--task", "read")
+
+    executor, _ = backend
+    reporter = executor.reports()
+
+    assert reporter.verify_year(year_dir) == []
+    assert reporter.read_report(os.path.join(year_dir, "tasks_report.csv"))[1] == {"gym": [1, 2, 210]}
+
+    # A rebuild writes the same totals and empties the logs
+    reporter.verify_year(year_dir, repair= True)
+
+    assert os.path.getsize(os.path.join(year_dir, "tasks_report.csv.log")) == 0
+    assert reporter.read_report(os.path.join(year_dir, "tasks_report.csv"))[1] == {"gym": [1, 2, 210]}
+
+
+def test_long_log_is_folded(run, gym, backend, monkeypatch):
+
+    monkeypatch.setattr(reporting, "REPORT_LOG_LIMIT", 40)
+
+    add_entries(run, [("2026-01-01", "1:30", "a"), ("2026-01-02", "0:45", "b"), ("2026-01-03", "2:00", "c")])
+
+    task_report = os.path.join(run.base_dir, "2026", "gym", "task_report.csv")
+
+    with open(task_report) as f:
+        assert f.read().splitlines()[1:] == ["Jan,3,4,15"]
+
+    assert not os.path.exists(task_report + ".log") or os.path.getsize(task_report + ".log") <= 40
+    assert Reporter(backend[0]).verify_year(os.path.join(run.base_dir, "2026")) == []
+
+
+def test_report_command_reads_the_log(run, gym):
+
+    add_entries(run, [("2026-01-01", "1:30", "a"), ("2026-01-02", "0:45", "b")])
+
+    output = run("report", "--year", "2026")
+
+    assert "Total: 2 day(s), 2 hour(s), 15 minute(s)" in output
+    assert run("report", "--year", "2026", "--rebuild") == output
+
+
+# Write the files of a tree made before the running totals
+def write_old_tree(base_dir):
+
+    files = {
+        "years.csv": "years\n2026\n",
+        "2026/tasks.csv": "tasks\ngym\n",
+        "2026/tasks_report.csv": "task,months,days,hours,minutes\n",
+        "2026/gym/months.csv": "months\nJan\n",
+        "2026/gym/task_report.csv": "month,days,hours,minutes\n",
+        "2026/gym/Jan.csv": "date,hours,note\n2026-01-01,1:30,a\n2026-01-02,1:00,b\n",
+    }
+
+    for name, text in files.items():
+
+        path = os.path.join(base_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok= True)
+
+        with open(path, "w") as f:
+            f.write(text)
+
+
+def test_reports_of_an_older_tree_are_rebuilt_on_first_use(run):
+
+    write_old_tree(run.base_dir)
+
+    # Only the headers were written, the report still sums the month files
+    assert "Total: 2 day(s), 2 hour(s), 30 minute(s)" in run("report", "--year", "2026")
+
+    run("entry", "add", "2026-01-03", "1:30", "c", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+    output = run("report", "--year", "2026")
+
+    assert "Total: 3 day(s), 4 hour(s), 0 minute(s)" in output
+    assert run("report", "--year", "2026", "--rebuild") == output
+
+
+def test_changes_before_the_first_report_are_not_added_twice(run, backend, capsys):
+
+    write_old_tree(run.base_dir)
+
+    # Written before any report was read (no rebuild yet)
+    run("entry", "add", "2026-01-03", "1:30", "c", "--task", "gym", "--year", "2026", "--month", "Jan")
+    run("month", "add", "Feb", "--task", "gym", "--year", "2026")
+
+    # Menu option 7 has no rebuild switch
+    executor, _ = backend
+    year_dir = os.path.join(run.base_dir, "2026")
+
+    executor.reports().print_year_report(year_dir)
+
+    assert "Total: 3 day(s), 4 hour(s), 0 minute(s)" in capsys.readouterr().out
+    assert executor.reports().read_report(os.path.join(year_dir, "tasks_report.csv"))[1] == {"gym": [2, 3, 240]}
+    assert executor.reports().verify_year(year_dir) == []
+
+
+def test_year_totals_over_tasks_and_months(run, gym, backend):
+
+    add_entries(run, [("2026-01-01", "1:50", "a"), ("2026-01-02", "0:20", "b")])
+
+    run("month", "add", "Feb", "--task", "gym", "--year", "2026")
+    run("entry", "add", "2026-02-01", "2:05", "c", "--task", "gym", "--year", "2026", "--month", "Feb")
+
+    # Counts are not durations, only "H:MM" values are summed
+    run("task", "add", "read", "--year", "2026")
+    run("month", "add", "Jan", "--task", "read", "--year", "2026", "--header", "pages,time")
+    run("entry", "add", "120", "0:40", "--task", "read", "--year", "2026", "--month", "Jan")
+
+    run("task", "add", "swim", "--year", "2026")
+
+    year_dir = os.path.join(run.base_dir, "2026")
+    report, task_reports = Reporter(backend[0], workers= 1).year_report(year_dir, write= False)
+
+    assert report.values.tolist() == [["gym", 2, 3, 255], ["read", 1, 1, 40], ["swim", 0, 0, 0]]
+    assert task_reports["gym"].values.tolist() == [["Jan", 2, 130], ["Feb", 1, 125]]
+
+    output = run("report", "--year", "2026")
+
+    assert [line.split() for line in output.splitlines() if line[:1].isdigit()] == [
+        ["1", "gym", "2", "3", "4", "15"], ["2", "read", "1", "1", "0", "40"], ["3", "swim", "0", "0", "0", "0"]]
+    assert "Total: 4 day(s), 4 hour(s), 55 minute(s)" in output
+
+
+def test_year_without_tasks(run):
+
+    run("year", "add", "2026")
+
+    assert "No tasks to analyze" in run("report", "--year", "2026")
+
+
+def test_worker_processes_give_the_serial_totals(run, gym, backend):
+
+    for task, duration in (("read", "0:40"), ("swim", "1:15"), ("bike", "2:05")):
+
+        run("task", "add", task, "--year", "2026")
+        run("month", "add", "Mar", "--task", task, "--year", "2026", "--header", "date,time")
+
+        for day in range(1, 4):
+            run("entry", "add", f"2026-03-0{day}", duration, "--task", task, "--year", "2026", "--month", "Mar")
+
+    add_entries(run, [("2026-01-01", "1:30", "a")])
+
+    executor, _ = backend
+    year_dir = os.path.join(run.base_dir, "2026")
+
+    serial, serial_tasks = Reporter(executor, workers= 1).year_report(year_dir, write= False)
+    parallel, parallel_tasks = Reporter(executor, workers= 3).year_report(year_dir, write= True)
+
+    assert parallel.values.tolist() == serial.values.tolist()
+    assert {task: frame.values.tolist() for task, frame in parallel_tasks.items()} == {
+        task: frame.values.tolist() for task, frame in serial_tasks.items()}
+
+    # The written reports hold the same totals
+    assert Reporter(executor, workers= 1).verify_year(year_dir) == []
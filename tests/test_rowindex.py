@@ -0,0 +1,72 @@
+"""
+Row index: appended files are extended, edited files are indexed again.
+"""
+
+import os
+from manager import Executor
+from rowindex import RowIndex
+
+
+ROWS = [["2026-01-01", "1:00", "note1"], ["2026-01-02", "1:32", "note2"], ["2026-01-03", "0:10", "note3"]]
+
+
+# Write a month file
+def write_month(path, rows, mode= "w"):
+
+    with open(path, mode) as f:
+
+        if mode == "w":
+            f.write("date,hours,note\n")
+
+        for row in rows:
+            f.write(",".join(row) + "\n")
+
+
+def test_appended_rows_extend_the_index(tmp_path):
+
+    path = str(tmp_path / "Jan.csv")
+    write_month(path, ROWS)
+
+    executor = Executor()
+    index = RowIndex(executor)
+
+    assert index.rows(path) == 3
+    inode = os.stat(index.index_path(path)).st_ino
+
+    write_month(path, [["2026-01-04", "2:00", "note4"]], mode= "a")
+
+    assert index.rows(path) == 4
+    assert os.stat(index.index_path(path)).st_ino == inode
+    assert executor.read_page(path, 3, 1)[1] == [["2026-01-04", "2:00", "note4"]]
+
+
+def test_file_edited_in_place_and_grown_is_indexed_again(tmp_path):
+
+    path = str(tmp_path / "Jan.csv")
+    write_month(path, ROWS)
+
+    executor = Executor()
+
+    assert executor.read_page(path, 0, 3)[1] == ROWS
+
+    # Same inode, first row one byte shorter, one row more: the file grew
+    edited = [["2026-01-1", "1:00", "note1"], *ROWS[1:], ["2026-01-04", "2:00", "note4"]]
+    write_month(path, edited)
+
+    assert executor.read_page(path, 0, 4)[1] == edited
+    assert executor.delete_row(path, 3) == ["2026-01-03", "0:10", "note3"]
+
+
+def test_grown_file_without_line_break_at_the_indexed_end(tmp_path):
+
+    path = str(tmp_path / "Jan.csv")
+    write_month(path, ROWS)
+
+    executor = Executor()
+    executor.read_page(path, 0, 3)
+
+    # The indexed part now ends inside a record
+    with open(path, "w") as f:
+        f.write("date,hours,note\n2026-01-01,1:00,note1 and a longer text\n2026-01-02,1:32,note2\n2026-01-03,0:10,note3\n")
+
+    assert [row[2] for row in executor.read_page(path, 0, 3)[1]] == ["note1 and a longer text", "note2", "note3"]
@@ -0,0 +1,64 @@
+"""
+Typed schema of a task: entries are checked against their column type, durations stored as H:MM.
+"""
+
+import os
+
+
+# Data rows of a month file
+def data_lines(path):
+
+    with open(path) as f:
+        return f.read().splitlines()[1:]
+
+
+def test_schema_is_written_with_the_header(run, gym, backend):
+
+    executor, _ = backend
+
+    assert executor.read_schema(os.path.dirname(gym)) == {"date": "date", "hours": "duration", "note": "string"}
+    assert executor.read_schema(gym) == executor.read_schema(os.path.dirname(gym))
+
+
+def test_typed_entries(run, gym):
+
+    place = ("--task", "gym", "--year", "2026", "--month", "Jan")
+
+    # Bare minutes are stored as H:MM
+    run("entry", "add", "2026-01-05", "90", "legs", *place)
+    run("entry", "add", "2026-01-06", "0:5", "arms", *place)
+
+    # A wrong type stores nothing
+    run("entry", "add", "2026-02-30", "1:00", "run", *place, status= 1)
+    run("entry", "add", "2026-01-07", "1h", "run", *place, status= 1)
+
+    assert data_lines(gym) == ["2026-01-05,1:30,legs", "2026-01-06,0:05,arms"]
+    assert "Total: 2 day(s), 1 hour(s), 35 minute(s)" in run("report", "--year", "2026")
+
+
+def test_types_must_match_the_header(run):
+
+    run("year", "add", "2026")
+    run("task", "add", "read", "--year", "2026")
+
+    run("month", "add", "Jan", "--task", "read", "--year", "2026",
+        "--header", "pages,time", "--types", "int", status= 1)
+    run("month", "add", "Jan", "--task", "read", "--year", "2026",
+        "--header", "pages,time", "--types", "int,minutes", status= 1)
+
+    assert not os.path.exists(os.path.join(run.base_dir, "2026", "read", "Jan.csv"))
+
+
+def test_task_without_types_has_no_schema(run, backend):
+
+    run("year", "add", "2026")
+    run("task", "add", "read", "--year", "2026")
+    run("month", "add", "Jan", "--task", "read", "--year", "2026", "--header", "pages,time")
+
+    # Types are detected per value, like the menu does
+    run("entry", "add", "120", "0:40", "--task", "read", "--year", "2026", "--month", "Jan")
+
+    executor, _ = backend
+
+    assert executor.read_schema(os.path.join(run.base_dir, "2026", "read")) is None
+    assert data_lines(os.path.join(run.base_dir, "2026", "read", "Jan.csv")) == ["120,0:40"]
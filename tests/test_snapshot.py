@@ -0,0 +1,80 @@
+"""
+Columnar snapshots: the same text as the CSV, rebuilt when the month or its log changes.
+"""
+
+import os
+import pytest
+import manager
+from manager import Executor
+
+
+# Month file written outside the executor
+def write_month(path, lines, mtime_ns:int = None):
+
+    with open(path, "w", newline= "") as f:
+        f.write("date,hours,count,note\n" + "".join(f"{line}\n" for line in lines))
+
+    if mtime_ns is not None:
+        os.utime(path, ns= (mtime_ns, mtime_ns))
+
+
+# Month file in a task directory (the snapshot lives next to it)
+@pytest.fixture
+def month(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(manager, "USE_SNAPSHOTS", True)
+
+    (tmp_path / "months.csv").write_text("months\nJan\n")
+    path = str(tmp_path / "Jan.csv")
+
+    write_month(path, ["2026-01-01,1:30,007,legs", "2026-01-02,0:05,12,", "2026-01-03,,-3,été"], 1_000_000_000)
+
+    return path
+
+
+# Rows read without any snapshot
+def plain_rows(executor, path):
+
+    return executor.read_month(path, use_snapshot= False).fillna("").values.tolist()
+
+
+def test_snapshot_shows_the_text_of_the_csv(month):
+
+    executor = Executor()
+    rows = executor.read_csv(month).fillna("").values.tolist()
+
+    assert executor.snapshots().read_meta(month) is not None
+    assert rows == plain_rows(executor, month)
+    assert rows[0] == ["2026-01-01", "1:30", "007", "legs"]
+
+    assert executor.snapshot_totals(month) == (3, 95)
+
+
+def test_changed_month_rebuilds_the_snapshot(month):
+
+    executor = Executor()
+    executor.read_csv(month)
+
+    # Appended by another program
+    with open(month, "a") as f:
+        f.write("2026-01-04,2:00,1,run\n")
+
+    assert executor.snapshots().read_meta(month) is None
+    assert executor.read_csv(month)["note"].fillna("").tolist() == ["legs", "", "été", "run"]
+
+    # Same size, other values: only the mtime tells the change
+    write_month(month, ["2026-01-01,1:30,007,arms", "2026-01-02,0:05,12,", "2026-01-03,,-3,été", "2026-01-04,2:00,1,run"], 2_000_000_000)
+
+    assert executor.read_csv(month)["note"].fillna("").tolist() == ["arms", "", "été", "run"]
+    assert executor.snapshot_totals(month) == (4, 215)
+
+
+def test_deleted_row_rebuilds_the_snapshot(month):
+
+    executor = Executor()
+    executor.read_csv(month)
+
+    executor.delete_row(month, 1)
+
+    assert executor.read_csv(month).fillna("").values.tolist() == plain_rows(executor, month)
+    assert executor.snapshot_totals(month) == (2, 5)
@@ -0,0 +1,65 @@
+"""
+Startup: the menu shows quickly and without pandas.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from conftest import SOURCE_DIR
+
+
+# Seconds allowed from the start of main.py to the first menu prompt
+STARTUP_BUDGET = 1.0
+
+# Runs main.py like `python main.py` and reports the state at the first prompt
+PROBE = """
+import builtins, json, runpy, sys, time
+
+start = time.perf_counter()
+
+def first_prompt(prompt= ""):
+    print(json.dumps({"seconds": time.perf_counter() - start, "pandas": "pandas" in sys.modules}), file= sys.stderr)
+    raise SystemExit(0)
+
+source, main = sys.argv[1:]
+
+builtins.input = first_prompt
+sys.argv = [main]
+sys.path.insert(0, source)
+runpy.run_path(main, run_name= "__main__")
+"""
+
+
+# Environment with the data tree in a temporary home
+def environment(home):
+
+    env = dict(os.environ, HOME= str(home))
+    env.pop("TASK_TRACKER_BACKEND", None)
+
+    return env
+
+
+def test_first_menu_without_pandas(tmp_path):
+
+    command = [sys.executable, "-c", PROBE, SOURCE_DIR, os.path.join(SOURCE_DIR, "main.py")]
+
+    result = subprocess.run(command, env= environment(tmp_path),
+                            capture_output= True, text= True, timeout= 60)
+
+    assert result.returncode == 0, result.stderr
+    assert "MAIN MENU" in result.stdout
+
+    state = json.loads(result.stderr.strip().splitlines()[-1])
+
+    assert not state["pandas"]
+    assert state["seconds"] < STARTUP_BUDGET, state
+
+
+def test_menu_exits(tmp_path):
+
+    result = subprocess.run([sys.executable, "main.py"], cwd= SOURCE_DIR, env= environment(tmp_path),
+                            input= "8\n", capture_output= True, text= True, timeout= 60)
+
+    assert result.returncode == 0, result.stderr
+    assert "MAIN MENU" in result.stdout
@@ -0,0 +1,73 @@
+"""
+Screen layer: escape codes on a terminal, plain text elsewhere, only changed lines redrawn.
+"""
+
+import io
+from terminal import Terminal, CLEAR_SCREEN, ERASE_LINE, MOVE_CURSOR
+
+
+# Output stream that claims to be a terminal
+class FakeTerminal(io.StringIO):
+
+    def isatty(self):
+        return True
+
+
+# Text written for a frame, the stream is emptied
+def take(stream):
+
+    text = stream.getvalue()
+
+    stream.seek(0)
+    stream.truncate()
+
+    return text
+
+
+def test_only_changed_lines_are_redrawn():
+
+    stream = FakeTerminal()
+    screen = Terminal(stream= stream)
+
+    screen.render(["title", "row 1", "row 2"])
+
+    first = take(stream)
+
+    assert first.startswith(CLEAR_SCREEN)
+    assert all(line in first for line in ("title", "row 1", "row 2"))
+
+    screen.render(["title", "row 1 changed", "row 2"])
+
+    second = take(stream)
+
+    assert CLEAR_SCREEN not in second
+    assert MOVE_CURSOR.format(row= 2) + ERASE_LINE + "row 1 changed" in second
+    assert "title" not in second and "row 2" not in second
+
+    # A cleared screen starts the next frame from scratch
+    screen.clear()
+
+    assert take(stream) == CLEAR_SCREEN
+
+    screen.render(["title"])
+
+    assert take(stream).startswith(CLEAR_SCREEN)
+
+
+def test_nothing_is_drawn_without_a_terminal(capsys):
+
+    stream = io.StringIO()
+    screen = Terminal(stream= stream)
+
+    screen.clear()
+    screen.render(["title", "row 1"])
+
+    assert stream.getvalue() == ""
+    assert capsys.readouterr().out == "title\nrow 1\n"
+
+
+def test_keys_are_read_by_line_without_a_terminal():
+
+    screen = Terminal(stream= io.StringIO(), input_stream= io.StringIO("n\n\nquit\n"))
+
+    assert [screen.getch() for _ in range(4)] == ["n", "\n", "q", "\n"]
@@ -0,0 +1,84 @@
+"""
+Row deletion: a line in the tombstone log, the month file is rewritten only by a compaction.
+"""
+
+import os
+import pytest
+import manager
+
+
+# Add entries to the gym month
+def add_entries(run, days):
+
+    for day in days:
+        run("entry", "add", f"2026-01-{day:02d}", "1:00", f"n{day}", "--task", "gym", "--year", "2026", "--month", "Jan")
+
+
+def test_delete_appends_to_the_log(run, gym, backend):
+
+    add_entries(run, range(1, 4))
+
+    with open(gym, "rb") as f:
+        content = f.read()
+
+    inode = os.stat(gym).st_ino
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "2")
+
+    # The month file is untouched, the log names the row
+    assert os.stat(gym).st_ino == inode
+
+    with open(gym, "rb") as f:
+        assert f.read() == content
+
+    with open(gym + ".tomb") as f:
+        assert f.read().split() == ["1"]
+
+    executor, _ = backend
+
+    assert executor.read_csv(gym)["note"].tolist() == ["n1", "n3"]
+    assert executor.reports().verify_year(os.path.join(run.base_dir, "2026")) == []
+
+
+def test_rows_appended_after_deletions(run, gym, backend, monkeypatch):
+
+    monkeypatch.setattr(manager, "COMPACT_THRESHOLD", 3)
+
+    add_entries(run, range(1, 5))
+
+    executor, _ = backend
+
+    executor.delete_row(gym, 1)
+    executor.delete_row(gym, 1)
+
+    add_entries(run, [5])
+
+    # Row numbers count the live rows only
+    assert executor.delete_row(gym, 3)[2] == "n5"
+    assert not os.path.exists(gym + ".tomb")
+
+    assert executor.read_csv(gym)["note"].tolist() == ["n3", "n4"]
+    assert executor.reports().verify_year(os.path.join(run.base_dir, "2026")) == []
+
+
+def test_delete_out_of_range(run, gym, backend):
+
+    add_entries(run, [1])
+
+    executor, _ = backend
+
+    with pytest.raises(IndexError, match= "out of range"):
+        executor.delete_row(gym, 2)
+
+    assert not os.path.exists(gym + ".tomb")
+
+
+def test_removed_month_takes_its_log(run, gym, backend):
+
+    add_entries(run, range(1, 3))
+
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan", "--row", "1")
+    run("delete", "--year", "2026", "--task", "gym", "--month", "Jan")
+
+    assert not os.path.exists(gym)
+    assert not os.path.exists(gym + ".tomb")
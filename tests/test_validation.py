@@ -0,0 +1,51 @@
+"""
+Entry validation: the vectorized checks of a batch import agree with the
+checks of a single entry.
+"""
+
+import pytest
+from manager import Executor
+
+
+# Entries of every type, valid and invalid
+SAMPLES = {
+    "int": ["12", "1 000", "3.5", "", "x1", "-4", "1:30"],
+    "duration": ["1:30", "45", "0:05", "", "1:", ":30", "1h", "2:00:00"],
+    "str": ["legs", "a b", "me@home", "", "ok!", "1,2", "été"],
+    "date": ["2026-01-05", "2026-1-5", "05/01/2026", "31.12.26", "5-1-26", "29/02/2024",
+             "", "2026-13-45", "2026-02-30", "2026-02-29", "31/02/2026", "1/13/2026", "2026/01/05"],
+}
+
+
+@pytest.mark.parametrize("entry_type", SAMPLES)
+def test_batch_matches_single_entries(entry_type, capsys):
+
+    executor = Executor()
+    values = SAMPLES[entry_type]
+
+    mask, _ = executor.validate_batch(values, entry_type)
+
+    assert list(mask) == [executor.validate_inputs(value, entry_type) for value in values]
+
+
+def test_impossible_dates_are_not_parsed():
+
+    mask, parsed = Executor().validate_batch(["2026-13-45", "31/02/2026", "2026-01-05", "13/1/2026"], "date")
+
+    assert list(mask) == [False, False, True, True]
+    assert parsed.isna().tolist() == [True, True, False, False]
+    assert parsed[3].strftime("%Y-%m-%d") == "2026-01-13"
+
+
+def test_import_rejects_impossible_dates(gym, tmp_path):
+
+    source = tmp_path / "in.csv"
+    source.write_text("date,hours,note\n2026-01-05,1:30,legs\n2026-13-45,0:30,arms\n2026-02-30,0:10,run\n")
+
+    result = Executor().import_entries(gym, str(source))
+
+    with open(gym) as f:
+        rows = f.read().splitlines()[1:]
+
+    assert rows == ["2026-01-05,1:30,legs"]
+    assert "2026-13-45" in (tmp_path / "in.rejects.csv").read_text()